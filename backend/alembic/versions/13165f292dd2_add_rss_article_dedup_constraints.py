@@ -0,0 +1,45 @@
+"""Add (feed_id, guid) and (feed_id, link) unique constraints to rss_articles
+
+Revision ID: 13165f292dd2
+Revises: b864dcc919fc
+Create Date: 2026-10-17 10:03:57.551904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '13165f292dd2'
+down_revision: Union[str, Sequence[str], None] = 'b864dcc919fc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Empty GUIDs were stored for entries without one; NULLs never conflict
+    op.execute("UPDATE rss_articles SET guid = NULL WHERE guid = ''")
+
+    # Drop duplicates left by the old check-then-insert path, keeping the oldest row
+    op.execute(
+        "DELETE FROM rss_articles WHERE guid IS NOT NULL AND id NOT IN "
+        "(SELECT MIN(id) FROM rss_articles WHERE guid IS NOT NULL GROUP BY feed_id, guid)"
+    )
+    op.execute(
+        "DELETE FROM rss_articles WHERE id NOT IN "
+        "(SELECT MIN(id) FROM rss_articles GROUP BY feed_id, link)"
+    )
+
+    # Batch mode so SQLite can add the constraints by recreating the table
+    with op.batch_alter_table('rss_articles') as batch_op:
+        batch_op.create_unique_constraint('uq_rss_articles_feed_guid', ['feed_id', 'guid'])
+        batch_op.create_unique_constraint('uq_rss_articles_feed_link', ['feed_id', 'link'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('rss_articles') as batch_op:
+        batch_op.drop_constraint('uq_rss_articles_feed_link', type_='unique')
+        batch_op.drop_constraint('uq_rss_articles_feed_guid', type_='unique')
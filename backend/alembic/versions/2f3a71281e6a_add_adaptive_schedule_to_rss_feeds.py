@@ -0,0 +1,33 @@
+"""Add adaptive fetch schedule (adaptive_interval, next_fetch_at) to rss_feeds
+
+Revision ID: 2f3a71281e6a
+Revises: 13165f292dd2
+Create Date: 2026-10-17 11:20:08.112734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2f3a71281e6a'
+down_revision: Union[str, Sequence[str], None] = '13165f292dd2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('rss_feeds', sa.Column('adaptive_interval', sa.Integer(), nullable=True))
+    # NULL means due now, so every feed is picked up once and then spread out
+    op.add_column('rss_feeds', sa.Column('next_fetch_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index(op.f('ix_rss_feeds_next_fetch_at'), 'rss_feeds', ['next_fetch_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_rss_feeds_next_fetch_at'), table_name='rss_feeds')
+    op.drop_column('rss_feeds', 'next_fetch_at')
+    op.drop_column('rss_feeds', 'adaptive_interval')
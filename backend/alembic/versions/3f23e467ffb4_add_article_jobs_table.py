@@ -0,0 +1,48 @@
+"""Add article_jobs table for the durable crawl/summarize queue
+
+Revision ID: 3f23e467ffb4
+Revises: 2f3a71281e6a
+Create Date: 2026-10-17 12:41:52.380516
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f23e467ffb4'
+down_revision: Union[str, Sequence[str], None] = '2f3a71281e6a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('article_jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=32), nullable=False),
+    sa.Column('article_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=16), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('run_after', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('locked_by', sa.String(length=255), nullable=True),
+    sa.Column('locked_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['article_id'], ['rss_articles.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('kind', 'article_id', name='uq_article_jobs_kind_article')
+    )
+    op.create_index(op.f('ix_article_jobs_id'), 'article_jobs', ['id'], unique=False)
+    op.create_index('ix_article_jobs_claim', 'article_jobs', ['kind', 'status', 'run_after'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_article_jobs_claim', table_name='article_jobs')
+    op.drop_index(op.f('ix_article_jobs_id'), table_name='article_jobs')
+    op.drop_table('article_jobs')
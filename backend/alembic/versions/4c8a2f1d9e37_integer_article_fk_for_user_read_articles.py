@@ -0,0 +1,121 @@
+"""Use an integer foreign key for user_read_articles.article_id
+
+Revision ID: 4c8a2f1d9e37
+Revises: 9b6e4f20d8a1
+Create Date: 2026-10-17 19:04:51.118320
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c8a2f1d9e37'
+down_revision: Union[str, Sequence[str], None] = '9b6e4f20d8a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+rss_articles = sa.table(
+    'rss_articles',
+    sa.column('id', sa.Integer),
+    sa.column('title', sa.String),
+    sa.column('link', sa.String),
+)
+user_read_articles = sa.table(
+    'user_read_articles',
+    sa.column('id', sa.Integer),
+    sa.column('user_id', sa.Integer),
+    sa.column('article_id', sa.String),
+    sa.column('article_ref', sa.Integer),
+    sa.column('article_title', sa.String),
+    sa.column('article_link', sa.String),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    op.add_column('user_read_articles', sa.Column('article_ref', sa.Integer(), nullable=True))
+
+    # Only reads of an existing article survive; clients used to send hashed ids
+    # for articles without a database id, and "01" and "1" now mean the same article
+    seen = set()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(user_read_articles.c.id, user_read_articles.c.user_id, user_read_articles.c.article_id)
+            .where(user_read_articles.c.id > last_id)
+            .order_by(user_read_articles.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+
+        candidates = {row_id: int(article_id) for row_id, _, article_id in rows if article_id.strip().isdigit()}
+        existing = set(
+            bind.execute(sa.select(rss_articles.c.id).where(rss_articles.c.id.in_(set(candidates.values())))).scalars()
+        )
+        updates = []
+        for row_id, user_id, _ in rows:
+            article_id = candidates.get(row_id)
+            if article_id in existing and (user_id, article_id) not in seen:
+                seen.add((user_id, article_id))
+                updates.append({'row_id': row_id, 'article_ref': article_id})
+        if updates:
+            bind.execute(
+                user_read_articles.update()
+                .where(user_read_articles.c.id == sa.bindparam('row_id'))
+                .values(article_ref=sa.bindparam('article_ref')),
+                updates,
+            )
+
+    op.execute(user_read_articles.delete().where(user_read_articles.c.article_ref.is_(None)))
+
+    with op.batch_alter_table('user_read_articles') as batch_op:
+        batch_op.drop_constraint('unique_user_article', type_='unique')
+        batch_op.drop_column('article_id')
+        batch_op.drop_column('article_title')
+        batch_op.drop_column('article_link')
+        batch_op.alter_column('article_ref', new_column_name='article_id', existing_type=sa.Integer(), nullable=False)
+
+    # Separate batch so SQLite's table copy sees the renamed column
+    with op.batch_alter_table('user_read_articles') as batch_op:
+        batch_op.create_foreign_key(
+            'user_read_articles_article_id_fkey', 'rss_articles', ['article_id'], ['id'], ondelete='CASCADE'
+        )
+        # Also serves the (user_id, article_id) lookups and the unread anti-join
+        batch_op.create_unique_constraint('unique_user_article', ['user_id', 'article_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('user_read_articles') as batch_op:
+        batch_op.drop_constraint('unique_user_article', type_='unique')
+        batch_op.drop_constraint('user_read_articles_article_id_fkey', type_='foreignkey')
+        batch_op.alter_column('article_id', new_column_name='article_ref', existing_type=sa.Integer(), nullable=True)
+
+    with op.batch_alter_table('user_read_articles') as batch_op:
+        batch_op.add_column(sa.Column('article_id', sa.String(length=255), nullable=True))
+        batch_op.add_column(sa.Column('article_title', sa.String(length=500), nullable=True))
+        batch_op.add_column(sa.Column('article_link', sa.String(length=1000), nullable=True))
+
+    article = rss_articles.c.id == user_read_articles.c.article_ref
+    op.execute(
+        user_read_articles.update().values(
+            article_id=sa.cast(user_read_articles.c.article_ref, sa.String(255)),
+            article_title=sa.select(rss_articles.c.title).where(article).scalar_subquery(),
+            article_link=sa.select(rss_articles.c.link).where(article).scalar_subquery(),
+        )
+    )
+
+    with op.batch_alter_table('user_read_articles') as batch_op:
+        batch_op.drop_column('article_ref')
+        batch_op.alter_column('article_id', existing_type=sa.String(length=255), nullable=False)
+        batch_op.alter_column('article_title', existing_type=sa.String(length=500), nullable=False)
+        batch_op.alter_column('article_link', existing_type=sa.String(length=1000), nullable=False)
+        batch_op.create_unique_constraint('unique_user_article', ['user_id', 'article_id'])
@@ -0,0 +1,46 @@
+"""Backfill rss_articles.published and add keyset pagination indexes
+
+Revision ID: 5a9e1c7d3b20
+Revises: 8d0b6c2f4e15
+Create Date: 2026-10-17 14:37:45.618290
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a9e1c7d3b20'
+down_revision: Union[str, Sequence[str], None] = '8d0b6c2f4e15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keyset pagination compares (published, id); NULLs would drop out of every page
+    op.execute("UPDATE rss_articles SET published = created_at WHERE published IS NULL")
+    with op.batch_alter_table('rss_articles') as batch_op:
+        batch_op.alter_column(
+            'published',
+            existing_type=sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        )
+    op.create_index('ix_rss_articles_published_id', 'rss_articles', ['published', 'id'], unique=False)
+    op.create_index('ix_rss_articles_feed_published_id', 'rss_articles', ['feed_id', 'published', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_rss_articles_feed_published_id', table_name='rss_articles')
+    op.drop_index('ix_rss_articles_published_id', table_name='rss_articles')
+    with op.batch_alter_table('rss_articles') as batch_op:
+        batch_op.alter_column(
+            'published',
+            existing_type=sa.DateTime(timezone=True),
+            nullable=True,
+            server_default=None,
+        )
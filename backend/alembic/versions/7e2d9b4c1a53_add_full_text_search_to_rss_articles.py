@@ -0,0 +1,97 @@
+"""Add full-text search index to rss_articles
+
+Revision ID: 7e2d9b4c1a53
+Revises: c41f0e9a7b62
+Create Date: 2026-10-17 16:04:41.518730
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e2d9b4c1a53'
+down_revision: Union[str, Sequence[str], None] = 'c41f0e9a7b62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_DDL = {
+    'postgresql': [
+        "ALTER TABLE rss_articles ADD COLUMN search_vector tsvector",
+        f"""
+        CREATE FUNCTION rss_articles_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('{settings.SEARCH_TEXT_CONFIG}', coalesce(NEW.title, '')), 'A') ||
+                setweight(to_tsvector('{settings.SEARCH_TEXT_CONFIG}', coalesce(NEW.description, '')), 'B') ||
+                setweight(to_tsvector('{settings.SEARCH_TEXT_CONFIG}', left(coalesce(NEW.crawled_content, ''), {settings.SEARCH_MAX_DOCUMENT_CHARS})), 'C');
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        """
+        CREATE TRIGGER rss_articles_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF title, description, crawled_content ON rss_articles
+        FOR EACH ROW EXECUTE FUNCTION rss_articles_search_vector_update()
+        """,
+        "CREATE INDEX ix_rss_articles_search_vector ON rss_articles USING gin (search_vector)",
+    ],
+    'sqlite': [
+        """
+        CREATE VIRTUAL TABLE rss_articles_fts USING fts5(
+            title, description, crawled_content,
+            content='rss_articles', content_rowid='id', tokenize='porter unicode61'
+        )
+        """,
+        """
+        CREATE TRIGGER rss_articles_fts_insert AFTER INSERT ON rss_articles BEGIN
+            INSERT INTO rss_articles_fts(rowid, title, description, crawled_content)
+            VALUES (new.id, new.title, new.description, new.crawled_content);
+        END
+        """,
+        """
+        CREATE TRIGGER rss_articles_fts_delete AFTER DELETE ON rss_articles BEGIN
+            INSERT INTO rss_articles_fts(rss_articles_fts, rowid, title, description, crawled_content)
+            VALUES ('delete', old.id, old.title, old.description, old.crawled_content);
+        END
+        """,
+        """
+        CREATE TRIGGER rss_articles_fts_update AFTER UPDATE OF title, description, crawled_content ON rss_articles BEGIN
+            INSERT INTO rss_articles_fts(rss_articles_fts, rowid, title, description, crawled_content)
+            VALUES ('delete', old.id, old.title, old.description, old.crawled_content);
+            INSERT INTO rss_articles_fts(rowid, title, description, crawled_content)
+            VALUES (new.id, new.title, new.description, new.crawled_content);
+        END
+        """,
+    ],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    for statement in SEARCH_DDL.get(dialect, []):
+        op.execute(statement)
+    # Index the existing articles
+    if dialect == 'postgresql':
+        op.execute("UPDATE rss_articles SET title = title")
+    elif dialect == 'sqlite':
+        op.execute("INSERT INTO rss_articles_fts(rss_articles_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.drop_index('ix_rss_articles_search_vector', table_name='rss_articles')
+        op.execute("DROP TRIGGER IF EXISTS rss_articles_search_vector_trigger ON rss_articles")
+        op.execute("DROP FUNCTION IF EXISTS rss_articles_search_vector_update()")
+        op.drop_column('rss_articles', 'search_vector')
+    elif dialect == 'sqlite':
+        for trigger in ('rss_articles_fts_insert', 'rss_articles_fts_delete', 'rss_articles_fts_update'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS rss_articles_fts")
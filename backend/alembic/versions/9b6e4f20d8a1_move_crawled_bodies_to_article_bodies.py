@@ -0,0 +1,228 @@
+"""Move crawled article bodies into a compressed article_bodies table
+
+Revision ID: 9b6e4f20d8a1
+Revises: 7e2d9b4c1a53
+Create Date: 2026-10-17 17:22:16.304958
+
+"""
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b6e4f20d8a1'
+down_revision: Union[str, Sequence[str], None] = '7e2d9b4c1a53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+rss_articles = sa.table(
+    'rss_articles',
+    sa.column('id', sa.Integer),
+    sa.column('crawled_content', sa.Text),
+    sa.column('crawled_html', sa.Text),
+)
+article_bodies = sa.table(
+    'article_bodies',
+    sa.column('article_id', sa.Integer),
+    sa.column('content', sa.LargeBinary),
+    sa.column('html', sa.LargeBinary),
+)
+
+# The PostgreSQL trigger now only indexes title and description and keeps the
+# weight-C (body) lexemes, which the application writes when it stores a body
+POSTGRESQL_SEARCH_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION rss_articles_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('{settings.SEARCH_TEXT_CONFIG}', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('{settings.SEARCH_TEXT_CONFIG}', coalesce(NEW.description, '')), 'B');
+    IF TG_OP = 'UPDATE' THEN
+        -- Keep the indexed body
+        NEW.search_vector := NEW.search_vector || ts_filter(coalesce(OLD.search_vector, ''), '{{c}}');
+    END IF;
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+"""
+
+# SQLite cannot index compressed bodies through an external-content table, so
+# the FTS5 table keeps its own copy of the indexed text
+SQLITE_SEARCH_DDL = [
+    "CREATE VIRTUAL TABLE rss_articles_fts USING fts5(title, description, body, tokenize='porter unicode61')",
+    """
+    CREATE TRIGGER rss_articles_fts_insert AFTER INSERT ON rss_articles BEGIN
+        INSERT INTO rss_articles_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER rss_articles_fts_delete AFTER DELETE ON rss_articles BEGIN
+        DELETE FROM rss_articles_fts WHERE rowid = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER rss_articles_fts_update AFTER UPDATE OF title, description ON rss_articles BEGIN
+        UPDATE rss_articles_fts SET title = new.title, description = new.description WHERE rowid = new.id;
+    END
+    """,
+]
+SQLITE_SEARCH_TRIGGERS = ('rss_articles_fts_insert', 'rss_articles_fts_delete', 'rss_articles_fts_update')
+
+
+def _compress(text):
+    return zlib.compress(text.encode('utf-8')) if text is not None else None
+
+
+def _decompress(data):
+    return zlib.decompress(data).decode('utf-8') if data is not None else None
+
+
+def _batches(bind, query, key):
+    """Yield rows of ``query`` in primary-key order, BATCH_SIZE at a time."""
+    last_id = 0
+    while True:
+        rows = bind.execute(query.where(key > last_id).order_by(key).limit(BATCH_SIZE)).all()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    dialect = bind.dialect.name
+
+    op.create_table('article_bodies',
+    sa.Column('article_id', sa.Integer(), nullable=False),
+    sa.Column('content', sa.LargeBinary(), nullable=False),
+    sa.Column('html', sa.LargeBinary(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['article_id'], ['rss_articles.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('article_id')
+    )
+
+    # Compress existing bodies; crawled_html was a copy of crawled_content for Jina crawls
+    query = sa.select(rss_articles.c.id, rss_articles.c.crawled_content, rss_articles.c.crawled_html).where(
+        rss_articles.c.crawled_content.isnot(None)
+    )
+    for rows in _batches(bind, query, rss_articles.c.id):
+        bind.execute(
+            article_bodies.insert(),
+            [
+                {
+                    'article_id': article_id,
+                    'content': _compress(content),
+                    'html': _compress(html) if html and html != content else None,
+                }
+                for article_id, content, html in rows
+            ],
+        )
+
+    # search_vector already holds the body lexemes with weight C, so it needs no rebuild
+    if dialect == 'postgresql':
+        op.execute("DROP TRIGGER rss_articles_search_vector_trigger ON rss_articles")
+        op.execute(POSTGRESQL_SEARCH_FUNCTION)
+        op.execute(
+            "CREATE TRIGGER rss_articles_search_vector_trigger "
+            "BEFORE INSERT OR UPDATE OF title, description ON rss_articles "
+            "FOR EACH ROW EXECUTE FUNCTION rss_articles_search_vector_update()"
+        )
+    elif dialect == 'sqlite':
+        for trigger in SQLITE_SEARCH_TRIGGERS:
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS rss_articles_fts")
+
+    # Plain ALTER TABLE (SQLite 3.35+): a batch copy would lose the expression and partial indexes
+    op.drop_column('rss_articles', 'crawled_html')
+    op.drop_column('rss_articles', 'crawled_content')
+
+    if dialect == 'sqlite':
+        for statement in SQLITE_SEARCH_DDL:
+            op.execute(statement)
+        op.execute("INSERT INTO rss_articles_fts(rowid, title, description) SELECT id, title, description FROM rss_articles")
+        query = sa.select(article_bodies.c.article_id, article_bodies.c.content)
+        for rows in _batches(bind, query, article_bodies.c.article_id):
+            bind.execute(
+                sa.text("UPDATE rss_articles_fts SET body = :body WHERE rowid = :article_id"),
+                [{'article_id': article_id, 'body': _decompress(content)} for article_id, content in rows],
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    dialect = bind.dialect.name
+
+    if dialect == 'sqlite':
+        for trigger in SQLITE_SEARCH_TRIGGERS:
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS rss_articles_fts")
+
+    op.add_column('rss_articles', sa.Column('crawled_content', sa.Text(), nullable=True))
+    op.add_column('rss_articles', sa.Column('crawled_html', sa.Text(), nullable=True))
+
+    query = sa.select(article_bodies.c.article_id, article_bodies.c.content, article_bodies.c.html)
+    for rows in _batches(bind, query, article_bodies.c.article_id):
+        for article_id, content, html in rows:
+            content = _decompress(content)
+            bind.execute(
+                rss_articles.update()
+                .where(rss_articles.c.id == article_id)
+                .values(crawled_content=content, crawled_html=_decompress(html) or content)
+            )
+    op.drop_table('article_bodies')
+
+    if dialect == 'postgresql':
+        op.execute("DROP TRIGGER rss_articles_search_vector_trigger ON rss_articles")
+        op.execute(
+            f"""
+            CREATE OR REPLACE FUNCTION rss_articles_search_vector_update() RETURNS trigger AS $$
+            BEGIN
+                NEW.search_vector :=
+                    setweight(to_tsvector('{settings.SEARCH_TEXT_CONFIG}', coalesce(NEW.title, '')), 'A') ||
+                    setweight(to_tsvector('{settings.SEARCH_TEXT_CONFIG}', coalesce(NEW.description, '')), 'B') ||
+                    setweight(to_tsvector('{settings.SEARCH_TEXT_CONFIG}',
+                        left(coalesce(NEW.crawled_content, ''), {settings.SEARCH_MAX_DOCUMENT_CHARS})), 'C');
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+            """
+        )
+        op.execute(
+            "CREATE TRIGGER rss_articles_search_vector_trigger "
+            "BEFORE INSERT OR UPDATE OF title, description, crawled_content ON rss_articles "
+            "FOR EACH ROW EXECUTE FUNCTION rss_articles_search_vector_update()"
+        )
+    elif dialect == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE rss_articles_fts USING fts5("
+            "title, description, crawled_content, "
+            "content='rss_articles', content_rowid='id', tokenize='porter unicode61')"
+        )
+        op.execute(
+            "CREATE TRIGGER rss_articles_fts_insert AFTER INSERT ON rss_articles BEGIN "
+            "INSERT INTO rss_articles_fts(rowid, title, description, crawled_content) "
+            "VALUES (new.id, new.title, new.description, new.crawled_content); END"
+        )
+        op.execute(
+            "CREATE TRIGGER rss_articles_fts_delete AFTER DELETE ON rss_articles BEGIN "
+            "INSERT INTO rss_articles_fts(rss_articles_fts, rowid, title, description, crawled_content) "
+            "VALUES ('delete', old.id, old.title, old.description, old.crawled_content); END"
+        )
+        op.execute(
+            "CREATE TRIGGER rss_articles_fts_update AFTER UPDATE OF title, description, crawled_content "
+            "ON rss_articles BEGIN "
+            "INSERT INTO rss_articles_fts(rss_articles_fts, rowid, title, description, crawled_content) "
+            "VALUES ('delete', old.id, old.title, old.description, old.crawled_content); "
+            "INSERT INTO rss_articles_fts(rowid, title, description, crawled_content) "
+            "VALUES (new.id, new.title, new.description, new.crawled_content); END"
+        )
+        op.execute("INSERT INTO rss_articles_fts(rss_articles_fts) VALUES ('rebuild')")
@@ -0,0 +1,30 @@
+"""Add HTTP validators (etag, last_modified) to rss_feeds
+
+Revision ID: b864dcc919fc
+Revises: add_user_read_articles, add_year_field_vision
+Create Date: 2026-10-17 09:12:31.408126
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b864dcc919fc'
+down_revision: Union[str, Sequence[str], None] = ('add_user_read_articles', 'add_year_field_vision')
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('rss_feeds', sa.Column('etag', sa.String(length=255), nullable=True))
+    op.add_column('rss_feeds', sa.Column('last_modified', sa.String(length=100), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('rss_feeds', 'last_modified')
+    op.drop_column('rss_feeds', 'etag')
@@ -0,0 +1,45 @@
+"""Add category and uncrawled indexes to rss_articles
+
+Revision ID: c41f0e9a7b62
+Revises: 5a9e1c7d3b20
+Create Date: 2026-10-17 15:12:03.907455
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41f0e9a7b62'
+down_revision: Union[str, Sequence[str], None] = '5a9e1c7d3b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # (feed_id, guid) and (feed_id, link) lookups use the unique constraints' indexes,
+    # and (published, id) / (feed_id, published, id) already exist for listings
+    op.create_index(
+        'ix_rss_articles_category_published_id',
+        'rss_articles',
+        [sa.text('lower(category)'), 'published', 'id'],
+        unique=False,
+    )
+    # Partial index where supported: only the crawl backlog is indexed
+    op.create_index(
+        'ix_rss_articles_uncrawled_created_at',
+        'rss_articles',
+        ['created_at'],
+        unique=False,
+        postgresql_where=sa.text('is_crawled = false'),
+        sqlite_where=sa.text('is_crawled = 0'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_rss_articles_uncrawled_created_at', table_name='rss_articles')
+    op.drop_index('ix_rss_articles_category_published_id', table_name='rss_articles')
@@ -9,6 +9,7 @@ from ..models.user import User
 from ..db.crud_user import user
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 
 async def get_current_user(
@@ -53,6 +54,26 @@ async def get_current_user(
     return current_user
 
 
+async def get_current_user_optional(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    db: AsyncSession = Depends(get_db),
+) -> Optional[User]:
+    """
+    Get the current user if a valid JWT token was sent, otherwise None.
+    """
+    if not credentials:
+        return None
+
+    payload = verify_token(credentials.credentials)
+    if not payload or not payload.get("sub"):
+        return None
+
+    current_user = await user.get(db, id=int(payload["sub"]))
+    if not current_user or not current_user.is_active:
+        return None
+    return current_user
+
+
 def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
     """
     Get the current active user.
@@ -1,18 +1,28 @@
-from fastapi import APIRouter, Query, HTTPException, Depends, BackgroundTasks
+from fastapi import APIRouter, Query, Header, HTTPException, Depends, BackgroundTasks, Response
+from fastapi.responses import StreamingResponse
 from typing import List, Dict, Optional
 from pydantic import BaseModel, HttpUrl
 from datetime import datetime
-import asyncio
+import csv
+import html
+import io
+import json
 import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from ....db.session import get_db
+from ....db.session import get_db, async_session_factory
 from ....models.user_read_articles import UserReadArticle
 from ....models.user import User
-from ....api.deps import get_current_user
-from ....db.crud_rss import rss_feed, rss_article, cron_job, RssFeedCreate, RssFeedUpdate, CronJobCreate, CronJobUpdate
-from ....services.rss_service import rss_service
+from ....api.deps import get_current_user, get_current_user_optional
+from ....db.crud_rss import rss_feed, rss_article, article_body, cron_job, article_job, RssFeedCreate, RssFeedUpdate, CronJobCreate, CronJobUpdate
+from ....db.crud_rss import encode_cursor, decode_cursor, SEARCH_HIGHLIGHT_START, SEARCH_HIGHLIGHT_STOP
+from ....services.rss_service import rss_service, CRAWL_JOB
+from ....services.article_stream import article_stream
+from ....services.job_queue import job_queue
+from ....core.responses import FastJSONResponse
+from ....core.route_cache import cached, invalidate_tags, ARTICLES_TAG, FEEDS_TAG
 from ....services.scheduler_service import scheduler_service
+from ....services.feed_scheduler import feed_scheduler
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -47,19 +57,6 @@ async def fetch_content_with_jina_reader(background_tasks: BackgroundTasks, requ
     return {"message": "Fetching content in background"}
 
 
-# Optional authentication dependency
-async def get_current_user_optional(db: AsyncSession = Depends(get_db)) -> Optional[User]:
-    """Optional authentication - returns None if not authenticated"""
-    try:
-        from fastapi.security import HTTPBearer
-        from fastapi import Request
-
-        # This is a simplified optional auth - in production you'd want more robust handling
-        return None  # For now, always return None to make it work without auth
-    except:
-        return None
-
-
 # Pydantic models for API
 class RssFeedResponse(BaseModel):
     id: int
@@ -68,6 +65,8 @@ class RssFeedResponse(BaseModel):
     category: str
     active: bool
     fetch_interval: int
+    adaptive_interval: Optional[int] = None
+    next_fetch_at: Optional[datetime] = None
     last_fetched: Optional[datetime] = None
     last_error: Optional[str] = None
     error_count: int
@@ -93,6 +92,12 @@ class RssArticleResponse(BaseModel):
         from_attributes = True
 
 
+class RssSearchResult(RssArticleResponse):
+    rank: float
+    title_highlight: str  # HTML-escaped title with matches wrapped in <mark>
+    snippet: str  # HTML-escaped excerpt with matches wrapped in <mark>
+
+
 class CronJobResponse(BaseModel):
     id: int
     name: str
@@ -110,6 +115,21 @@ class CronJobResponse(BaseModel):
         from_attributes = True
 
 
+class ArticleJobResponse(BaseModel):
+    id: int
+    kind: str
+    article_id: int
+    status: str
+    attempts: int
+    run_after: datetime
+    last_error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class RssFeedCreateRequest(BaseModel):
     name: str
     url: HttpUrl
@@ -128,6 +148,7 @@ class RssFeedUpdateRequest(BaseModel):
 
 # RSS Feed Management Endpoints
 @router.get("/feeds", response_model=List[RssFeedResponse])
+@cached("rss:feeds", FEEDS_TAG, model=List[RssFeedResponse])
 async def get_rss_feeds(db: AsyncSession = Depends(get_db)):
     """Get all RSS feeds"""
     feeds = await rss_feed.get_multi(db)
@@ -154,10 +175,12 @@ async def create_rss_feed(
     )
 
     new_feed = await rss_feed.create(db, obj_in=feed_create)
+    await invalidate_tags(FEEDS_TAG)
 
     # Trigger immediate fetch in background if feed is active
     if new_feed.active:
         background_tasks.add_task(rss_service.fetch_and_store_feed, new_feed)
+    await feed_scheduler.wake()
 
     return new_feed
 
@@ -179,8 +202,15 @@ async def update_rss_feed(feed_id: int, feed_data: RssFeedUpdateRequest, db: Asy
     update_data = feed_data.model_dump(exclude_unset=True)
     if feed_data.url:
         update_data["url"] = str(feed_data.url)
+    if "fetch_interval" in update_data:
+        # Restart adaptation from the new base interval
+        update_data["adaptive_interval"] = None
+        update_data["next_fetch_at"] = None
 
     updated_feed = await rss_feed.update(db, db_obj=existing_feed, obj_in=update_data)
+    # Listings fall back to the feed's category
+    await invalidate_tags(FEEDS_TAG, ARTICLES_TAG)
+    await feed_scheduler.wake()
     return updated_feed
 
 
@@ -192,6 +222,8 @@ async def delete_rss_feed(feed_id: int, db: AsyncSession = Depends(get_db)):
         raise HTTPException(status_code=404, detail="RSS feed not found")
 
     await rss_feed.remove(db, id=feed_id)
+    await invalidate_tags(FEEDS_TAG, ARTICLES_TAG)
+    await feed_scheduler.wake()
     return {"message": "RSS feed deleted successfully"}
 
 
@@ -210,54 +242,159 @@ async def fetch_rss_feed_immediately(
     return {"message": f"Fetch triggered for {existing_feed.name}"}
 
 
+# Article listings page by OFFSET (skip) or, cheaper at any depth, by the opaque
+# cursor returned in the X-Next-Cursor header of the previous page.
+def _parse_cursor(cursor: Optional[str]):
+    if not cursor:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _set_next_cursor(response: Response, articles, limit: int):
+    if articles and len(articles) == limit:
+        last = articles[-1]
+        if isinstance(last, dict):
+            response.headers["X-Next-Cursor"] = encode_cursor(last["published"], last["id"])
+        else:
+            response.headers["X-Next-Cursor"] = encode_cursor(last.published, last.id)
+
+
+# The listings below select only the response columns and return plain rows,
+# rendered by orjson without model validation; response_model documents them
+
+
 # RSS Content Endpoints
 @router.get("/feeds/{feed_id}/articles", response_model=List[RssArticleResponse])
-async def get_rss_feed_articles(feed_id: int, skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)):
+@cached("rss:feed-articles", (ARTICLES_TAG, FEEDS_TAG), response_class=FastJSONResponse)
+async def get_rss_feed_articles(
+    feed_id: int,
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+):
     """Get articles from a specific RSS feed"""
     existing_feed = await rss_feed.get(db, feed_id)
     if not existing_feed:
         raise HTTPException(status_code=404, detail="RSS feed not found")
 
-    articles = await rss_article.get_by_feed(db, feed_id, skip=skip, limit=limit)
+    articles = await rss_article.get_listing_rows(db, feed_id=feed_id, skip=skip, limit=limit, after=_parse_cursor(cursor))
+    _set_next_cursor(response, articles, limit)
     return articles
 
 
 @router.get("/articles", response_model=List[RssArticleResponse])
-async def get_all_rss_articles(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)):
+@cached("rss:articles", ARTICLES_TAG, response_class=FastJSONResponse)
+async def get_all_rss_articles(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+):
     """Get recent articles from all feeds"""
-    articles = await rss_article.get_recent_articles(db, skip=skip, limit=limit)
+    articles = await rss_article.get_listing_rows(db, skip=skip, limit=limit, after=_parse_cursor(cursor))
+    _set_next_cursor(response, articles, limit)
     return articles
 
 
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def _export_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+async def _export_chunks(format: str, **filters):
+    """Encode exported rows one cursor batch at a time."""
+    columns = rss_article.EXPORT_COLUMNS
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if format == "csv":
+        writer.writerow(columns)
+
+    # Own session: the stream outlives the request handler
+    async with async_session_factory() as db:
+        async for rows in rss_article.stream_export(db, **filters):
+            if format == "csv":
+                writer.writerows([_export_value(value) for value in row] for row in rows)
+            else:
+                for row in rows:
+                    buffer.write(json.dumps(dict(zip(columns, map(_export_value, row)))))
+                    buffer.write("\n")
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+@router.get("/articles/export")
+async def export_rss_articles(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    feed_id: Optional[int] = None,
+    category: Optional[str] = None,
+    published_from: Optional[datetime] = None,
+    published_to: Optional[datetime] = Query(None, description="Exclusive upper bound"),
+):
+    """
+    Export articles as NDJSON (one JSON object per line) or CSV.
+
+    Rows are streamed from a server-side cursor in id order, so exports of any
+    size use constant memory. Filters match those of the article listings.
+    """
+    return StreamingResponse(
+        _export_chunks(
+            format,
+            feed_id=feed_id,
+            category=category,
+            published_from=published_from,
+            published_to=published_to,
+        ),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="articles.{format}"'},
+    )
+
+
 # Legacy endpoint for backward compatibility with pagination
 @router.get("/items")
+# Pages filtered by the caller's read state are not shared
+@cached("rss:items", (ARTICLES_TAG, FEEDS_TAG), condition=lambda params: not (params["exclude_read"] and params["current_user"]))
 async def get_all_rss_items(
+    response: Response,
     skip: int = 0,
     limit: int = 10,
+    cursor: Optional[str] = None,
     category: str = None,
     search: str = None,
     exclude_read: bool = False,
+    current_user: Optional[User] = Depends(get_current_user_optional),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get items from all RSS feeds (legacy format) with pagination and filtering"""
-    articles = await rss_article.get_recent_articles(db, skip=skip, limit=limit)
-
-    # Apply category filter if specified
-    if category and category.lower() != "all":
-        articles = [
-            a
-            for a in articles
-            if (a.category and a.category.lower() == category.lower())
-            or (hasattr(a, "feed") and a.feed and a.feed.category and a.feed.category.lower() == category.lower())
-        ]
-
-    # Apply search filter if specified
-    if search:
-        articles = [
-            a
-            for a in articles
-            if search.lower() in a.title.lower() or (a.description and search.lower() in a.description.lower())
-        ]
+    """
+    Get items from all RSS feeds (legacy format) with pagination and filtering.
+
+    Filters are applied in SQL before paging. OFFSET pages return the total
+    number of matches in the X-Total-Count header; cursor pages skip the
+    count. ``exclude_read`` needs a bearer token.
+    """
+    articles, total = await rss_article.query_articles(
+        db,
+        skip=skip,
+        limit=limit,
+        category=category,
+        search=search,
+        exclude_read_by=current_user.id if exclude_read and current_user else None,
+        after=_parse_cursor(cursor),
+    )
+    if total is not None:
+        response.headers["X-Total-Count"] = str(total)
+    _set_next_cursor(response, articles, limit)
 
     # Convert to legacy format
     items = []
@@ -270,13 +407,70 @@ async def get_all_rss_items(
                 "content": article.content or "",
                 "description": article.description or "",
                 "published": article.published.isoformat() if article.published else "",
-                "category": article.category or (article.feed.category if hasattr(article, "feed") else ""),
+                "category": article.category or (article.feed.category if article.feed else ""),
             }
         )
 
     return items
 
 
+def _highlight_html(text: Optional[str]) -> str:
+    """Escape a search highlight and mark the matched terms."""
+    return (
+        html.escape(text or "")
+        .replace(SEARCH_HIGHLIGHT_START, "<mark>")
+        .replace(SEARCH_HIGHLIGHT_STOP, "</mark>")
+    )
+
+
+@router.get("/search", response_model=List[RssSearchResult])
+async def search_rss_articles(
+    q: str = Query(..., min_length=1, max_length=200, description="Search terms"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    category: Optional[str] = None,
+    feed_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Full-text search over article titles, descriptions and crawled content,
+    best match first, with highlighted titles and snippets.
+    """
+    rows = await rss_article.search(db, q, skip=skip, limit=limit, category=category, feed_id=feed_id)
+    return [
+        RssSearchResult(
+            **RssArticleResponse.model_validate(article).model_dump(),
+            rank=rank,
+            title_highlight=_highlight_html(title_highlight),
+            snippet=_highlight_html(snippet),
+        )
+        for article, rank, title_highlight, snippet in rows
+    ]
+
+
+@router.get("/stream")
+async def stream_new_articles(
+    last_event_id: Optional[str] = Query(None, description="Resume after this event id"),
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID"),
+):
+    """
+    Server-Sent Events stream of newly ingested articles.
+
+    Each ``article`` event carries an article summary; event ids follow
+    publish order. Reconnecting clients send Last-Event-ID (EventSource does
+    this itself) or ``last_event_id`` and are first sent the articles they
+    missed, oldest first. A ``reset`` event means too much was missed to
+    replay: reload the article list, then keep reading.
+    """
+    resume_from = last_event_id_header if last_event_id_header is not None else last_event_id
+    return StreamingResponse(
+        article_stream.events(resume_from),
+        media_type="text/event-stream",
+        # Stop proxies from caching or buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # Cron Job Management Endpoints
 @router.get("/cron-jobs", response_model=List[CronJobResponse])
 async def get_cron_jobs(db: AsyncSession = Depends(get_db)):
@@ -339,37 +533,31 @@ async def get_scheduler_status():
 
 # Content Crawling Endpoints
 @router.post("/articles/{article_id}/crawl")
-async def crawl_article_content(article_id: int, background_tasks: BackgroundTasks, db: AsyncSession = Depends(get_db)):
-    """Crawl full content for a specific article using Jina Reader"""
+async def crawl_article_content(article_id: int, db: AsyncSession = Depends(get_db)):
+    """Queue full-content crawling for a specific article using Jina Reader"""
     # Check if article exists
     article = await rss_article.get(db, article_id)
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
 
-    # Trigger crawling in background using Jina Reader
-    async def crawl_task():
-        success = await rss_service.crawl_article_with_jina(article_id)
-        if success:
-            logger.info(f"Successfully crawled article {article_id} with Jina Reader")
-        else:
-            logger.error(f"Failed to crawl article {article_id} with Jina Reader")
+    # An explicit request also revives a crawl that was dead-lettered
+    queued = await job_queue.enqueue(CRAWL_JOB, [article_id], requeue_dead=True)
 
-    background_tasks.add_task(crawl_task)
-
-    return {"message": f"Content crawling with Jina Reader initiated for article {article_id}"}
+    return {"message": f"Content crawling with Jina Reader queued for article {article_id}", "queued": bool(queued)}
 
 
 @router.get("/articles/{article_id}/content")
+@cached("rss:article-content", "article:{article_id}")
 async def get_article_content(article_id: int, db: AsyncSession = Depends(get_db)):
     """Get full article content (crawled if available)"""
     article = await rss_article.get_crawled_article_by_id(db, article_id)
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
 
-    # If not crawled yet, trigger crawling and return basic content
+    # If not crawled yet, queue crawling and return basic content
     if not article.is_crawled:
-        # Trigger Jina Reader crawling in background
-        asyncio.create_task(rss_service.crawl_article_with_jina(article_id))
+        # No-op if the article already has a crawl job
+        await job_queue.enqueue(CRAWL_JOB, [article_id])
 
         # Return basic content for now
         return {
@@ -381,11 +569,12 @@ async def get_article_content(article_id: int, db: AsyncSession = Depends(get_db
         }
 
     # Return crawled content
+    content, html_content = await article_body.get_body(db, article_id) or (None, None)
     return {
         "id": article.id,
         "title": article.crawled_title or article.title,
-        "content": article.crawled_content or article.content,
-        "html_content": article.crawled_html,
+        "content": content or article.content,
+        "html_content": html_content,
         "is_crawled": True,
         "original_link": article.link,
         "source": article.feed.name if article.feed else None,
@@ -393,8 +582,8 @@ async def get_article_content(article_id: int, db: AsyncSession = Depends(get_db
 
 
 @router.post("/crawl/batch")
-async def crawl_batch_articles(background_tasks: BackgroundTasks, limit: int = 10, db: AsyncSession = Depends(get_db)):
-    """Crawl content for multiple uncrawled articles using Jina Reader"""
+async def crawl_batch_articles(limit: int = 10, db: AsyncSession = Depends(get_db)):
+    """Queue content crawling for multiple uncrawled articles using Jina Reader"""
     # Get uncrawled articles
     uncrawled_articles = await rss_article.get_uncrawled_articles(db, limit=limit)
 
@@ -403,23 +592,38 @@ async def crawl_batch_articles(background_tasks: BackgroundTasks, limit: int = 1
 
     article_ids = [article.id for article in uncrawled_articles]
 
-    # Trigger batch crawling in background using Jina Reader
-    async def batch_crawl_task():
-        results = []
-        for article_id in article_ids:
-            try:
-                success = await rss_service.crawl_article_with_jina(article_id)
-                results.append({"article_id": article_id, "success": success})
-                # Add a small delay between requests to avoid overwhelming the API
-                await asyncio.sleep(1)
-            except Exception as e:
-                logger.error(f"Error crawling article {article_id}: {e}")
-                results.append({"article_id": article_id, "success": False, "error": str(e)})
-        return results
-
-    background_tasks.add_task(batch_crawl_task)
-
-    return {"message": f"Batch crawling with Jina Reader initiated for {len(article_ids)} articles", "article_ids": article_ids}
+    # Articles that already have a crawl job are skipped
+    queued = await job_queue.enqueue(CRAWL_JOB, article_ids)
+
+    return {
+        "message": f"Batch crawling with Jina Reader queued for {queued} articles",
+        "article_ids": article_ids,
+        "queued": queued,
+    }
+
+
+# Background job queue endpoints
+@router.get("/jobs/stats")
+async def get_job_queue_stats():
+    """Get crawl/summarize queue depth and throughput"""
+    return await job_queue.get_stats()
+
+
+@router.get("/jobs/dead", response_model=List[ArticleJobResponse])
+async def get_dead_jobs(
+    kind: Optional[str] = Query(None, description="Filter by job kind (extract, crawl, summarize)"),
+    limit: int = Query(100, le=1000),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get dead-lettered jobs"""
+    return await article_job.get_dead(db, kind=kind, limit=limit)
+
+
+@router.post("/jobs/dead/retry")
+async def retry_dead_jobs(kind: Optional[str] = Query(None), db: AsyncSession = Depends(get_db)):
+    """Put dead-lettered jobs back on the queue"""
+    requeued = await article_job.requeue_dead(db, kind=kind)
+    return {"message": f"Requeued {requeued} dead jobs", "requeued": requeued}
 
 
 # Validate RSS URL endpoint
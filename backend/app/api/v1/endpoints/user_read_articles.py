@@ -1,12 +1,18 @@
-from typing import List
+from typing import Dict, List
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
 
+from ....db.crud_rss import user_read_article
 from ....db.session import get_db
 from ....models.user_read_articles import UserReadArticle
-from ....schemas.user_read_articles import UserReadArticleCreate, UserReadArticleResponse
+from ....schemas.user_read_articles import (
+    MarkReadBatchRequest,
+    ReadFlagsRequest,
+    UserReadArticleCreate,
+    UserReadArticleResponse,
+)
+from ....services.read_state import read_state
 from ...deps import get_current_user
 from ....models.user import User
 
@@ -21,50 +27,67 @@ async def mark_article_as_read(
 ):
     """Mark an article as read by the current user."""
     try:
-        # Check if already marked as read
+        # No-op if already marked as read
+        new_ids = await user_read_article.mark_read(db, current_user.id, article_ids=[article_data.article_id])
         result = await db.execute(
             select(UserReadArticle).where(
                 UserReadArticle.user_id == current_user.id, UserReadArticle.article_id == article_data.article_id
             )
         )
-        existing = result.scalar_one_or_none()
-
-        if existing:
-            return existing
-
-        # Create new read record
-        read_article = UserReadArticle(
-            user_id=current_user.id,
-            article_id=article_data.article_id,
-            article_title=article_data.article_title,
-            article_link=article_data.article_link,
-        )
+        read_article = result.scalar_one_or_none()
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to mark article as read: {str(e)}")
 
-        db.add(read_article)
-        await db.commit()
-        await db.refresh(read_article)
+    if not read_article:
+        raise HTTPException(status_code=404, detail="Article not found")
+    if new_ids:
+        await read_state.mark(current_user.id, *new_ids)
+    return read_article
 
-        return read_article
 
-    except IntegrityError:
-        await db.rollback()
-        raise HTTPException(status_code=400, detail="Article already marked as read")
+@router.post("/mark-read/batch")
+async def mark_articles_as_read(
+    request: MarkReadBatchRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Mark many articles as read at once: a list of ids, or every article of a feed or category."""
+    try:
+        new_ids = await user_read_article.mark_read(
+            db, current_user.id, article_ids=request.article_ids, feed_id=request.feed_id, category=request.category
+        )
     except Exception as e:
         await db.rollback()
-        raise HTTPException(status_code=500, detail=f"Failed to mark article as read: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to mark articles as read: {str(e)}")
+
+    await read_state.mark(current_user.id, *new_ids)
+    return {"marked": len(new_ids)}
 
 
-@router.get("/read-articles", response_model=List[str])
+@router.get("/read-articles", response_model=List[int])
 async def get_read_articles(current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
-    """Get list of article IDs that the current user has read."""
+    """
+    Get list of article IDs that the current user has read.
+
+    This is the user's whole history; to flag a page of articles use /read-flags.
+    """
     result = await db.execute(select(UserReadArticle.article_id).where(UserReadArticle.user_id == current_user.id))
     read_article_ids = [row[0] for row in result.fetchall()]
     return read_article_ids
 
 
+@router.post("/read-flags", response_model=Dict[int, bool])
+async def get_read_flags(
+    request: ReadFlagsRequest, current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)
+):
+    """Get whether the current user has read each of a page of articles."""
+    return await read_state.flags(db, current_user.id, request.article_ids)
+
+
 @router.delete("/unmark-read/{article_id}")
 async def unmark_article_as_read(
-    article_id: str, current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)
+    article_id: int, current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)
 ):
     """Unmark an article as read (for testing purposes)."""
     result = await db.execute(
@@ -79,5 +102,6 @@ async def unmark_article_as_read(
 
     await db.delete(read_article)
     await db.commit()
+    await read_state.unmark(current_user.id, article_id)
 
     return {"message": "Article unmarked as read"}
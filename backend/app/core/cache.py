@@ -1,21 +1,133 @@
+import asyncio
+import fnmatch
 import json
-from typing import Any, Optional, Union, Dict, List
+import math
+import random
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, Union, Dict, List, Sequence, Tuple
 import redis.asyncio as redis
 from .config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
+LOCK_PREFIX = "lock:"
+TAG_PREFIX = "tag:"
+
+# Delete the lock only if we still own it
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Store a value and register it in its tag sets, which live as long as their longest-lived member
+SET_TAGGED_SCRIPT = """
+redis.call("set", KEYS[1], ARGV[1], "EX", ARGV[2])
+for i = 2, #KEYS do
+    redis.call("sadd", KEYS[i], KEYS[1])
+    if redis.call("ttl", KEYS[i]) < tonumber(ARGV[2]) then
+        redis.call("expire", KEYS[i], ARGV[2])
+    end
+end
+return 1
+"""
+
+
+def _encode(value: Any) -> Any:
+    if not isinstance(value, (str, int, float, bool, type(None))):
+        return json.dumps(value)
+    return value
+
+
+def _decode(value: str) -> Any:
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        return value
+
+
+class LocalCache:
+    """
+    Bounded in-process LRU with per-entry TTL, used as the L1 tier in front of Redis.
+
+    Values are stored decoded and shared between callers, so treat them as read-only.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        """Get a live entry, or _MISSING."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        ttl = min(ttl, self.ttl) if ttl else self.ttl
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, *keys: str):
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear_pattern(self, pattern: str):
+        """Drop keys matching a Redis-style glob pattern."""
+        for key in [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]:
+            del self._entries[key]
+
+    def clear(self):
+        self._entries.clear()
+
+
 class Cache:
+    """
+    Redis-backed cache with an optional in-process L1 tier (CACHE_L1_ENABLED).
+
+    L1 hits skip both the network round trip and JSON decoding. Every write,
+    delete and pattern clear is published on CACHE_INVALIDATION_CHANNEL so the
+    other workers evict their L1 copies; CACHE_L1_TTL bounds how stale an entry
+    can get if a message is lost, and L1 is flushed whenever the subscription
+    has to be re-established.
+    """
+
     _instance = None
     _client: Optional[redis.Redis] = None
     _is_initialized = False
+    _local: Optional[LocalCache] = None
+    _listener: Optional[asyncio.Task] = None
+    _instance_id: Optional[str] = None
+    _flights: Dict[str, asyncio.Future] = {}
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(Cache, cls).__new__(cls)
         return cls._instance
 
+    @property
+    def client(self) -> Optional[redis.Redis]:
+        """The raw Redis client, or None when the cache is unavailable."""
+        return self._client if self._is_initialized else None
+
     async def init(self):
         """Initialize the Redis client."""
         if not self._is_initialized:
@@ -29,6 +141,11 @@ class Cache:
                 # Test the connection
                 await self._client.ping()
                 self._is_initialized = True
+                if settings.CACHE_L1_ENABLED:
+                    # Per process, so preforked workers still hear each other
+                    self._instance_id = uuid.uuid4().hex
+                    self._local = LocalCache(settings.CACHE_L1_MAX_SIZE, settings.CACHE_L1_TTL)
+                    self._listener = asyncio.create_task(self._listen(), name="cache-invalidation")
                 logger.info("Redis cache initialized successfully")
             except Exception as e:
                 logger.error(f"Failed to initialize Redis cache: {e}")
@@ -37,23 +154,38 @@ class Cache:
 
     async def close(self):
         """Close the Redis connection."""
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        self._local = None
         if self._client:
             await self._client.close()
             self._is_initialized = False
             logger.info("Redis cache connection closed")
 
     async def get(self, key: str) -> Optional[Any]:
-        """Get a value from the cache."""
+        """Get a value from the cache, from the local tier when it has it."""
         if not self._is_initialized or not self._client:
             return None
-        
+
+        if self._local is not None:
+            value = self._local.get(key)
+            if value is not _MISSING:
+                return value
+
         try:
-            value = await self._client.get(key)
+            if self._local is None:
+                value = await self._client.get(key)
+            else:
+                # Same round trip: the local copy must not outlive the Redis key
+                async with self._client.pipeline(transaction=False) as pipe:
+                    value, ttl_ms = await pipe.get(key).pttl(key).execute()
             if value is not None:
-                try:
-                    return json.loads(value)
-                except json.JSONDecodeError:
-                    return value
+                value = _decode(value)
+                if self._local is not None:
+                    self._local.set(key, value, ttl_ms / 1000 if ttl_ms > 0 else None)
+                return value
         except Exception as e:
             logger.error(f"Error getting key {key} from cache: {e}")
         return None
@@ -62,26 +194,111 @@ class Cache:
         self, 
         key: str, 
         value: Any, 
-        expire: Optional[int] = None
+        expire: Optional[int] = None,
+        tags: Sequence[str] = (),
     ) -> bool:
-        """Set a value in the cache with optional expiration."""
+        """
+        Set a value in the cache with optional expiration.
+
+        ``tags`` register the key for ``invalidate_tags``.
+        """
         if not self._is_initialized or not self._client:
             return False
         
         try:
-            if not isinstance(value, (str, int, float, bool, type(None))):
-                value = json.dumps(value)
+            value = _encode(value)
             
             expire = expire or settings.REDIS_CACHE_TTL
-            return await self._client.set(
-                key, 
-                value, 
-                ex=expire
-            )
+            if tags:
+                tag_keys = [TAG_PREFIX + tag for tag in tags]
+                stored = bool(await self._client.eval(SET_TAGGED_SCRIPT, 1 + len(tag_keys), key, *tag_keys, value, expire))
+            else:
+                stored = await self._client.set(
+                    key, 
+                    value, 
+                    ex=expire
+                )
         except Exception as e:
             logger.error(f"Error setting key {key} in cache: {e}")
             return False
 
+        if self._local is not None:
+            # Other workers may hold the previous value
+            self._local.delete(key)
+            await self._publish_invalidation(keys=[key])
+        return stored
+
+    async def get_many(self, keys: Sequence[str]) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Get several values in one round trip.
+
+        Returns ``(hits, misses)``: the values found, by key, and the keys that
+        were not cached, in request order. Keys held by the local tier are not
+        sent to Redis at all.
+        """
+        keys = list(dict.fromkeys(keys))
+        if not self._is_initialized or not self._client:
+            return {}, keys
+
+        hits: Dict[str, Any] = {}
+        remote = keys
+        if self._local is not None:
+            remote = []
+            for key in keys:
+                value = self._local.get(key)
+                if value is _MISSING:
+                    remote.append(key)
+                else:
+                    hits[key] = value
+
+        if remote:
+            try:
+                if self._local is None:
+                    values = await self._client.mget(remote)
+                    ttls = [None] * len(remote)
+                else:
+                    async with self._client.pipeline(transaction=False) as pipe:
+                        pipe.mget(remote)
+                        for key in remote:
+                            pipe.pttl(key)
+                        values, *ttls = await pipe.execute()
+                for key, value, ttl_ms in zip(remote, values, ttls):
+                    if value is None:
+                        continue
+                    hits[key] = _decode(value)
+                    if self._local is not None:
+                        self._local.set(key, hits[key], ttl_ms / 1000 if ttl_ms > 0 else None)
+            except Exception as e:
+                logger.error(f"Error getting {len(remote)} keys from cache: {e}")
+
+        return hits, [key for key in keys if key not in hits]
+
+    async def set_many(self, values: Dict[str, Any], expire: Union[int, Dict[str, int], None] = None) -> int:
+        """
+        Set several values in one pipelined round trip.
+
+        ``expire`` is one TTL for every key, or a TTL per key (keys without one
+        get REDIS_CACHE_TTL). Returns the number of keys stored.
+        """
+        if not self._is_initialized or not self._client or not values:
+            return 0
+
+        ttls = expire if isinstance(expire, dict) else {}
+        default_ttl = expire if isinstance(expire, int) else settings.REDIS_CACHE_TTL
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key, value in values.items():
+                    pipe.set(key, _encode(value), ex=ttls.get(key) or default_ttl)
+                results = await pipe.execute()
+        except Exception as e:
+            logger.error(f"Error setting {len(values)} keys in cache: {e}")
+            return 0
+
+        if self._local is not None:
+            self._local.delete(*values)
+            await self._publish_invalidation(keys=list(values))
+        return sum(bool(result) for result in results)
+
     async def delete(self, *keys: str) -> int:
         """Delete one or more keys from the cache."""
         if not self._is_initialized or not self._client or not keys:
@@ -92,21 +309,162 @@ class Cache:
         except Exception as e:
             logger.error(f"Error deleting keys {keys} from cache: {e}")
             return 0
+        finally:
+            # Only once Redis no longer has the value, or a miss could reload it
+            if self._local is not None:
+                self._local.delete(*keys)
+                await self._publish_invalidation(keys=list(keys))
 
     async def clear_pattern(self, pattern: str) -> int:
-        """Delete all keys matching a pattern."""
+        """
+        Delete all keys matching a pattern.
+
+        Walks the keyspace with SCAN and frees keys with UNLINK, a batch at a
+        time, so Redis keeps serving other clients in between. Prefer tags and
+        ``invalidate_tags`` for groups of keys that are cleared routinely.
+        """
         if not self._is_initialized or not self._client:
             return 0
         
+        removed = 0
         try:
-            keys = await self._client.keys(pattern)
-            if keys:
-                return await self._client.delete(*keys)
-            return 0
+            cursor = 0
+            while True:
+                cursor, keys = await self._client.scan(cursor, match=pattern, count=settings.CACHE_SCAN_COUNT)
+                if keys:
+                    removed += await self._client.unlink(*keys)
+                if not cursor:
+                    return removed
         except Exception as e:
             logger.error(f"Error clearing cache with pattern {pattern}: {e}")
+            return removed
+        finally:
+            # After the walk, including a failed one, so L1 cannot refill from keys not yet unlinked
+            if self._local is not None:
+                self._local.clear_pattern(pattern)
+                await self._publish_invalidation(pattern=pattern)
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """
+        Delete every key stored with one of ``tags``.
+
+        Costs O(keys in those tags) rather than O(keyspace). The tag sets are
+        read and dropped in one transaction, so keys tagged meanwhile start a
+        fresh set instead of being lost.
+        """
+        if not self._is_initialized or not self._client or not tags:
             return 0
 
+        tag_keys = [TAG_PREFIX + tag for tag in tags]
+        removed = 0
+        try:
+            async with self._client.pipeline(transaction=True) as pipe:
+                for tag_key in tag_keys:
+                    pipe.smembers(tag_key)
+                pipe.unlink(*tag_keys)
+                *members, _ = await pipe.execute()
+            keys = sorted(set().union(*members))
+            for start in range(0, len(keys), settings.CACHE_SCAN_COUNT):
+                removed += await self._client.unlink(*keys[start:start + settings.CACHE_SCAN_COUNT])
+        except Exception as e:
+            logger.error(f"Error invalidating cache tags {tags}: {e}")
+            return removed
+
+        if self._local is not None and keys:
+            self._local.delete(*keys)
+            await self._publish_invalidation(keys=keys)
+        return removed
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        expire: Optional[int] = None,
+        tags: Sequence[str] = (),
+        beta: float = settings.CACHE_EARLY_REFRESH_BETA,
+    ) -> Any:
+        """
+        Get a value, calling ``loader`` to compute and cache it when needed.
+
+        Concurrent misses in this process share one ``loader`` call, and a Redis
+        lock lets only one process recompute a key while the others wait for its
+        result. Entries remember how long they took to compute and are refreshed
+        early with a probability that rises as expiry approaches (XFetch), so a
+        hot key is usually recomputed by one caller before it ever expires.
+        Values are stored in an envelope; read them back with this method only.
+        ``tags`` are passed on to ``set``.
+        """
+        expire = expire or settings.REDIS_CACHE_TTL
+        entry = await self.get(key)
+        stale = _MISSING
+        if isinstance(entry, dict) and "expires_at" in entry:
+            # XFetch: -log(U) is exponential, so expensive values refresh earlier
+            early = entry["delta"] * beta * -math.log(1.0 - random.random())
+            if time.time() + early < entry["expires_at"]:
+                return entry["value"]
+            stale = entry["value"]
+
+        flight = self._flights.get(key)
+        if flight is not None:
+            # Someone in this process is already refreshing the key
+            return stale if stale is not _MISSING else await asyncio.shield(flight)
+
+        flight = asyncio.ensure_future(self._load(key, loader, expire, tags, stale))
+        self._flights[key] = flight
+
+        def landed(done: asyncio.Future):
+            del self._flights[key]
+            if not done.cancelled():
+                done.exception()  # retrieved here in case every waiter was cancelled
+
+        flight.add_done_callback(landed)
+        return await asyncio.shield(flight)
+
+    async def _load(
+        self, key: str, loader: Callable[[], Awaitable[Any]], expire: int, tags: Sequence[str], stale: Any
+    ) -> Any:
+        token = uuid.uuid4().hex
+        locked = await self._acquire_lock(key, token)
+        if not locked:
+            if stale is not _MISSING:
+                return stale
+            # Another process is computing it: wait for its result, then give up and compute it too
+            deadline = time.monotonic() + settings.CACHE_LOCK_WAIT
+            while time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+                entry = await self.get(key)
+                if isinstance(entry, dict) and "expires_at" in entry:
+                    return entry["value"]
+        try:
+            started = time.monotonic()
+            value = await loader()
+            delta = time.monotonic() - started
+            await self.set(key, {"value": value, "delta": delta, "expires_at": time.time() + expire}, expire, tags)
+            return value
+        finally:
+            if locked:
+                await self._release_lock(key, token)
+
+    async def _acquire_lock(self, key: str, token: str) -> bool:
+        """Take the cross-process recompute lock for ``key``; True without Redis."""
+        if not self._is_initialized or not self._client:
+            return True
+        try:
+            return bool(
+                await self._client.set(LOCK_PREFIX + key, token, nx=True, px=settings.CACHE_LOCK_TIMEOUT * 1000)
+            )
+        except Exception as e:
+            logger.error(f"Error locking key {key} in cache: {e}")
+            return True
+
+    async def _release_lock(self, key: str, token: str):
+        if not self._is_initialized or not self._client:
+            return
+        try:
+            await self._client.eval(RELEASE_LOCK_SCRIPT, 1, LOCK_PREFIX + key, token)
+        except Exception as e:
+            logger.error(f"Error unlocking key {key} in cache: {e}")
+
     async def get_or_set(
         self, 
         key: str, 
@@ -120,5 +478,47 @@ class Cache:
             return default_value
         return value
 
+    async def _publish_invalidation(self, keys: Optional[List[str]] = None, pattern: Optional[str] = None):
+        message = json.dumps({"origin": self._instance_id, "keys": keys or [], "pattern": pattern})
+        try:
+            await self._client.publish(settings.CACHE_INVALIDATION_CHANNEL, message)
+        except Exception as e:
+            logger.error(f"Error publishing cache invalidation: {e}")
+
+    def _handle_invalidation(self, data: str):
+        """Apply an invalidation published by another worker to the local tier."""
+        if self._local is None:
+            return
+        try:
+            message = json.loads(data)
+        except (TypeError, json.JSONDecodeError):
+            logger.warning(f"Ignoring malformed cache invalidation: {data!r}")
+            return
+        if message.get("origin") == self._instance_id:
+            return
+        self._local.delete(*message.get("keys", []))
+        if message.get("pattern"):
+            self._local.clear_pattern(message["pattern"])
+
+    async def _listen(self):
+        """Follow the invalidation channel for as long as the cache is open."""
+        while True:
+            pubsub = self._client.pubsub()
+            try:
+                await pubsub.subscribe(settings.CACHE_INVALIDATION_CHANNEL)
+                # Invalidations published while unsubscribed were missed
+                self._local.clear()
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self._handle_invalidation(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation subscription lost: {e}, resubscribing")
+                self._local.clear()
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
 # Global cache instance
 cache = Cache()
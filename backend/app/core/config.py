@@ -21,6 +21,16 @@ class Settings(BaseSettings):
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
     REDIS_CACHE_TTL: int = 300  # 5 minutes
+    # In-process L1 tier in front of Redis, kept coherent across workers over pub/sub
+    CACHE_L1_ENABLED: bool = True
+    CACHE_L1_MAX_SIZE: int = 10000  # entries per worker, least recently used evicted first
+    CACHE_L1_TTL: int = 30  # seconds, bounds staleness if an invalidation message is lost
+    CACHE_INVALIDATION_CHANNEL: str = "cache:invalidate"
+    # Cache.get_or_load stampede protection
+    CACHE_LOCK_TIMEOUT: int = 30  # seconds a recompute lock is held at most
+    CACHE_LOCK_WAIT: float = 5.0  # seconds to wait for another process's recompute before doing it too
+    CACHE_EARLY_REFRESH_BETA: float = 1.0  # XFetch beta, higher refreshes earlier
+    CACHE_SCAN_COUNT: int = 500  # keys per SCAN step and per UNLINK batch
     
     # Security
     SECRET_KEY: str
@@ -36,6 +46,73 @@ class Settings(BaseSettings):
     
     # Email settings for password reset
     EMAIL_RESET_TOKEN_EXPIRE_HOURS: int = 24
+
+    # RSS ingestion
+    RSS_FETCH_CONCURRENCY: int = 50  # max in-flight feed/article requests per worker
+    RSS_FETCH_PER_HOST_CONCURRENCY: int = 4  # max in-flight requests to a single host
+    RSS_FETCH_TIMEOUT: float = 30.0  # seconds
+    RSS_FETCH_MAX_RETRIES: int = 3
+
+    # Adaptive per-feed scheduling
+    RSS_ADAPTIVE_SCHEDULING: bool = True
+    RSS_MIN_FETCH_INTERVAL: int = 300  # seconds, fastest a feed is ever polled
+    RSS_MAX_FETCH_INTERVAL: int = 86400  # seconds, slowest a dormant feed is polled
+    RSS_SCHEDULER_RELOAD_INTERVAL: int = 60  # seconds between schedule reloads from the database
+    RSS_SCHEDULER_WAKE_CHANNEL: str = "feeds:schedule"  # feed changes on any worker wake the leader's scheduler
+
+    # Durable extract/crawl/summarize job queue
+    JOB_EXTRACT_CONCURRENCY: int = 8  # workers fetching full article pages
+    JOB_CRAWL_CONCURRENCY: int = 4  # Jina Reader workers per process
+    JOB_SUMMARIZE_CONCURRENCY: int = 2  # OpenRouter workers per process
+    JOB_MAX_ATTEMPTS: int = 5  # attempts before a job is dead-lettered
+    JOB_RETRY_BASE_DELAY: int = 30  # seconds, doubled on every failed attempt
+    JOB_RETRY_MAX_DELAY: int = 3600  # seconds
+    JOB_POLL_INTERVAL: float = 2.0  # seconds between polls when the queue is empty
+    JOB_LOCK_TIMEOUT: int = 600  # seconds before a running job is considered abandoned
+
+    # Outbound API rate limits, shared by all workers through Redis (per process without it)
+    JINA_REQUESTS_PER_MINUTE: float = 200
+    JINA_REQUEST_BURST: int = 10
+    OPENROUTER_REQUESTS_PER_MINUTE: float = 20
+    OPENROUTER_REQUEST_BURST: int = 2
+    OUTBOUND_RETRY_MAX_DELAY: float = 30.0  # seconds, cap on the wait before retrying a 5xx
+
+    # Shared outbound HTTP clients (Jina Reader, OpenRouter)
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 100
+    HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_CLIENT_KEEPALIVE_EXPIRY: float = 30.0  # seconds an idle connection is kept open
+    HTTP_CLIENT_HTTP2: bool = True  # used when the h2 package is installed
+    HTTP_CLIENT_DRAIN_TIMEOUT: float = 10.0  # seconds shutdown waits for in-flight requests
+
+    # Summary cache (Redis tier in front of the summary_cache table)
+    SUMMARY_CACHE_ENABLED: bool = True
+    SUMMARY_CACHE_TTL: int = 604800  # seconds a summary stays in Redis, 7 days
+
+    # Response cache for read-heavy routes, invalidated by tag when the data changes
+    ROUTE_CACHE_ENABLED: bool = True
+    ROUTE_CACHE_TTL: int = 300  # seconds, upper bound on staleness if an invalidation is missed
+
+    # Per-user read-state sets in Redis, built from user_read_articles on first use
+    READ_STATE_TTL: int = 604800  # seconds an idle user's set is kept, 7 days
+
+    # Server-Sent Events stream of newly ingested articles (/rss/stream)
+    ARTICLE_STREAM_KEY: str = "articles:stream"  # Redis stream of published articles, in publish order
+    ARTICLE_STREAM_MAXLEN: int = 10000  # events kept for resuming clients (approximate with Redis)
+    ARTICLE_STREAM_QUEUE_SIZE: int = 100  # events buffered per client before a slow client is disconnected
+    ARTICLE_STREAM_REPLAY_LIMIT: int = 200  # missed events replayed on resume; more and the client is told to reload
+    ARTICLE_STREAM_HEARTBEAT: float = 15.0  # seconds between keepalive comments
+
+    # Bulk article export (/rss/articles/export)
+    EXPORT_BATCH_SIZE: int = 1000  # rows fetched from the server-side cursor and written per chunk
+
+    # Article full-text search
+    SEARCH_TEXT_CONFIG: str = "english"  # PostgreSQL text search configuration, e.g. "simple" for mixed languages
+    SEARCH_MAX_DOCUMENT_CHARS: int = 100000  # crawled body text beyond this is not indexed
+
+    # Scheduler leader election (only the leader runs scheduled fetches)
+    LEADER_ELECTION_BACKEND: str = "auto"  # auto | redis | postgres | local
+    LEADER_LOCK_TTL: int = 30  # seconds before a silent leader loses the lock
+    LEADER_HEARTBEAT_INTERVAL: int = 10  # seconds
     
     # AWS S3
     AWS_ACCESS_KEY_ID: str
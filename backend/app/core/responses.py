@@ -0,0 +1,26 @@
+"""
+Fast JSON rendering for hot listing endpoints.
+
+Endpoints that return ``FastJSONResponse`` hand FastAPI a finished response,
+so it skips response-model validation and ``jsonable_encoder`` and the body
+is rendered by orjson. Use it only for trusted, plain data (dicts, lists,
+datetimes) such as rows selected straight from the database.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+# "Z" for UTC, as pydantic renders aware datetimes
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def to_jsonable(content: Any) -> Any:
+    """Plain JSON types for ``content``, e.g. datetimes as ISO 8601 strings."""
+    return orjson.loads(orjson.dumps(content, option=ORJSON_OPTIONS))
+
+
+class FastJSONResponse(ORJSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
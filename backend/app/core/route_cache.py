@@ -0,0 +1,130 @@
+"""
+Response caching for read-heavy API routes.
+
+``@cached`` stores an endpoint's JSON body, and the headers it set, in the Redis
+cache under a key built from the route's normalized parameters. Every entry
+carries the tags of the data it was built from; writers call
+``invalidate_tags`` after changing that data, so cached pages stay valid until
+the next ingest or edit instead of for a fixed time.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+from typing import Any, Callable, Dict, Optional, Sequence, Type, Union
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from .cache import cache
+from .config import settings
+from .responses import to_jsonable
+
+logger = logging.getLogger(__name__)
+
+ROUTE_CACHE_PREFIX = "route:"
+
+# Tags shared by the RSS routes and the code that writes their data
+ARTICLES_TAG = "articles"
+FEEDS_TAG = "feeds"
+
+
+def article_tag(article_id: int) -> str:
+    return f"article:{article_id}"
+
+
+def normalize_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep the plain query/path values of an endpoint call, dropping unset ones."""
+    return {
+        name: value
+        for name, value in sorted(params.items())
+        if value is not None and isinstance(value, (str, int, float, bool))
+    }
+
+
+def route_cache_key(namespace: str, params: Dict[str, Any]) -> str:
+    digest = hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()
+    return f"{ROUTE_CACHE_PREFIX}{namespace}:{digest}"
+
+
+def cached(
+    namespace: str,
+    tags: Union[str, Sequence[str]],
+    expire: Optional[int] = None,
+    model: Any = None,
+    condition: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    response_class: Optional[Type[Response]] = None,
+):
+    """
+    Cache an async endpoint's response.
+
+    ``tags`` is one tag or several, and may reference the endpoint's parameters,
+    e.g. ``"article:{article_id}"``; invalidating any of them drops the entry.
+    ``model`` is the response model used to serialize ORM results for storage;
+    without it the result goes through ``jsonable_encoder``. Calls for which
+    ``condition(params)`` is false, such as per-user pages, bypass the cache.
+
+    With ``response_class`` (e.g. ``FastJSONResponse``) the endpoint returns
+    trusted plain data, which is stored without validation and sent back in
+    that response class, cached or not, so FastAPI skips its own validation
+    and encoding too.
+    """
+
+    if isinstance(tags, str):
+        tags = (tags,)
+
+    def respond(body: Any, response: Optional[Response]) -> Response:
+        # A returned response replaces the injected one, so carry its headers over
+        return response_class(body, headers=dict(response.headers) if response is not None else None)
+
+    def decorator(endpoint):
+        adapter = TypeAdapter(model) if model is not None else None
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            response = next((value for value in kwargs.values() if isinstance(value, Response)), None)
+            if not settings.ROUTE_CACHE_ENABLED or (condition is not None and not condition(kwargs)):
+                result = await endpoint(*args, **kwargs)
+                return respond(result, response) if response_class is not None else result
+
+            params = normalize_params(kwargs)
+            key = route_cache_key(namespace, params)
+
+            loaded = False
+
+            async def load():
+                nonlocal loaded
+                loaded = True
+                result = await endpoint(*args, **kwargs)
+                if response_class is not None:
+                    body = to_jsonable(result)
+                elif adapter is not None:
+                    body = adapter.dump_python(adapter.validate_python(result, from_attributes=True), mode="json")
+                else:
+                    body = jsonable_encoder(result)
+                return {"body": body, "headers": dict(response.headers) if response is not None else {}}
+
+            # Concurrent misses for the same page run the endpoint once
+            entry = await cache.get_or_load(
+                key, load, expire or settings.ROUTE_CACHE_TTL, tags=[tag.format(**params) for tag in tags]
+            )
+            if response is not None:
+                response.headers.update(entry["headers"])
+                response.headers["X-Cache"] = "MISS" if loaded else "HIT"
+            if response_class is not None:
+                return respond(entry["body"], response)
+            return entry["body"]
+
+        return wrapper
+
+    return decorator
+
+
+async def invalidate_tags(*tags: str) -> int:
+    """Drop every cached response carrying one of ``tags``."""
+    removed = await cache.invalidate_tags(*tags)
+    if removed:
+        logger.debug(f"Invalidated {removed} cached responses for tags {', '.join(tags)}")
+    return removed
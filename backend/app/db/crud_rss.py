@@ -1,10 +1,17 @@
-from datetime import datetime
-from typing import List, Optional
-from sqlalchemy import select, and_, or_, desc
+import base64
+import json
+import zlib
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import select, update, func, and_, or_, desc, exists, cast, tuple_, literal, literal_column, table, column, text, true, Float
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
-from ..models.rss import RssFeed, RssArticle, CronJob
+from ..models.rss import RssFeed, RssArticle, ArticleBody, CronJob, ArticleJob, SummaryCache
+from ..models.user_read_articles import UserReadArticle
+from ..schemas.user_read_articles import UserReadArticleCreate
 from ..db.base import CRUDBase
+from ..core.config import settings
 from pydantic import BaseModel
 
 class RssFeedCreate(BaseModel):
@@ -20,9 +27,13 @@ class RssFeedUpdate(BaseModel):
     category: Optional[str] = None
     active: Optional[bool] = None
     fetch_interval: Optional[int] = None
+    adaptive_interval: Optional[int] = None
+    next_fetch_at: Optional[datetime] = None
     last_fetched: Optional[datetime] = None
     last_error: Optional[str] = None
     error_count: Optional[int] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
 class RssArticleCreate(BaseModel):
     feed_id: int
@@ -44,11 +55,14 @@ class RssArticleUpdate(BaseModel):
     guid: Optional[str] = None
     author: Optional[str] = None
     category: Optional[str] = None
-    crawled_content: Optional[str] = None
-    crawled_html: Optional[str] = None
     crawled_title: Optional[str] = None
     is_crawled: Optional[bool] = None
 
+class ArticleBodyCreate(BaseModel):
+    article_id: int
+    content: bytes
+    html: Optional[bytes] = None
+
 class CronJobCreate(BaseModel):
     name: str
     schedule: str
@@ -64,6 +78,79 @@ class CronJobUpdate(BaseModel):
     error_count: Optional[int] = None
     last_error: Optional[str] = None
 
+class ArticleJobCreate(BaseModel):
+    kind: str
+    article_id: int
+
+class ArticleJobUpdate(BaseModel):
+    status: Optional[str] = None
+    attempts: Optional[int] = None
+    run_after: Optional[datetime] = None
+    last_error: Optional[str] = None
+
+class SummaryCacheCreate(BaseModel):
+    content_hash: str
+    model: str
+    summary: str
+
+def encode_cursor(published: datetime, article_id: int) -> str:
+    """Opaque keyset cursor for the article after which the next page starts."""
+    payload = json.dumps([published.isoformat(), article_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor from ``encode_cursor``; raises ValueError if it is malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        published, article_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(published), int(article_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+# Markers around matched terms in search highlights; private-use characters so
+# callers can escape the text and then turn them into markup
+SEARCH_HIGHLIGHT_START = "\ue000"
+SEARCH_HIGHLIGHT_STOP = "\ue001"
+
+
+def fts5_query(text: str) -> str:
+    """Turn free text into an FTS5 query matching every word, with no operators."""
+    words = text.replace('"', " ").split()
+    return " ".join(f'"{word}"' for word in words)
+
+
+def compress_body(body: str) -> bytes:
+    """Compress a crawled body for storage in article_bodies."""
+    return zlib.compress(body.encode("utf-8"))
+
+
+def decompress_body(data: Optional[bytes]) -> Optional[str]:
+    """Inverse of ``compress_body``; passes None through."""
+    return zlib.decompress(data).decode("utf-8") if data is not None else None
+
+
+# Crawled bodies are compressed, so database triggers cannot index them; the
+# body text is handed to the full-text index when it is stored instead
+_BODY_SEARCH_INDEX = {
+    "postgresql": text(
+        "UPDATE rss_articles SET search_vector = "
+        "ts_filter(coalesce(search_vector, ''), '{a,b}') || "
+        "setweight(to_tsvector(CAST(:config AS regconfig), left(:body, :max_chars)), 'C') "
+        "WHERE id = :article_id"
+    ),
+    "sqlite": text("UPDATE rss_articles_fts SET body = :body WHERE rowid = :article_id"),
+}
+
+
+def _dialect_insert(db: AsyncSession):
+    """Dialect-specific INSERT supporting ON CONFLICT, or None if unavailable."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert
+    if dialect == "sqlite":
+        return sqlite.insert
+    return None
+
 class CRUDRssFeed(CRUDBase[RssFeed, RssFeedCreate, RssFeedUpdate]):
     async def get_active_feeds(self, db: AsyncSession) -> List[RssFeed]:
         """Get all active RSS feeds."""
@@ -80,34 +167,53 @@ class CRUDRssFeed(CRUDBase[RssFeed, RssFeedCreate, RssFeedUpdate]):
         return result.scalar_one_or_none()
 
     async def get_feeds_to_fetch(self, db: AsyncSession) -> List[RssFeed]:
-        """Get feeds that need to be fetched based on their interval."""
+        """Get active feeds whose next scheduled fetch is due."""
         now = datetime.utcnow()
         result = await db.execute(
             select(self.model).where(
                 and_(
                     self.model.active == True,
                     or_(
-                        self.model.last_fetched.is_(None),
-                        self.model.last_fetched < (now - self.model.fetch_interval)
+                        self.model.next_fetch_at.is_(None),
+                        self.model.next_fetch_at <= now
                     )
                 )
             )
         )
         return result.scalars().all()
 
+    async def get_fetch_schedule(self, db: AsyncSession) -> List[Tuple[int, Optional[datetime]]]:
+        """Get (feed id, next fetch time) for every active feed."""
+        result = await db.execute(
+            select(self.model.id, self.model.next_fetch_at).where(self.model.active == True)
+        )
+        return [(row.id, row.next_fetch_at) for row in result]
+
     async def update_fetch_status(
         self, 
         db: AsyncSession, 
         feed_id: int, 
         last_fetched: datetime,
-        error: Optional[str] = None
+        error: Optional[str] = None,
+        validators: Optional[Dict[str, Optional[str]]] = None,
+        schedule: Optional[Tuple[int, datetime]] = None
     ) -> Optional[RssFeed]:
-        """Update fetch status of a feed."""
+        """
+        Update fetch status of a feed.
+
+        ``validators`` replaces the stored HTTP validators and ``schedule`` is
+        an ``(adaptive_interval, next_fetch_at)`` pair for the next fetch.
+        """
         feed = await self.get(db, feed_id)
         if not feed:
             return None
         
         feed.last_fetched = last_fetched
+        if schedule is not None:
+            feed.adaptive_interval, feed.next_fetch_at = schedule
+        if validators is not None:
+            feed.etag = validators.get("etag")
+            feed.last_modified = validators.get("last_modified")
         if error:
             feed.last_error = error
             feed.error_count += 1
@@ -121,20 +227,31 @@ class CRUDRssFeed(CRUDBase[RssFeed, RssFeedCreate, RssFeedUpdate]):
         return feed
 
 class CRUDRssArticle(CRUDBase[RssArticle, RssArticleCreate, RssArticleUpdate]):
+    def _page(self, query, skip: int, limit: int, after: Optional[Tuple[datetime, int]]):
+        """
+        Order newest first and page by keyset when ``after`` is given, else by OFFSET.
+
+        The keyset ``(published, id) < after`` is served by the composite
+        (published, id) indexes, so deep pages cost the same as the first.
+        """
+        query = query.order_by(desc(self.model.published), desc(self.model.id))
+        if after is not None:
+            query = query.where(tuple_(self.model.published, self.model.id) < tuple_(*after))
+        elif skip:
+            query = query.offset(skip)
+        return query.limit(limit)
+
     async def get_by_feed(
         self, 
         db: AsyncSession, 
         feed_id: int, 
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None
     ) -> List[RssArticle]:
         """Get articles by feed ID."""
         result = await db.execute(
-            select(self.model)
-            .where(self.model.feed_id == feed_id)
-            .order_by(desc(self.model.published), desc(self.model.created_at))
-            .offset(skip)
-            .limit(limit)
+            self._page(select(self.model).where(self.model.feed_id == feed_id), skip, limit, after)
         )
         return result.scalars().all()
 
@@ -142,18 +259,252 @@ class CRUDRssArticle(CRUDBase[RssArticle, RssArticleCreate, RssArticleUpdate]):
         self, 
         db: AsyncSession, 
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None
     ) -> List[RssArticle]:
         """Get recent articles from all feeds."""
         result = await db.execute(
-            select(self.model)
-            .options(selectinload(self.model.feed))
-            .order_by(desc(self.model.published), desc(self.model.created_at))
-            .offset(skip)
-            .limit(limit)
+            self._page(select(self.model).options(selectinload(self.model.feed)), skip, limit, after)
         )
         return result.scalars().all()
 
+    LISTING_COLUMNS = (
+        "id", "title", "link", "description", "content",
+        "published", "author", "category", "created_at",
+    )
+
+    async def get_listing_rows(
+        self,
+        db: AsyncSession,
+        feed_id: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        The page ``get_recent_articles``/``get_by_feed`` would return, as plain
+        dicts of ``LISTING_COLUMNS`` rather than ORM objects.
+        """
+        query = select(*(getattr(self.model, name) for name in self.LISTING_COLUMNS))
+        if feed_id is not None:
+            query = query.where(self.model.feed_id == feed_id)
+        result = await db.execute(self._page(query, skip, limit, after))
+        return [dict(row) for row in result.mappings()]
+
+    async def get_summaries(
+        self,
+        db: AsyncSession,
+        ids: List[int],
+        description_chars: int = 300
+    ) -> List[Dict[str, Any]]:
+        """
+        Get lightweight article rows for the article stream, in id order,
+        with the description cut short.
+        """
+        result = await db.execute(
+            select(
+                self.model.id,
+                self.model.feed_id,
+                self.model.title,
+                self.model.link,
+                func.substr(self.model.description, 1, description_chars).label("description"),
+                self.model.category,
+                self.model.published
+            )
+            .where(self.model.id.in_(ids))
+            .order_by(self.model.id)
+        )
+        return [dict(row) for row in result.mappings()]
+
+    EXPORT_COLUMNS = (
+        "id", "feed_id", "title", "link", "description", "content",
+        "published", "author", "category", "created_at",
+    )
+
+    async def stream_export(
+        self,
+        db: AsyncSession,
+        feed_id: Optional[int] = None,
+        category: Optional[str] = None,
+        published_from: Optional[datetime] = None,
+        published_to: Optional[datetime] = None,
+        batch_size: int = settings.EXPORT_BATCH_SIZE
+    ) -> AsyncIterator[Sequence[Any]]:
+        """
+        Yield the matching articles in id order, ``batch_size`` rows at a time.
+
+        Rows (``EXPORT_COLUMNS``) come from a server-side cursor, so memory use
+        does not grow with the size of the export. ``published_to`` is exclusive.
+        """
+        query = self._filtered(
+            select(*(getattr(self.model, name) for name in self.EXPORT_COLUMNS)),
+            category=category,
+            feed_id=feed_id
+        )
+        if published_from is not None:
+            query = query.where(self.model.published >= published_from)
+        if published_to is not None:
+            query = query.where(self.model.published < published_to)
+
+        result = await db.stream(query.order_by(self.model.id).execution_options(yield_per=batch_size))
+        async for rows in result.partitions():
+            yield rows
+
+    def _filtered(
+        self,
+        query,
+        category: Optional[str] = None,
+        search: Optional[str] = None,
+        exclude_read_by: Optional[int] = None,
+        feed_id: Optional[int] = None
+    ):
+        """Apply the article listing filters to a SELECT."""
+        if feed_id is not None:
+            query = query.where(self.model.feed_id == feed_id)
+        if category and category.lower() != "all":
+            category = category.lower()
+            # Matches the article's own category or, failing that, its feed's
+            query = query.where(
+                or_(
+                    func.lower(self.model.category) == category,
+                    self.model.feed_id.in_(select(RssFeed.id).where(func.lower(RssFeed.category) == category))
+                )
+            )
+        if search:
+            query = query.where(
+                or_(
+                    self.model.title.icontains(search, autoescape=True),
+                    self.model.description.icontains(search, autoescape=True)
+                )
+            )
+        if exclude_read_by is not None:
+            # Anti-join on the (user_id, article_id) unique index
+            query = query.where(
+                ~exists().where(
+                    and_(
+                        UserReadArticle.user_id == exclude_read_by,
+                        UserReadArticle.article_id == self.model.id
+                    )
+                )
+            )
+        return query
+
+    async def query_articles(
+        self,
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 10,
+        category: Optional[str] = None,
+        search: Optional[str] = None,
+        exclude_read_by: Optional[int] = None,
+        feed_id: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> Tuple[List[RssArticle], Optional[int]]:
+        """
+        Get one page of articles matching the filters, newest first, and the
+        total number of matches.
+
+        Filtering happens before paging so every page is full. On OFFSET pages
+        the total comes from a ``COUNT(*) OVER ()`` window in the same query;
+        keyset pages (``after``) skip the count, which would have to visit
+        every match, and return None for it.
+        """
+        filters = dict(category=category, search=search, exclude_read_by=exclude_read_by, feed_id=feed_id)
+        if after is not None:
+            result = await db.execute(
+                self._page(self._filtered(select(self.model), **filters), skip, limit, after)
+                .options(selectinload(self.model.feed))
+            )
+            return result.scalars().all(), None
+
+        result = await db.execute(
+            self._page(self._filtered(select(self.model, func.count().over().label("total_count")), **filters), skip, limit, None)
+            .options(selectinload(self.model.feed))
+        )
+        rows = result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total_count
+        if skip == 0:
+            return [], 0
+        # Past the last page the window has no rows to report the total on
+        total = await db.scalar(self._filtered(select(func.count()).select_from(self.model), **filters))
+        return [], total
+
+    async def search(
+        self,
+        db: AsyncSession,
+        text: str,
+        skip: int = 0,
+        limit: int = 20,
+        category: Optional[str] = None,
+        feed_id: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Full-text search over title, description and crawled content, best match first.
+
+        Returns rows of ``(RssArticle, rank, title_highlight, snippet)`` where the
+        highlights wrap matched terms in SEARCH_HIGHLIGHT_START/STOP. PostgreSQL
+        matches ``websearch_to_tsquery`` syntax against the GIN-indexed
+        search_vector and only builds headlines for the returned page; SQLite
+        matches every word through the FTS5 index and ranks by bm25.
+        """
+        filters = dict(category=category, feed_id=feed_id)
+        if db.get_bind().dialect.name == "postgresql":
+            config = settings.SEARCH_TEXT_CONFIG
+            tsquery = postgresql.websearch_to_tsquery(config, text)
+            search_vector = literal_column("rss_articles.search_vector")
+            # Normalization 32 scales ranks into [0, 1)
+            rank = func.ts_rank_cd(search_vector, tsquery, 32).label("rank")
+            page = (
+                self._filtered(select(self.model.id, rank), **filters)
+                .where(search_vector.op("@@")(tsquery))
+                .order_by(desc(rank), desc(self.model.id))
+                .offset(skip)
+                .limit(limit)
+                .subquery()
+            )
+            markers = f'StartSel="{SEARCH_HIGHLIGHT_START}", StopSel="{SEARCH_HIGHLIGHT_STOP}"'
+            # Bodies are compressed, so PostgreSQL snippets come from the description
+            document = func.coalesce(self.model.description, "")
+            query = (
+                select(
+                    self.model,
+                    page.c.rank,
+                    postgresql.ts_headline(config, self.model.title, tsquery, f"{markers}, HighlightAll=true")
+                    .label("title_highlight"),
+                    postgresql.ts_headline(
+                        config, document, tsquery, f'{markers}, MaxFragments=2, FragmentDelimiter=" … "'
+                    ).label("snippet"),
+                )
+                .join(page, page.c.id == self.model.id)
+                .order_by(desc(page.c.rank), desc(self.model.id))
+            )
+        else:
+            match = fts5_query(text)
+            if not match:
+                return []
+            fts_table = table("rss_articles_fts", column("rowid"))
+            fts = literal_column("rss_articles_fts")
+            # bm25 is lower-is-better; weight title over description over body
+            bm25 = func.bm25(fts, 10.0, 4.0, 1.0)
+            query = (
+                self._filtered(
+                    select(
+                        self.model,
+                        cast(-bm25, Float).label("rank"),
+                        func.highlight(fts, 0, SEARCH_HIGHLIGHT_START, SEARCH_HIGHLIGHT_STOP).label("title_highlight"),
+                        func.snippet(fts, -1, SEARCH_HIGHLIGHT_START, SEARCH_HIGHLIGHT_STOP, " … ", 24).label("snippet"),
+                    ).join(fts_table, fts_table.c.rowid == self.model.id),
+                    **filters
+                )
+                .where(fts.op("MATCH")(match))
+                .order_by(bm25, desc(self.model.id))
+                .offset(skip)
+                .limit(limit)
+            )
+        result = await db.execute(query.options(selectinload(self.model.feed)))
+        return result.all()
+
     async def get_by_guid(self, db: AsyncSession, guid: str, feed_id: int) -> Optional[RssArticle]:
         """Get article by GUID and feed ID for deduplication."""
         result = await db.execute(
@@ -197,6 +548,59 @@ class CRUDRssArticle(CRUDBase[RssArticle, RssArticleCreate, RssArticleUpdate]):
         
         # Create new article
         return await self.create(db, obj_in=article_data)
+
+    async def bulk_create_if_not_exists(
+        self,
+        db: AsyncSession,
+        articles: List[RssArticleCreate]
+    ) -> List[int]:
+        """
+        Insert a batch of articles in one statement and one transaction.
+
+        Duplicates (same feed and GUID, or same feed and link) are skipped by
+        ``INSERT ... ON CONFLICT DO NOTHING``; the returned ids are the rows
+        that were actually inserted.
+        """
+        rows = []
+        seen_guids = set()
+        seen_links = set()
+        ingested_at = datetime.utcnow()
+        for article in articles:
+            row = article.model_dump()
+            # Empty GUIDs would collide on the unique constraint, NULLs never do
+            row["guid"] = row["guid"] or None
+            # Undated entries are ordered by when we first saw them
+            row["published"] = row["published"] or ingested_at
+            guid_key = (row["feed_id"], row["guid"])
+            link_key = (row["feed_id"], row["link"])
+            if (row["guid"] and guid_key in seen_guids) or link_key in seen_links:
+                continue
+            seen_guids.add(guid_key)
+            seen_links.add(link_key)
+            rows.append(row)
+
+        if not rows:
+            return []
+
+        insert = _dialect_insert(db)
+        if insert is None:
+            # No ON CONFLICT support: fall back to the per-row path
+            new_ids = []
+            for row in rows:
+                existing = None
+                if row["guid"]:
+                    existing = await self.get_by_guid(db, row["guid"], row["feed_id"])
+                if not existing:
+                    existing = await self.get_by_link(db, row["link"], row["feed_id"])
+                if not existing:
+                    new_ids.append((await self.create(db, obj_in=row)).id)
+            return new_ids
+
+        stmt = insert(self.model).values(rows).on_conflict_do_nothing().returning(self.model.id)
+        result = await db.execute(stmt)
+        new_ids = list(result.scalars().all())
+        await db.commit()
+        return new_ids
     
     async def get_uncrawled_articles(
         self, 
@@ -217,7 +621,7 @@ class CRUDRssArticle(CRUDBase[RssArticle, RssArticleCreate, RssArticleUpdate]):
         db: AsyncSession, 
         article_id: int
     ) -> Optional[RssArticle]:
-        """Get a specific article with its crawled content."""
+        """Get a specific article with its feed; the crawled body is in article_bodies."""
         result = await db.execute(
             select(self.model)
             .options(selectinload(self.model.feed))
@@ -270,7 +674,359 @@ class CRUDCronJob(CRUDBase[CronJob, CronJobCreate, CronJobUpdate]):
         await db.refresh(job)
         return job
 
+class CRUDArticleJob(CRUDBase[ArticleJob, ArticleJobCreate, ArticleJobUpdate]):
+    async def enqueue(
+        self,
+        db: AsyncSession,
+        kind: str,
+        article_ids: List[int],
+        requeue_dead: bool = False
+    ) -> List[int]:
+        """
+        Add one pending job per article, skipping articles that already have one.
+
+        ``requeue_dead`` also resets dead-lettered jobs for these articles.
+        Returns the ids of the jobs that were created or reset.
+        """
+        now = datetime.utcnow()
+        rows = [
+            {"kind": kind, "article_id": article_id, "status": "pending", "attempts": 0, "run_after": now}
+            for article_id in dict.fromkeys(article_ids)
+        ]
+        if not rows:
+            return []
+
+        insert = _dialect_insert(db)
+        if insert is None:
+            job_ids = []
+            for row in rows:
+                existing = await db.execute(
+                    select(self.model).where(
+                        and_(self.model.kind == kind, self.model.article_id == row["article_id"])
+                    )
+                )
+                job = existing.scalar_one_or_none()
+                if job is None:
+                    job_ids.append((await self.create(db, obj_in=row)).id)
+                elif requeue_dead and job.status == "dead":
+                    await self.update(db, db_obj=job, obj_in={**row, "last_error": None})
+                    job_ids.append(job.id)
+            return job_ids
+
+        stmt = insert(self.model).values(rows)
+        if requeue_dead:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["kind", "article_id"],
+                set_={"status": "pending", "attempts": 0, "run_after": now, "last_error": None},
+                where=self.model.status == "dead",
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing()
+        result = await db.execute(stmt.returning(self.model.id))
+        job_ids = list(result.scalars().all())
+        await db.commit()
+        return job_ids
+
+    async def claim(
+        self,
+        db: AsyncSession,
+        kind: str,
+        worker_id: str,
+        limit: int = 1
+    ) -> List[ArticleJob]:
+        """
+        Atomically move due pending jobs to running and return them.
+
+        On Postgres ``FOR UPDATE SKIP LOCKED`` lets workers in other processes
+        claim concurrently without blocking on each other; SQLite serializes
+        writers anyway and ignores the locking clause.
+        """
+        now = datetime.utcnow()
+        due = (
+            select(self.model.id)
+            .where(
+                and_(
+                    self.model.kind == kind,
+                    self.model.status == "pending",
+                    self.model.run_after <= now
+                )
+            )
+            .order_by(self.model.run_after, self.model.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await db.execute(
+            update(self.model)
+            .where(self.model.id.in_(due.scalar_subquery()))
+            .values(status="running", attempts=self.model.attempts + 1, locked_by=worker_id, locked_at=now)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        jobs = list(result.scalars().all())
+        await db.commit()
+        return jobs
+
+    async def _set(self, db: AsyncSession, job_id: int, **values: Any) -> None:
+        await db.execute(update(self.model).where(self.model.id == job_id).values(**values))
+        await db.commit()
+
+    async def complete(self, db: AsyncSession, job_id: int) -> None:
+        """Mark a job as done."""
+        await self._set(
+            db, job_id, status="done", completed_at=datetime.utcnow(), locked_by=None, locked_at=None, last_error=None
+        )
+
+    async def fail(
+        self,
+        db: AsyncSession,
+        job_id: int,
+        error: str,
+        retry_at: Optional[datetime] = None
+    ) -> None:
+        """Schedule a retry at ``retry_at``, or dead-letter the job if it is None."""
+        if retry_at is None:
+            await self._set(db, job_id, status="dead", last_error=error, locked_by=None, locked_at=None)
+        else:
+            await self._set(
+                db, job_id, status="pending", run_after=retry_at, last_error=error, locked_by=None, locked_at=None
+            )
+
+    async def release(self, db: AsyncSession, job_id: int) -> None:
+        """Return a running job to the queue without counting the attempt."""
+        await self._set(
+            db, job_id, status="pending", attempts=self.model.attempts - 1, locked_by=None, locked_at=None
+        )
+
+    async def heartbeat(self, db: AsyncSession, job_id: int, worker_id: str) -> bool:
+        """Refresh the lock of a job this worker is running; False if it no longer holds it."""
+        result = await db.execute(
+            update(self.model)
+            .where(
+                and_(self.model.id == job_id, self.model.status == "running", self.model.locked_by == worker_id)
+            )
+            .values(locked_at=datetime.utcnow())
+        )
+        await db.commit()
+        return result.rowcount > 0
+
+    async def release_stale(self, db: AsyncSession, lock_timeout: int, max_attempts: int) -> Tuple[int, int]:
+        """
+        Return jobs whose worker died mid-run to the queue.
+
+        Jobs that already used ``max_attempts`` attempts are dead-lettered
+        instead, so a job that keeps taking its worker down is not retried
+        forever. Returns how many jobs were requeued and how many dead-lettered.
+        """
+        cutoff = datetime.utcnow() - timedelta(seconds=lock_timeout)
+        stale = and_(self.model.status == "running", self.model.locked_at < cutoff)
+        dead = await db.execute(
+            update(self.model)
+            .where(and_(stale, self.model.attempts >= max_attempts))
+            .values(
+                status="dead",
+                last_error=f"Worker stopped responding after {max_attempts} attempts",
+                locked_by=None,
+                locked_at=None,
+            )
+        )
+        requeued = await db.execute(
+            update(self.model).where(stale).values(status="pending", locked_by=None, locked_at=None)
+        )
+        await db.commit()
+        return requeued.rowcount, dead.rowcount
+
+    async def get_dead(self, db: AsyncSession, kind: Optional[str] = None, limit: int = 100) -> List[ArticleJob]:
+        """Get dead-lettered jobs, most recently failed first."""
+        query = select(self.model).where(self.model.status == "dead")
+        if kind:
+            query = query.where(self.model.kind == kind)
+        result = await db.execute(query.order_by(desc(self.model.updated_at)).limit(limit))
+        return result.scalars().all()
+
+    async def requeue_dead(self, db: AsyncSession, kind: Optional[str] = None) -> int:
+        """Give every dead-lettered job a fresh set of attempts."""
+        stmt = (
+            update(self.model)
+            .where(self.model.status == "dead")
+            .values(status="pending", attempts=0, run_after=datetime.utcnow(), last_error=None)
+        )
+        if kind:
+            stmt = stmt.where(self.model.kind == kind)
+        result = await db.execute(stmt)
+        await db.commit()
+        return result.rowcount
+
+    async def get_stats(self, db: AsyncSession) -> Dict[str, Dict[str, Any]]:
+        """Queue depth by status and recent completions for each job kind."""
+        now = datetime.utcnow()
+        stats: Dict[str, Dict[str, Any]] = {}
+
+        def entry(kind: str) -> Dict[str, Any]:
+            return stats.setdefault(
+                kind,
+                {
+                    "pending": 0, "running": 0, "done": 0, "dead": 0,
+                    "ready": 0, "oldest_ready_at": None,
+                    "completed_last_5m": 0, "completed_last_hour": 0,
+                },
+            )
+
+        result = await db.execute(
+            select(self.model.kind, self.model.status, func.count()).group_by(self.model.kind, self.model.status)
+        )
+        for kind, status, count in result:
+            entry(kind)[status] = count
+
+        result = await db.execute(
+            select(self.model.kind, func.count(), func.min(self.model.run_after))
+            .where(and_(self.model.status == "pending", self.model.run_after <= now))
+            .group_by(self.model.kind)
+        )
+        for kind, count, oldest in result:
+            entry(kind).update(ready=count, oldest_ready_at=oldest)
+
+        for window, key in ((timedelta(minutes=5), "completed_last_5m"), (timedelta(hours=1), "completed_last_hour")):
+            result = await db.execute(
+                select(self.model.kind, func.count())
+                .where(and_(self.model.status == "done", self.model.completed_at >= now - window))
+                .group_by(self.model.kind)
+            )
+            for kind, count in result:
+                entry(kind)[key] = count
+
+        return stats
+
+class CRUDSummaryCache(CRUDBase[SummaryCache, SummaryCacheCreate, SummaryCacheCreate]):
+    async def get_summary(self, db: AsyncSession, content_hash: str) -> Optional[str]:
+        """Get a cached summary by content hash."""
+        result = await db.execute(
+            select(self.model.summary).where(self.model.content_hash == content_hash)
+        )
+        return result.scalar_one_or_none()
+
+    async def store(self, db: AsyncSession, content_hash: str, model: str, summary: str) -> None:
+        """Store a summary; concurrent writers of the same hash keep the first one."""
+        row = {"content_hash": content_hash, "model": model, "summary": summary}
+        insert = _dialect_insert(db)
+        if insert is None:
+            if await self.get_summary(db, content_hash) is None:
+                await self.create(db, obj_in=row)
+            return
+        await db.execute(insert(self.model).values(row).on_conflict_do_nothing())
+        await db.commit()
+
+class CRUDArticleBody(CRUDBase[ArticleBody, ArticleBodyCreate, ArticleBodyCreate]):
+    async def get_body(self, db: AsyncSession, article_id: int) -> Optional[Tuple[str, Optional[str]]]:
+        """Get an article's crawled ``(content, html)``, decompressed, or None if not crawled."""
+        result = await db.execute(
+            select(self.model.content, self.model.html).where(self.model.article_id == article_id)
+        )
+        row = result.first()
+        if row is None:
+            return None
+        return decompress_body(row.content), decompress_body(row.html)
+
+    async def store(
+        self,
+        db: AsyncSession,
+        article_id: int,
+        content: str,
+        html: Optional[str] = None,
+        title: Optional[str] = None
+    ) -> None:
+        """
+        Save a crawled body, mark the article crawled and index the body for search.
+
+        HTML is only kept when the crawler produced something other than the
+        markdown, so the same text is never stored twice.
+        """
+        row = {
+            "article_id": article_id,
+            "content": compress_body(content),
+            "html": compress_body(html) if html and html != content else None,
+        }
+        insert = _dialect_insert(db)
+        if insert is None:
+            await db.merge(self.model(**row))
+        else:
+            stmt = insert(self.model).values(row)
+            await db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[self.model.article_id],
+                    set_={"content": stmt.excluded.content, "html": stmt.excluded.html, "updated_at": func.now()},
+                )
+            )
+
+        values: Dict[str, Any] = {"is_crawled": True}
+        if title:
+            values["crawled_title"] = title
+        await db.execute(update(RssArticle).where(RssArticle.id == article_id).values(**values))
+
+        search_index = _BODY_SEARCH_INDEX.get(db.get_bind().dialect.name)
+        if search_index is not None:
+            await db.execute(
+                search_index,
+                {
+                    "article_id": article_id,
+                    "body": content,
+                    "config": settings.SEARCH_TEXT_CONFIG,
+                    "max_chars": settings.SEARCH_MAX_DOCUMENT_CHARS,
+                },
+            )
+        await db.commit()
+
+class CRUDUserReadArticle(CRUDBase[UserReadArticle, UserReadArticleCreate, UserReadArticleCreate]):
+    async def mark_read(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        article_ids: Optional[List[int]] = None,
+        feed_id: Optional[int] = None,
+        category: Optional[str] = None
+    ) -> List[int]:
+        """
+        Mark articles read for a user in one ``INSERT ... SELECT ... ON CONFLICT DO NOTHING``.
+
+        Articles are picked by id, feed and/or category (matched like the
+        listings do); unknown ids and articles already read are skipped.
+        Returns the ids that were newly marked.
+        """
+        articles = rss_article._filtered(select(literal(user_id), RssArticle.id), category=category, feed_id=feed_id)
+        if article_ids is not None:
+            articles = articles.where(RssArticle.id.in_(article_ids))
+        # SQLite can only parse INSERT ... SELECT ... ON CONFLICT when the SELECT has a WHERE
+        articles = articles.where(true())
+
+        insert = _dialect_insert(db)
+        if insert is None:
+            result = await db.execute(
+                articles.where(
+                    ~exists().where(
+                        and_(self.model.user_id == user_id, self.model.article_id == RssArticle.id)
+                    )
+                )
+            )
+            new_ids = [article_id for _, article_id in result.all()]
+            db.add_all(self.model(user_id=user_id, article_id=article_id) for article_id in new_ids)
+            await db.commit()
+            return new_ids
+
+        stmt = (
+            insert(self.model)
+            .from_select(["user_id", "article_id"], articles)
+            .on_conflict_do_nothing()
+            .returning(self.model.article_id)
+        )
+        result = await db.execute(stmt)
+        new_ids = list(result.scalars().all())
+        await db.commit()
+        return new_ids
+
 # Create instances
 rss_feed = CRUDRssFeed(RssFeed)
 rss_article = CRUDRssArticle(RssArticle)
-cron_job = CRUDCronJob(CronJob)
\ No newline at end of file
+article_body = CRUDArticleBody(ArticleBody)
+cron_job = CRUDCronJob(CronJob)
+article_job = CRUDArticleJob(ArticleJob)
+summary_cache = CRUDSummaryCache(SummaryCache)
+user_read_article = CRUDUserReadArticle(UserReadArticle)
\ No newline at end of file
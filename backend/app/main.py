@@ -11,6 +11,10 @@ from .api.v1.endpoints import router as api_router
 from .core.cache import cache
 from .db.session import init_db
 from .services.scheduler_service import scheduler_service
+from .services.feed_fetcher import feed_fetcher
+from .services.article_stream import article_stream
+from .services.job_queue import job_queue
+from .services.http_clients import http_clients
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -31,6 +35,12 @@ async def lifespan(app: FastAPI):
     
     # Initialize cache
     await cache.init()
+
+    # Fan new articles out to this worker's /rss/stream clients
+    article_stream.start()
+
+    # Open pooled outbound API clients before anything can use them
+    http_clients.start()
     
     # Start scheduler service
     try:
@@ -39,6 +49,9 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to start scheduler service: {e}")
         # Don't raise here, let the app start without scheduler if needed
+
+    # Every worker process takes crawl/summarize jobs from the shared queue
+    job_queue.start()
     
     yield
     
@@ -52,6 +65,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error stopping scheduler service: {e}")
     
+    await article_stream.stop()
+
+    # Stop claiming jobs and let running ones finish their outbound requests,
+    # then close the clients; the drain timeout bounds both waits
+    await job_queue.stop(drain_timeout=settings.HTTP_CLIENT_DRAIN_TIMEOUT)
+    await feed_fetcher.close()
+    await http_clients.close()
     await cache.close()
 
 app = FastAPI(
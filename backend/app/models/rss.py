@@ -1,8 +1,9 @@
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey
+from sqlalchemy import DDL, Column, Integer, String, Boolean, DateTime, Text, LargeBinary, ForeignKey, Index, UniqueConstraint, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
+from ..core.config import settings
 from ..db.session import Base
 
 class RssFeed(Base):
@@ -14,9 +15,15 @@ class RssFeed(Base):
     category: Mapped[Optional[str]] = mapped_column(String(100), default="General")
     active: Mapped[bool] = mapped_column(Boolean(), default=True)
     fetch_interval: Mapped[int] = mapped_column(Integer, default=3600)  # seconds, default 1 hour
+    # Interval learned from how often the feed publishes; starts from fetch_interval
+    adaptive_interval: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    next_fetch_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True, index=True)
     last_fetched: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     error_count: Mapped[int] = mapped_column(Integer, default=0)
+    # HTTP validators from the last successful fetch, sent back for conditional GETs
+    etag: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    last_modified: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
@@ -37,14 +44,13 @@ class RssArticle(Base):
     link: Mapped[str] = mapped_column(String(1000), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    published: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Falls back to ingestion time for entries without a date; keyset pagination needs it set
+    published: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     guid: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)  # RSS guid for deduplication
     author: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     category: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     
-    # Crawled content fields
-    crawled_content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Markdown content
-    crawled_html: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Cleaned HTML
+    # Crawled content fields; the crawled body itself lives in article_bodies
     crawled_title: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)  # Title from crawled page
     is_crawled: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     
@@ -53,12 +59,115 @@ class RssArticle(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
+    __table_args__ = (
+        # Deduplication keys; ingestion relies on these for INSERT ... ON CONFLICT DO NOTHING
+        UniqueConstraint('feed_id', 'guid', name='uq_rss_articles_feed_guid'),
+        UniqueConstraint('feed_id', 'link', name='uq_rss_articles_feed_link'),
+        # Keyset pagination on (published, id), globally and per feed
+        Index('ix_rss_articles_published_id', 'published', 'id'),
+        Index('ix_rss_articles_feed_published_id', 'feed_id', 'published', 'id'),
+    )
+
     # Relationship to feed
     feed = relationship("RssFeed", back_populates="articles")
+    # Crawled body, loaded only when accessed
+    body = relationship("ArticleBody", uselist=False, cascade="all, delete-orphan")
 
     def __repr__(self):
         return f"<RssArticle {self.title}>"
 
+# Category listings filter on lower(category) and page by (published, id)
+Index(
+    'ix_rss_articles_category_published_id',
+    func.lower(RssArticle.category), RssArticle.published, RssArticle.id,
+)
+# Only the crawl backlog is indexed, so the index stays small as articles get crawled
+Index(
+    'ix_rss_articles_uncrawled_created_at',
+    RssArticle.created_at,
+    postgresql_where=RssArticle.is_crawled == False,
+    sqlite_where=RssArticle.is_crawled == False,
+)
+
+# Full-text search over title, description and the crawled body. Triggers keep
+# title and description current on insert and update; crawled bodies are stored
+# compressed, so the crawl stage indexes their text when it saves them
+# (article_body.store). On PostgreSQL the body is the weight-C part of a tsvector
+# column with a GIN index, on SQLite the body column of an FTS5 table.
+# Existing databases get these objects from migration 9b6e4f20d8a1.
+ARTICLE_SEARCH_DDL = {
+    "postgresql": [
+        "ALTER TABLE rss_articles ADD COLUMN search_vector tsvector",
+        f"""
+        CREATE FUNCTION rss_articles_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('{settings.SEARCH_TEXT_CONFIG}', coalesce(NEW.title, '')), 'A') ||
+                setweight(to_tsvector('{settings.SEARCH_TEXT_CONFIG}', coalesce(NEW.description, '')), 'B');
+            IF TG_OP = 'UPDATE' THEN
+                -- Keep the indexed body
+                NEW.search_vector := NEW.search_vector || ts_filter(coalesce(OLD.search_vector, ''), '{{c}}');
+            END IF;
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        """
+        CREATE TRIGGER rss_articles_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF title, description ON rss_articles
+        FOR EACH ROW EXECUTE FUNCTION rss_articles_search_vector_update()
+        """,
+        "CREATE INDEX ix_rss_articles_search_vector ON rss_articles USING gin (search_vector)",
+    ],
+    "sqlite": [
+        "CREATE VIRTUAL TABLE rss_articles_fts USING fts5(title, description, body, tokenize='porter unicode61')",
+        """
+        CREATE TRIGGER rss_articles_fts_insert AFTER INSERT ON rss_articles BEGIN
+            INSERT INTO rss_articles_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+        END
+        """,
+        """
+        CREATE TRIGGER rss_articles_fts_delete AFTER DELETE ON rss_articles BEGIN
+            DELETE FROM rss_articles_fts WHERE rowid = old.id;
+        END
+        """,
+        """
+        CREATE TRIGGER rss_articles_fts_update AFTER UPDATE OF title, description ON rss_articles BEGIN
+            UPDATE rss_articles_fts SET title = new.title, description = new.description WHERE rowid = new.id;
+        END
+        """,
+    ],
+}
+for _dialect, _statements in ARTICLE_SEARCH_DDL.items():
+    for _statement in _statements:
+        event.listen(RssArticle.__table__, "after_create", DDL(_statement).execute_if(dialect=_dialect))
+event.listen(
+    RssArticle.__table__, "before_drop", DDL("DROP TABLE IF EXISTS rss_articles_fts").execute_if(dialect="sqlite")
+)
+event.listen(
+    RssArticle.__table__,
+    "after_drop",
+    DDL("DROP FUNCTION IF EXISTS rss_articles_search_vector_update()").execute_if(dialect="postgresql"),
+)
+
+class ArticleBody(Base):
+    """Crawled article body, kept out of the rss_articles row and zlib-compressed at rest."""
+
+    __tablename__ = "article_bodies"
+
+    article_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("rss_articles.id", ondelete="CASCADE"), primary_key=True
+    )
+    content: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)  # Markdown
+    html: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)  # Cleaned HTML, when the crawler produces it
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    def __repr__(self):
+        return f"<ArticleBody {self.article_id}>"
+
 class CronJob(Base):
     __tablename__ = "cron_jobs"
 
@@ -77,4 +186,50 @@ class CronJob(Base):
     )
 
     def __repr__(self):
-        return f"<CronJob {self.name} - {self.schedule}>"
\ No newline at end of file
+        return f"<CronJob {self.name} - {self.schedule}>"
+
+class ArticleJob(Base):
+    """A unit of background work (extract, crawl or summarize) for one article."""
+
+    __tablename__ = "article_jobs"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    kind: Mapped[str] = mapped_column(String(32), nullable=False)  # extract | crawl | summarize
+    article_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("rss_articles.id", ondelete="CASCADE"), nullable=False
+    )
+    status: Mapped[str] = mapped_column(String(16), default="pending", nullable=False)  # pending | running | done | dead
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    run_after: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    locked_by: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    locked_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    __table_args__ = (
+        # Idempotency: one job per stage per article, however often it is enqueued
+        UniqueConstraint('kind', 'article_id', name='uq_article_jobs_kind_article'),
+        # Workers claim with WHERE kind = ? AND status = 'pending' AND run_after <= now
+        Index('ix_article_jobs_claim', 'kind', 'status', 'run_after'),
+    )
+
+    def __repr__(self):
+        return f"<ArticleJob {self.kind}:{self.article_id} {self.status}>"
+
+class SummaryCache(Base):
+    """LLM summaries keyed by a hash of the normalized content, prompt and model."""
+
+    __tablename__ = "summary_cache"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    content_hash: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    model: Mapped[str] = mapped_column(String(255), nullable=False)
+    summary: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<SummaryCache {self.content_hash[:12]} {self.model}>"
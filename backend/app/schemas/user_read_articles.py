@@ -1,25 +1,43 @@
 from datetime import datetime
-from pydantic import BaseModel, field_validator
-from typing import Union
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import List, Optional
 
 class UserReadArticleCreate(BaseModel):
-    article_id: Union[str, int]
-    article_title: str
-    article_link: str
-    
-    @field_validator('article_id')
-    @classmethod
-    def convert_article_id_to_string(cls, v):
-        """Convert article_id to string if it's an integer"""
-        return str(v)
+    article_id: int
+    # Accepted from older clients and ignored; title and link come from rss_articles
+    article_title: Optional[str] = None
+    article_link: Optional[str] = None
 
 class UserReadArticleResponse(BaseModel):
     id: int
     user_id: int
-    article_id: str
-    article_title: str
-    article_link: str
+    article_id: int
     read_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class MarkReadBatchRequest(BaseModel):
+    """Articles to mark as read: explicit ids, or every article of a feed or category."""
+    article_ids: Optional[List[int]] = Field(None, max_length=1000)
+    feed_id: Optional[int] = None
+    category: Optional[str] = None
+
+    @field_validator('category')
+    @classmethod
+    def check_category(cls, value):
+        """Listings treat "all" and blank as no filter, which would mark every article"""
+        if value is not None and value.strip().lower() in ("", "all"):
+            raise ValueError('category must name a category; "all" is not allowed')
+        return value
+
+    @model_validator(mode='after')
+    def check_selection(self):
+        """Require exactly one way of selecting articles"""
+        selected = [value for value in (self.article_ids, self.feed_id, self.category) if value is not None]
+        if len(selected) != 1:
+            raise ValueError("Provide exactly one of article_ids, feed_id or category")
+        return self
+
+class ReadFlagsRequest(BaseModel):
+    article_ids: List[int] = Field(..., max_length=500)
@@ -0,0 +1,21 @@
+"""
+Article body extraction.
+
+Feed refreshes only download and parse the feed document. Full article pages
+are fetched afterwards, for newly stored articles only, by the ``extract``
+jobs of the durable job queue (see ``RssService.extract_article``).
+"""
+
+from bs4 import BeautifulSoup
+
+
+def extract_main_text(html: str) -> str:
+    """Extract the main text of an article page (CPU bound, run in a thread)."""
+    soup = BeautifulSoup(html, "html.parser")
+
+    # Try to find main content
+    main_content = soup.find("article") or soup.find("main") or soup.find("div", class_="content") or soup.body
+
+    if main_content:
+        return main_content.get_text(separator="\n", strip=True)
+    return ""
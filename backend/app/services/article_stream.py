@@ -0,0 +1,289 @@
+"""
+Live stream of newly ingested articles for Server-Sent Events clients.
+
+After a feed fetch commits new articles, their summaries are appended to the
+ARTICLE_STREAM_KEY Redis stream, which keeps about ARTICLE_STREAM_MAXLEN
+entries. Every worker process follows the stream and fans new entries out to
+the ``/rss/stream`` clients connected to it. Without Redis, an in-process
+backlog plays the same part for the clients of the worker that ingested them.
+
+Event ids are stream entry ids, which follow publish order. Article ids do
+not: feeds are ingested concurrently, so a batch with lower ids can be
+published after one with higher ids. A reconnecting client sends the last
+event id it saw and is replayed every entry after it, oldest first. If it
+missed more than ARTICLE_STREAM_REPLAY_LIMIT entries, or its event is no
+longer retained, it gets a ``reset`` event instead and should reload its
+article list.
+
+Each client gets a bounded queue. A client that falls ARTICLE_STREAM_QUEUE_SIZE
+events behind is disconnected rather than buffered without limit, and
+resumes as above when it reconnects.
+"""
+
+import asyncio
+import json
+import logging
+import re
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Set, Tuple
+
+from ..core.cache import cache
+from ..core.config import settings
+from ..db.crud_rss import rss_article
+from ..db.session import async_session_factory
+
+logger = logging.getLogger(__name__)
+
+EVENT_ID_PATTERN = re.compile(r"^\d+-\d+$")
+
+# How long one XREAD waits for new entries before it is reissued
+READ_BLOCK_MS = 5000
+
+Entry = Tuple[str, Dict[str, Any]]
+
+
+def _sequence(event_id: str) -> Tuple[int, int]:
+    """Stream entry ids (``<ms>-<seq>``) as comparable tuples."""
+    ms, seq = event_id.split("-")
+    return int(ms), int(seq)
+
+
+def format_event(event_id: str, article: Dict[str, Any]) -> str:
+    """One SSE ``article`` event."""
+    return f"id: {event_id}\nevent: article\ndata: {json.dumps(article)}\n\n"
+
+
+def format_reset(event_id: Optional[str]) -> str:
+    """Tell the client it missed too much to replay; its id moves on to ``event_id``."""
+    id_line = f"id: {event_id}\n" if event_id else ""
+    return f"{id_line}event: reset\ndata: {{}}\n\n"
+
+
+def _serialize(article: Dict[str, Any]) -> Dict[str, Any]:
+    published = article.get("published")
+    return {**article, "published": published.isoformat() if published else None}
+
+
+class _Subscriber:
+    def __init__(self, queue_size: int):
+        self.queue: "asyncio.Queue[Optional[Entry]]" = asyncio.Queue(queue_size)
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+        try:
+            # Wake the stream if it is waiting for an event
+            self.queue.put_nowait(None)
+        except asyncio.QueueFull:
+            pass
+
+
+class ArticleStream:
+    """Per-process fan-out of new articles to connected stream clients."""
+
+    def __init__(
+        self,
+        queue_size: int = settings.ARTICLE_STREAM_QUEUE_SIZE,
+        replay_limit: int = settings.ARTICLE_STREAM_REPLAY_LIMIT,
+        heartbeat: float = settings.ARTICLE_STREAM_HEARTBEAT,
+        max_length: int = settings.ARTICLE_STREAM_MAXLEN,
+    ):
+        self.queue_size = queue_size
+        self.replay_limit = replay_limit
+        self.heartbeat = heartbeat
+        self.max_length = max_length
+        self._subscribers: Set[_Subscriber] = set()
+        self._listener: Optional[asyncio.Task] = None
+        # Used without Redis: the retained entries and the last id handed out
+        self._backlog: Deque[Entry] = deque(maxlen=max_length)
+        self._last_local_id = (0, 0)
+
+    @property
+    def client_count(self) -> int:
+        return len(self._subscribers)
+
+    def start(self):
+        """Follow the Redis stream; call after the cache is initialized."""
+        if cache.client is not None and self._listener is None:
+            self._listener = asyncio.create_task(self._listen(), name="article-stream")
+
+    async def stop(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        for subscriber in list(self._subscribers):
+            subscriber.close()
+
+    async def publish_articles(self, article_ids: List[int]):
+        """Publish newly committed articles to stream clients on every worker."""
+        if not article_ids:
+            return
+        try:
+            async with async_session_factory() as db:
+                articles = await rss_article.get_summaries(db, ids=article_ids)
+            await self.publish([_serialize(article) for article in articles])
+        except Exception as e:
+            logger.error(f"Failed to publish {len(article_ids)} new articles to the stream: {e}")
+
+    async def publish(self, articles: List[Dict[str, Any]]):
+        if not articles:
+            return
+        client = cache.client
+        if client is not None:
+            try:
+                async with client.pipeline(transaction=False) as pipe:
+                    for article in articles:
+                        pipe.xadd(
+                            settings.ARTICLE_STREAM_KEY,
+                            {"article": json.dumps(article)},
+                            maxlen=self.max_length,
+                            approximate=True,
+                        )
+                    await pipe.execute()
+                return
+            except Exception as e:
+                logger.warning(f"Article stream publish failed, delivering locally only: {e}")
+
+        entries = [(self._next_local_id(), article) for article in articles]
+        self._backlog.extend(entries)
+        self._dispatch(entries)
+
+    def _next_local_id(self) -> str:
+        """Ids shaped like Redis stream ids: milliseconds, then a counter within the millisecond."""
+        ms = int(time.time() * 1000)
+        last_ms, last_seq = self._last_local_id
+        self._last_local_id = (ms, 0) if ms > last_ms else (last_ms, last_seq + 1)
+        return "-".join(map(str, self._last_local_id))
+
+    def _dispatch(self, entries: List[Entry]):
+        for subscriber in list(self._subscribers):
+            for entry in entries:
+                try:
+                    subscriber.queue.put_nowait(entry)
+                except asyncio.QueueFull:
+                    # Too slow to keep up: drop it, it resumes from its last event id
+                    self._subscribers.discard(subscriber)
+                    subscriber.closed = True
+                    logger.info("Disconnecting a slow article stream client")
+                    break
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[_Subscriber]:
+        subscriber = _Subscriber(self.queue_size)
+        self._subscribers.add(subscriber)
+        try:
+            yield subscriber
+        finally:
+            self._subscribers.discard(subscriber)
+
+    async def events(self, last_event_id: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        SSE body for one client: entries missed since ``last_event_id``, then live ones.
+
+        Keepalive comments are sent every ``heartbeat`` seconds so idle
+        connections are not closed by proxies.
+        """
+        async with self.subscribe() as subscriber:
+            # Subscribed before replaying, so entries published in between are not lost
+            sent: Optional[Tuple[int, int]] = None
+            if last_event_id is None:
+                yield ": connected\n\n"
+            else:
+                missed = await self._missed(last_event_id)
+                if missed is None:
+                    latest = await self._latest_id()
+                    yield format_reset(latest)
+                    if latest is not None:
+                        sent = _sequence(latest)
+                else:
+                    sent = _sequence(last_event_id)
+                    for event_id, article in missed:
+                        sent = _sequence(event_id)
+                        yield format_event(event_id, article)
+
+            while not subscriber.closed:
+                try:
+                    entry = await asyncio.wait_for(subscriber.queue.get(), self.heartbeat)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                if entry is None:
+                    continue
+                event_id, article = entry
+                # Already replayed, or from before the reset
+                if sent is not None and _sequence(event_id) <= sent:
+                    continue
+                sent = _sequence(event_id)
+                yield format_event(event_id, article)
+
+    async def _missed(self, last_event_id: str) -> Optional[List[Entry]]:
+        """Entries after ``last_event_id``, oldest first, or None if they cannot all be replayed."""
+        if not EVENT_ID_PATTERN.match(last_event_id):
+            return None
+        # The client's own entry comes first, and one more than the limit shows an overflow
+        entries = await self._entries_from(last_event_id, self.replay_limit + 2)
+        if not entries or entries[0][0] != last_event_id:
+            # Trimmed away (or never published here): what followed it may be gone too
+            return None
+        missed = entries[1:]
+        if len(missed) > self.replay_limit:
+            return None
+        return missed
+
+    async def _entries_from(self, event_id: str, count: int) -> Optional[List[Entry]]:
+        """Up to ``count`` retained entries from ``event_id`` on, inclusive."""
+        client = cache.client
+        if client is None:
+            start = _sequence(event_id)
+            return [entry for entry in self._backlog if _sequence(entry[0]) >= start][:count]
+        try:
+            entries = await client.xrange(settings.ARTICLE_STREAM_KEY, min=event_id, count=count)
+        except Exception as e:
+            logger.error(f"Failed to read the article stream for a resuming client: {e}")
+            return None
+        return [(entry_id, json.loads(fields["article"])) for entry_id, fields in entries]
+
+    async def _latest_id(self) -> Optional[str]:
+        client = cache.client
+        if client is None:
+            return self._backlog[-1][0] if self._backlog else None
+        try:
+            entries = await client.xrevrange(settings.ARTICLE_STREAM_KEY, count=1)
+        except Exception as e:
+            logger.error(f"Failed to read the article stream: {e}")
+            return None
+        return entries[0][0] if entries else None
+
+    async def _listen(self):
+        """Follow the article stream for as long as the app runs."""
+        last_id = None
+        while True:
+            try:
+                if last_id is None:
+                    latest = await cache.client.xrevrange(settings.ARTICLE_STREAM_KEY, count=1)
+                    last_id = latest[0][0] if latest else "0-0"
+                response = await cache.client.xread(
+                    {settings.ARTICLE_STREAM_KEY: last_id}, block=READ_BLOCK_MS
+                )
+                for _, entries in response or []:
+                    batch = [(entry_id, json.loads(fields["article"])) for entry_id, fields in entries]
+                    if batch:
+                        last_id = batch[-1][0]
+                        self._dispatch(batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Entries may have been trimmed meanwhile: disconnect the clients so they resume
+                logger.warning(f"Article stream read failed: {e}, retrying")
+                for subscriber in list(self._subscribers):
+                    self._subscribers.discard(subscriber)
+                    subscriber.close()
+                last_id = None
+                await asyncio.sleep(1)
+
+
+# Global article stream
+article_stream = ArticleStream()
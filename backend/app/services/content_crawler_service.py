@@ -3,7 +3,8 @@ import logging
 from typing import Optional, Dict, Any
 from crawl4ai import AsyncWebCrawler
 from sqlalchemy.ext.asyncio import AsyncSession
-from ..db.crud_rss import rss_article
+from ..core.route_cache import invalidate_tags, article_tag
+from ..db.crud_rss import rss_article, article_body
 from ..models.rss import RssArticle
 
 logger = logging.getLogger(__name__)
@@ -97,7 +98,7 @@ class ContentCrawlerService:
                 return False
             
             # Skip if already crawled
-            if article.crawled_content:
+            if article.is_crawled:
                 logger.info(f"Article {article_id} already has crawled content")
                 return True
             
@@ -106,15 +107,15 @@ class ContentCrawlerService:
             if not crawled_data:
                 return False
             
-            # Update the article with crawled content
-            update_data = {
-                "crawled_content": crawled_data["markdown_content"],
-                "crawled_html": crawled_data["cleaned_html"],
-                "crawled_title": crawled_data["title"],
-                "is_crawled": True
-            }
-            
-            await rss_article.update(db, db_obj=article, obj_in=update_data)
+            # Store the crawled body and mark the article crawled
+            await article_body.store(
+                db,
+                article_id,
+                crawled_data["markdown_content"],
+                html=crawled_data["cleaned_html"],
+                title=crawled_data["title"],
+            )
+            await invalidate_tags(article_tag(article_id))
             logger.info(f"Updated article {article_id} with crawled content")
             return True
             
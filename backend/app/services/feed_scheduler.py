@@ -0,0 +1,212 @@
+"""
+Per-feed fetch scheduler.
+
+Keeps a min-heap of ``(next_fetch_at, feed_id)`` for every active feed and
+dispatches each feed when it falls due, so fetches are spread over time
+according to each feed's adaptive interval (see ``plan_next_fetch``) instead
+of all firing on a global cron tick. Runs only on the elected leader; feed
+changes on any worker wake it through RSS_SCHEDULER_WAKE_CHANNEL.
+
+Each feed is due at most once: ``_due`` holds the current due time per feed,
+and heap entries that no longer match it (left behind by a reload or a
+reschedule) are skipped when popped.
+"""
+
+import asyncio
+import heapq
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+from ..core.cache import cache
+from ..core.config import settings
+from ..db.crud_rss import rss_feed
+from ..db.session import async_session_factory
+from .leader_election import leader_election
+from .rss_service import rss_service
+
+logger = logging.getLogger(__name__)
+
+
+class FeedScheduler:
+    """Priority-queue scheduler ordered by each feed's next due time."""
+
+    def __init__(self, reload_interval: int = settings.RSS_SCHEDULER_RELOAD_INTERVAL):
+        self.reload_interval = reload_interval
+        self._heap: List[Tuple[datetime, int]] = []
+        self._due: Dict[int, datetime] = {}
+        self._fetching: Set[int] = set()
+        self._dispatched: Set[asyncio.Task] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._listener: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self._reload_requested = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self):
+        """Start the scheduling loop (idempotent)."""
+        if self._task:
+            return
+        self._task = asyncio.create_task(self._run(), name="feed-scheduler")
+        if cache.client is not None:
+            self._listener = asyncio.create_task(self._listen(), name="feed-scheduler-wake")
+        logger.info("Feed scheduler started")
+
+    async def stop(self):
+        """Stop the scheduling loop and cancel in-flight fetches."""
+        tasks = list(self._dispatched)
+        tasks.extend(task for task in (self._task, self._listener) if task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._listener = None
+        self._dispatched.clear()
+        self._fetching.clear()
+        self._clear()
+        logger.info("Feed scheduler stopped")
+
+    async def wake(self):
+        """
+        Reload the schedule now, e.g. after a feed was created or changed.
+
+        The scheduler only runs on the leader, which may be another worker, so
+        the wake is published to every worker; without Redis there is only
+        this process to wake.
+        """
+        client = cache.client
+        if client is not None:
+            try:
+                await client.publish(settings.RSS_SCHEDULER_WAKE_CHANNEL, "reload")
+                return
+            except Exception as e:
+                logger.warning(f"Failed to publish feed scheduler wake: {e}")
+        self._request_reload()
+
+    def _request_reload(self):
+        self._reload_requested = True
+        self._wakeup.set()
+
+    async def reload(self):
+        """Rebuild the heap from the database."""
+        async with async_session_factory() as db:
+            schedule = await rss_feed.get_fetch_schedule(db)
+        now = datetime.utcnow()
+        self._clear()
+        for feed_id, next_fetch_at in schedule:
+            # Feeds being fetched are rescheduled when their fetch finishes
+            if feed_id not in self._fetching:
+                self._schedule(feed_id, next_fetch_at.replace(tzinfo=None) if next_fetch_at else now)
+
+    def _clear(self):
+        self._heap = []
+        self._due = {}
+
+    def _schedule(self, feed_id: int, due: datetime):
+        """Make ``due`` the feed's only due time; older heap entries become stale."""
+        self._due[feed_id] = due
+        heapq.heappush(self._heap, (due, feed_id))
+
+    def _pop_due(self, now: datetime) -> List[int]:
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            due_at, feed_id = heapq.heappop(self._heap)
+            if self._due.get(feed_id) != due_at:
+                continue
+            del self._due[feed_id]
+            due.append(feed_id)
+        return due
+
+    async def _run(self):
+        next_reload = 0.0
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                if not leader_election.is_leader:
+                    self._clear()
+                    next_reload = 0.0
+                    await self._sleep(self.reload_interval)
+                    continue
+
+                if self._reload_requested or loop.time() >= next_reload:
+                    self._reload_requested = False
+                    await self.reload()
+                    next_reload = loop.time() + self.reload_interval
+
+                for feed_id in self._pop_due(datetime.utcnow()):
+                    self._dispatch(feed_id)
+
+                timeout = next_reload - loop.time()
+                if self._heap:
+                    until_due = (self._heap[0][0] - datetime.utcnow()).total_seconds()
+                    timeout = min(timeout, until_due)
+                await self._sleep(max(timeout, 0.1))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Feed scheduler iteration failed: {e}")
+                next_reload = 0.0
+                await self._sleep(self.reload_interval)
+
+    async def _sleep(self, timeout: float):
+        """Sleep until the timeout or until the heap changes."""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._wakeup.clear()
+
+    async def _listen(self):
+        """Follow the wake channel for as long as the scheduler runs."""
+        while True:
+            pubsub = cache.client.pubsub()
+            try:
+                await pubsub.subscribe(settings.RSS_SCHEDULER_WAKE_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self._request_reload()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Changes published meanwhile were missed; the next reload picks them up
+                logger.warning(f"Feed scheduler wake subscription lost: {e}, resubscribing")
+                self._request_reload()
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+    def _dispatch(self, feed_id: int):
+        if feed_id in self._fetching or rss_service.is_fetching(feed_id):
+            return
+        self._fetching.add(feed_id)
+        task = asyncio.create_task(self._fetch(feed_id), name=f"feed-fetch-{feed_id}")
+        self._dispatched.add(task)
+        task.add_done_callback(self._dispatched.discard)
+
+    async def _fetch(self, feed_id: int):
+        try:
+            async with async_session_factory() as db:
+                feed = await rss_feed.get(db, feed_id)
+            if not feed or not feed.active:
+                return
+            await rss_service.fetch_and_store_feed(feed)
+
+            # Put the feed back with its newly planned due time
+            async with async_session_factory() as db:
+                feed = await rss_feed.get(db, feed_id)
+            if feed and feed.active and feed.next_fetch_at:
+                self._schedule(feed_id, feed.next_fetch_at.replace(tzinfo=None))
+                # Recompute how long the loop may sleep
+                self._wakeup.set()
+        except Exception as e:
+            logger.error(f"Scheduled fetch of feed {feed_id} failed: {e}")
+        finally:
+            self._fetching.discard(feed_id)
+
+
+# Global feed scheduler instance
+feed_scheduler = FeedScheduler()
@@ -0,0 +1,140 @@
+"""
+Shared, long-lived HTTP clients for outbound API providers.
+
+Each provider gets one ``httpx.AsyncClient`` per process, so requests reuse
+kept-alive (and, where ``h2`` is installed, multiplexed HTTP/2) connections
+instead of paying for a TCP and TLS handshake per call. Clients are created
+on startup, and closed on shutdown once in-flight requests have drained.
+"""
+
+import asyncio
+import importlib.util
+import logging
+from typing import Dict, Optional
+
+import httpx
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class _CountedStream(httpx.AsyncByteStream):
+    """Response body that reports back once it has been closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close):
+        self._stream = stream
+        self._on_close = on_close
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._on_close is not None:
+                self._on_close()
+                self._on_close = None
+
+
+class _DrainingTransport(httpx.AsyncHTTPTransport):
+    """Transport that counts in-flight requests so shutdown can wait for them."""
+
+    def __init__(self, registry: "HttpClientRegistry", **kwargs):
+        super().__init__(**kwargs)
+        self._registry = registry
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._registry._request_started()
+        try:
+            response = await super().handle_async_request(request)
+        except BaseException:
+            self._registry._request_finished()
+            raise
+        # A request is in flight until its body has been read and closed
+        response.stream = _CountedStream(response.stream, self._registry._request_finished)
+        return response
+
+
+class HttpClientRegistry:
+    """Named, pooled ``httpx.AsyncClient`` instances managed by the app lifespan."""
+
+    def __init__(
+        self,
+        max_connections: int = settings.HTTP_CLIENT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = settings.HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = settings.HTTP_CLIENT_KEEPALIVE_EXPIRY,
+        http2: bool = settings.HTTP_CLIENT_HTTP2,
+        drain_timeout: float = settings.HTTP_CLIENT_DRAIN_TIMEOUT,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2_requested = http2
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.drain_timeout = drain_timeout
+        self._configs: Dict[str, dict] = {}
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._in_flight = 0
+        self._drained: Optional[asyncio.Event] = None
+
+    def register(self, name: str, base_url: str = "", headers: Optional[Dict[str, str]] = None, timeout: float = 30.0):
+        """Declare a client; it is created on startup or first use."""
+        self._configs[name] = {"base_url": base_url, "headers": headers or {}, "timeout": timeout}
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        """Get the shared client for ``name``, creating it if needed."""
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            config = self._configs[name]
+            client = httpx.AsyncClient(
+                base_url=config["base_url"],
+                headers=config["headers"],
+                timeout=config["timeout"],
+                transport=_DrainingTransport(self, http2=self.http2, limits=self.limits),
+            )
+            self._clients[name] = client
+        return client
+
+    def start(self):
+        """Create every registered client up front."""
+        if self.http2_requested and not self.http2:
+            logger.warning("HTTP/2 requested but h2 is not installed, using HTTP/1.1")
+        for name in self._configs:
+            self.get(name)
+        logger.info(f"HTTP clients started: {', '.join(self._configs)} (http2={self.http2})")
+
+    async def close(self):
+        """Wait up to ``drain_timeout`` for in-flight requests, then close all clients."""
+        if self._in_flight:
+            logger.info(f"Draining {self._in_flight} in-flight HTTP requests")
+            self._drained = asyncio.Event()
+            try:
+                await asyncio.wait_for(self._drained.wait(), self.drain_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Closing HTTP clients with {self._in_flight} requests still in flight")
+            finally:
+                self._drained = None
+
+        clients, self._clients = list(self._clients.values()), {}
+        await asyncio.gather(*(client.aclose() for client in clients), return_exceptions=True)
+        logger.info("HTTP clients closed")
+
+    def _request_started(self):
+        self._in_flight += 1
+
+    def _request_finished(self):
+        self._in_flight -= 1
+        if self._in_flight == 0 and self._drained is not None:
+            self._drained.set()
+
+
+# Global HTTP client registry
+http_clients = HttpClientRegistry()
@@ -3,11 +3,12 @@ Jina Reader API client with retry mechanism.
 """
 
 import os
-import httpx
-import asyncio
 from typing import Optional
 import logging
 
+from .http_clients import http_clients
+from .rate_limiter import get_rate_limiter, send_rate_limited
+
 # logging.basicConfig(level=logging.INFO)
 
 
@@ -21,10 +22,13 @@ if not JINA_READER_TOKEN:
 
 # logging.info(f"Jina Reader API token is set. {JINA_READER_TOKEN}")
 
+http_clients.register("jina", headers={"Authorization": f"Bearer {JINA_READER_TOKEN}"})
+
 
 async def fetch_jina_reader_content(target_url: str, max_retries: int = 3, timeout: float = 10.0) -> Optional[str]:
     """
     Fetch content from Jina Reader API with retries.
+    Requests share the "jina" rate limiter, which also handles 429s and Retry-After.
     Args:
         target_url (str): The URL to fetch content for.
         max_retries (int): Number of retry attempts.
@@ -32,16 +36,15 @@ async def fetch_jina_reader_content(target_url: str, max_retries: int = 3, timeo
     Returns:
         Optional[str]: The extracted content, or None if failed.
     """
+    # The target URL is appended verbatim, so it cannot be a relative path on a base_url
     api_url = f"{JINA_READER_API}{target_url}"
-    headers = {"Authorization": f"Bearer {JINA_READER_TOKEN}"}
-    for attempt in range(1, max_retries + 1):
-        try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(api_url, headers=headers)
-                response.raise_for_status()
-                return response.text
-        except Exception as e:
-            if attempt == max_retries:
-                return None
-            await asyncio.sleep(2**attempt)  # Exponential backoff
-    return None
+    client = http_clients.get("jina")
+    try:
+        response = await send_rate_limited(
+            get_rate_limiter("jina"), lambda: client.get(api_url, timeout=timeout), max_retries=max_retries
+        )
+        response.raise_for_status()
+        return response.text
+    except Exception as e:
+        logging.warning(f"Jina Reader failed for {target_url}: {e}")
+        return None
@@ -0,0 +1,247 @@
+"""
+Durable background job queue.
+
+Jobs live in the ``article_jobs`` table, one per (kind, article), so enqueuing
+is idempotent and pending work survives restarts. Every process runs a pool of
+worker coroutines per job kind that claim due jobs from the table, retry
+failures with exponential backoff, and dead-letter jobs that keep failing
+after JOB_MAX_ATTEMPTS attempts. While a job runs its worker refreshes the
+lock every third of JOB_LOCK_TIMEOUT; jobs left running by a crashed process
+are returned to the queue once their lock is older than that, or
+dead-lettered if they already used up their attempts.
+
+On shutdown workers stop claiming jobs and running jobs get a grace period
+to finish their outbound requests; whatever is still running after it is
+cancelled and handed back to the queue.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import socket
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..core.config import settings
+from ..db.crud_rss import article_job
+from ..db.session import async_session_factory
+from ..models.rss import ArticleJob
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[int], Awaitable[None]]
+
+
+class JobQueue:
+    """Database-backed worker pool for per-article background jobs."""
+
+    def __init__(
+        self,
+        max_attempts: int = settings.JOB_MAX_ATTEMPTS,
+        retry_base_delay: int = settings.JOB_RETRY_BASE_DELAY,
+        retry_max_delay: int = settings.JOB_RETRY_MAX_DELAY,
+        poll_interval: float = settings.JOB_POLL_INTERVAL,
+        lock_timeout: int = settings.JOB_LOCK_TIMEOUT,
+    ):
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.poll_interval = poll_interval
+        self.lock_timeout = lock_timeout
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._handlers: Dict[str, Tuple[JobHandler, int]] = {}
+        self._wakeups: Dict[str, asyncio.Event] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._reaper_task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self._processed: Counter = Counter()
+        self._failed: Counter = Counter()
+
+    @property
+    def running(self) -> bool:
+        return self._reaper_task is not None
+
+    def register(self, kind: str, handler: JobHandler, concurrency: int):
+        """
+        Register the coroutine that processes jobs of ``kind``.
+
+        The handler receives the article id and signals failure by raising;
+        returning normally marks the job as done.
+        """
+        self._handlers[kind] = (handler, concurrency)
+
+    def start(self):
+        """Start the worker pools and the stale-lock reaper (idempotent)."""
+        if self.running:
+            return
+        self._stopping = False
+        for kind, (handler, concurrency) in self._handlers.items():
+            self._wakeups[kind] = asyncio.Event()
+            self._tasks.extend(
+                asyncio.create_task(self._worker(kind, handler), name=f"job-{kind}-{i}") for i in range(concurrency)
+            )
+        self._reaper_task = asyncio.create_task(self._reaper(), name="job-reaper")
+        logger.info(f"Job queue started: {', '.join(f'{k}x{c}' for k, (_, c) in self._handlers.items())}")
+
+    async def stop(self, drain_timeout: float = 0):
+        """
+        Stop all workers.
+
+        Workers stop claiming jobs at once, and jobs already running get up to
+        ``drain_timeout`` seconds to finish; the rest are cancelled and go
+        back to the queue.
+        """
+        self._stopping = True
+        for wakeup in self._wakeups.values():
+            wakeup.set()
+        if self._reaper_task is not None:
+            self._reaper_task.cancel()
+
+        pending = set(self._tasks)
+        if pending and drain_timeout > 0:
+            _, pending = await asyncio.wait(pending, timeout=drain_timeout)
+            if pending:
+                logger.warning(f"Cancelling {len(pending)} jobs still running after {drain_timeout}s")
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*self._tasks, *filter(None, [self._reaper_task]), return_exceptions=True)
+        self._tasks = []
+        self._reaper_task = None
+        self._wakeups = {}
+        logger.info("Job queue stopped")
+
+    async def enqueue(self, kind: str, article_ids: Iterable[int], requeue_dead: bool = False) -> int:
+        """Queue a job of ``kind`` for each article; returns how many were added."""
+        async with async_session_factory() as db:
+            job_ids = await article_job.enqueue(db, kind, list(article_ids), requeue_dead=requeue_dead)
+        if job_ids and kind in self._wakeups:
+            self._wakeups[kind].set()
+        return len(job_ids)
+
+    def retry_delay(self, attempts: int) -> float:
+        """Exponential backoff with jitter for the given number of attempts."""
+        delay = min(self.retry_max_delay, self.retry_base_delay * 2 ** max(attempts - 1, 0))
+        return delay * random.uniform(0.8, 1.2)
+
+    async def _worker(self, kind: str, handler: JobHandler):
+        while not self._stopping:
+            try:
+                async with async_session_factory() as db:
+                    jobs = await article_job.claim(db, kind, self.worker_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to claim {kind} job: {e}")
+                jobs = []
+
+            if not jobs:
+                await self._wait(kind)
+                continue
+            if self._stopping:
+                # Claimed while stop() was called: leave it to the next process
+                await self._release(jobs[0])
+                return
+            await self._run(jobs[0], handler)
+
+    async def _wait(self, kind: str):
+        """Sleep until the poll interval passes or a job of this kind is enqueued here."""
+        wakeup = self._wakeups[kind]
+        try:
+            await asyncio.wait_for(wakeup.wait(), self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            wakeup.clear()
+
+    async def _run(self, job: ArticleJob, handler: JobHandler):
+        try:
+            heartbeat = asyncio.create_task(self._heartbeat(job), name=f"job-{job.kind}-{job.id}-heartbeat")
+            try:
+                await handler(job.article_id)
+            finally:
+                heartbeat.cancel()
+        except asyncio.CancelledError:
+            # Shutting down: hand the job back instead of waiting for the lock to expire
+            await asyncio.shield(self._release(job))
+            raise
+        except Exception as e:
+            self._failed[job.kind] += 1
+            await self._fail(job, f"{type(e).__name__}: {e}")
+        else:
+            self._processed[job.kind] += 1
+            async with async_session_factory() as db:
+                await article_job.complete(db, job.id)
+
+    async def _heartbeat(self, job: ArticleJob):
+        """Keep the job's lock fresh so the reaper does not hand it to another worker."""
+        while True:
+            await asyncio.sleep(self.lock_timeout / 3)
+            try:
+                async with async_session_factory() as db:
+                    if not await article_job.heartbeat(db, job.id, self.worker_id):
+                        logger.warning(f"{job.kind} job {job.id} lost its lock while running")
+                        return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Failed to refresh the lock of {job.kind} job {job.id}: {e}")
+
+    async def _fail(self, job: ArticleJob, error: str):
+        retry_at: Optional[datetime] = None
+        if job.attempts < self.max_attempts:
+            retry_at = datetime.utcnow() + timedelta(seconds=self.retry_delay(job.attempts))
+            logger.warning(
+                f"{job.kind} job for article {job.article_id} failed "
+                f"(attempt {job.attempts}/{self.max_attempts}), retrying: {error}"
+            )
+        else:
+            logger.error(f"{job.kind} job for article {job.article_id} dead-lettered after {job.attempts} attempts: {error}")
+        try:
+            async with async_session_factory() as db:
+                await article_job.fail(db, job.id, error, retry_at)
+        except Exception as e:
+            logger.error(f"Failed to record failure of {job.kind} job {job.id}: {e}")
+
+    async def _release(self, job: ArticleJob):
+        try:
+            async with async_session_factory() as db:
+                await article_job.release(db, job.id)
+        except Exception as e:
+            logger.warning(f"Failed to release {job.kind} job {job.id}: {e}")
+
+    async def _reaper(self):
+        while True:
+            try:
+                async with async_session_factory() as db:
+                    released, dead = await article_job.release_stale(db, self.lock_timeout, self.max_attempts)
+                if released:
+                    logger.warning(f"Returned {released} abandoned jobs to the queue")
+                if dead:
+                    logger.error(f"Dead-lettered {dead} abandoned jobs that were out of attempts")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to release abandoned jobs: {e}")
+            await asyncio.sleep(max(self.lock_timeout / 2, 1))
+
+    async def get_stats(self) -> dict:
+        """Queue depth and throughput per job kind, plus this process's counters."""
+        async with async_session_factory() as db:
+            queues = await article_job.get_stats(db)
+        for kind, stats in queues.items():
+            stats["throughput_per_minute"] = round(stats["completed_last_5m"] / 5, 2)
+        for kind, (_, concurrency) in self._handlers.items():
+            queues.setdefault(kind, {})["workers"] = concurrency if self.running else 0
+        return {
+            "worker_id": self.worker_id,
+            "running": self.running,
+            "queues": queues,
+            "processed_by_this_worker": dict(self._processed),
+            "failed_by_this_worker": dict(self._failed),
+        }
+
+
+# Global job queue instance
+job_queue = JobQueue()
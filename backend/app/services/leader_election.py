@@ -0,0 +1,188 @@
+"""
+Leader election across uvicorn workers and hosts.
+
+Every worker runs the scheduler, but only the current leader executes
+scheduled jobs. Leadership is a lease that the leader renews on a heartbeat;
+if the leader dies or loses its backend, the lease lapses and another process
+takes over on its next heartbeat.
+
+Backends:
+- ``redis``: ``SET NX PX`` on a shared key through the existing ``Cache``
+  client, renewed and released with compare-and-set scripts.
+- ``postgres``: a session-level advisory lock held on a dedicated connection;
+  Postgres releases it as soon as that connection dies.
+- ``local``: single-process deployments (e.g. SQLite in development) are
+  always leader.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+import zlib
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from ..core.cache import cache
+from ..core.config import settings
+from ..db.session import engine
+
+logger = logging.getLogger(__name__)
+
+# Renew the lease only if we still own it
+RENEW_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("pexpire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# Release the lease only if we still own it
+RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class LeaderElection:
+    """Lease-based leader election with a heartbeat and automatic failover."""
+
+    def __init__(
+        self,
+        name: str = "scheduler",
+        backend: str = settings.LEADER_ELECTION_BACKEND,
+        ttl: int = settings.LEADER_LOCK_TTL,
+        heartbeat_interval: int = settings.LEADER_HEARTBEAT_INTERVAL,
+    ):
+        self.name = name
+        self.requested_backend = backend
+        self.backend: Optional[str] = None
+        self.ttl = ttl
+        self.heartbeat_interval = heartbeat_interval
+        self.instance_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.key = f"leader:{name}"
+        self._lease_expires_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._pg_conn: Optional[AsyncConnection] = None
+
+    @property
+    def is_leader(self) -> bool:
+        """True while this process holds an unexpired lease."""
+        return time.monotonic() < self._lease_expires_at
+
+    def _resolve_backend(self) -> str:
+        if self.requested_backend != "auto":
+            return self.requested_backend
+        if cache.client is not None:
+            return "redis"
+        if engine.dialect.name == "postgresql":
+            return "postgres"
+        return "local"
+
+    async def start(self):
+        """Start campaigning for leadership in the background."""
+        if self._task:
+            return
+        self.backend = self._resolve_backend()
+        logger.info(f"Leader election for {self.name} using {self.backend} backend as {self.instance_id}")
+        # Try once right away so a single worker becomes leader before the first tick
+        await self._heartbeat()
+        self._task = asyncio.create_task(self._run(), name=f"leader-election-{self.name}")
+
+    async def stop(self):
+        """Stop campaigning and release leadership if held."""
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        try:
+            await self._release()
+        except Exception as e:
+            logger.warning(f"Failed to release {self.name} leadership: {e}")
+        self._lease_expires_at = 0.0
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            await self._heartbeat()
+
+    async def _heartbeat(self):
+        was_leader = self.is_leader
+        # Start the lease clock before talking to the backend so our view of
+        # the lease never outlives the backend's
+        started_at = time.monotonic()
+        try:
+            if self.backend == "redis":
+                acquired = await self._redis_heartbeat(was_leader)
+            elif self.backend == "postgres":
+                acquired = await self._postgres_heartbeat()
+            else:
+                acquired = True
+        except Exception as e:
+            logger.error(f"Leader election heartbeat for {self.name} failed: {e}")
+            acquired = False
+
+        if acquired:
+            self._lease_expires_at = started_at + self.ttl
+            if not was_leader:
+                logger.info(f"{self.instance_id} became {self.name} leader")
+        else:
+            self._lease_expires_at = 0.0
+            if was_leader:
+                logger.warning(f"{self.instance_id} lost {self.name} leadership")
+
+    async def _redis_heartbeat(self, was_leader: bool) -> bool:
+        client = cache.client
+        if client is None:
+            return False
+        ttl_ms = self.ttl * 1000
+        if was_leader and await client.eval(RENEW_SCRIPT, 1, self.key, self.instance_id, ttl_ms):
+            return True
+        return bool(await client.set(self.key, self.instance_id, nx=True, px=ttl_ms))
+
+    async def _postgres_heartbeat(self) -> bool:
+        if self._pg_conn is not None:
+            try:
+                # The lock lives as long as this connection does
+                await self._pg_conn.execute(text("SELECT 1"))
+                await self._pg_conn.commit()
+                return True
+            except Exception:
+                await self._close_pg_conn()
+                raise
+
+        conn = await engine.connect()
+        lock_id = zlib.crc32(self.key.encode())
+        result = await conn.execute(text("SELECT pg_try_advisory_lock(:lock_id)"), {"lock_id": lock_id})
+        if result.scalar():
+            # Commit so the pool does not roll back the connection underneath us
+            await conn.commit()
+            self._pg_conn = conn
+            return True
+        await conn.close()
+        return False
+
+    async def _release(self):
+        if self.backend == "redis" and cache.client is not None and self.is_leader:
+            await cache.client.eval(RELEASE_SCRIPT, 1, self.key, self.instance_id)
+        elif self.backend == "postgres":
+            await self._close_pg_conn()
+
+    async def _close_pg_conn(self):
+        if self._pg_conn is not None:
+            try:
+                # Returning the connection to the pool would keep the session (and lock) alive
+                await self._pg_conn.invalidate()
+                await self._pg_conn.close()
+            finally:
+                self._pg_conn = None
+
+
+# Global scheduler leader election instance
+leader_election = LeaderElection()
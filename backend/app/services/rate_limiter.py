@@ -0,0 +1,225 @@
+"""
+Token-bucket rate limiting for outbound API providers.
+
+Every call to a metered provider (Jina Reader, OpenRouter) first takes a token
+from that provider's bucket, so all callers share one budget and run as fast
+as the quota allows instead of sleeping for fixed intervals. A 429 response
+empties the bucket and pauses the provider for its ``Retry-After``.
+
+The bucket state lives in Redis and each take is one atomic script call, so
+every worker process draws from the same budget. While Redis is unavailable
+each process falls back to its own in-memory bucket, and the configured
+budget then applies per process.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, Optional
+
+import httpx
+
+from ..core.cache import cache
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Server errors worth retrying; 429 is handled by pausing the bucket instead
+RETRY_STATUS_CODES = {500, 502, 503, 504}
+
+KEY_PREFIX = "ratelimit:"
+
+# Take a token from the shared bucket. Returns 0 when one was taken, otherwise
+# the milliseconds to wait before trying again. Times come from the Redis
+# clock so every process refills the bucket the same way.
+TAKE_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at', 'paused_until')
+local tokens = tonumber(state[1]) or capacity
+local updated_at = tonumber(state[2]) or now
+local paused_until = tonumber(state[3]) or 0
+if now < paused_until then
+    return paused_until - now
+end
+tokens = math.min(capacity, tokens + math.max(now - updated_at, 0) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.ceil((1 - tokens) / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', now, 'paused_until', paused_until)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate) + 1000)
+return wait
+"""
+
+# Empty the shared bucket and block takes for ARGV[1] milliseconds
+PAUSE_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local paused_until = math.max(tonumber(redis.call('HGET', KEYS[1], 'paused_until')) or 0, now + tonumber(ARGV[1]))
+redis.call('HSET', KEYS[1], 'tokens', 0, 'updated_at', paused_until, 'paused_until', paused_until)
+redis.call('PEXPIRE', KEYS[1], paused_until - now + math.ceil(tonumber(ARGV[2]) / tonumber(ARGV[3])) + 1000)
+return paused_until - now
+"""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class TokenBucket:
+    """
+    Async token bucket refilled continuously at ``requests_per_minute``.
+
+    Shared by all processes through Redis when the cache is up, with a
+    per-process bucket as the fallback.
+    """
+
+    def __init__(self, name: str, requests_per_minute: float, burst: int):
+        self.name = name
+        self.rate = requests_per_minute / 60.0
+        self.capacity = max(burst, 1)
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._shared_failed = False
+
+    @property
+    def key(self) -> str:
+        return KEY_PREFIX + self.name
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self):
+        """Wait for a token; waiters are served in arrival order."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                wait = await self._take_shared()
+                if wait is None:
+                    wait = self._take_local(time.monotonic())
+                if wait <= 0:
+                    return
+                await asyncio.sleep(wait)
+
+    def _take_local(self, now: float) -> float:
+        """Take a token from this process's bucket; returns the seconds to wait if there is none."""
+        if now < self._paused_until:
+            return self._paused_until - now
+        self._refill(now)
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    async def _take_shared(self) -> Optional[float]:
+        """Take a token from the Redis bucket; None when Redis cannot be used."""
+        client = cache.client
+        if client is None:
+            return None
+        try:
+            wait_ms = await client.eval(TAKE_SCRIPT, 1, self.key, self.rate / 1000, self.capacity)
+        except Exception as e:
+            if not self._shared_failed:
+                logger.warning(f"Shared {self.name} rate limit unavailable, limiting per process: {e}")
+                self._shared_failed = True
+            return None
+        self._shared_failed = False
+        return int(wait_ms) / 1000
+
+    async def pause(self, seconds: Optional[float] = None):
+        """
+        Back off after a 429: drop all tokens and block callers for ``seconds``
+        (the provider's Retry-After), or for one token interval if unknown.
+        """
+        delay = seconds if seconds is not None else 1 / self.rate
+        now = time.monotonic()
+        self._paused_until = max(self._paused_until, now + delay)
+        self._tokens = 0.0
+        self._updated_at = self._paused_until
+        logger.warning(f"{self.name} rate limited, pausing requests for {delay:.1f}s")
+
+        client = cache.client
+        if client is not None:
+            try:
+                await client.eval(PAUSE_SCRIPT, 1, self.key, int(delay * 1000), self.capacity, self.rate / 1000)
+            except Exception as e:
+                logger.warning(f"Failed to pause the shared {self.name} rate limit: {e}")
+
+
+async def send_rate_limited(
+    limiter: TokenBucket,
+    send: Callable[[], Awaitable[httpx.Response]],
+    max_retries: int = 3,
+    max_delay: float = settings.OUTBOUND_RETRY_MAX_DELAY,
+) -> httpx.Response:
+    """
+    Send a request through ``limiter``, retrying 429s, 5xx and transport errors.
+
+    Every 429, including the last one, pauses the bucket for all callers;
+    429s are retried as soon as the paused bucket hands out a token. Other
+    failures back off exponentially, or for the server's Retry-After, at
+    most ``max_delay`` seconds. Returns the last response, which may still
+    be an error, or raises the last transport error.
+    """
+    attempt = 0
+    while True:
+        attempt += 1
+        await limiter.acquire()
+        try:
+            response = await send()
+        except httpx.TransportError as e:
+            if attempt >= max_retries:
+                raise
+            logger.warning(f"{limiter.name} request failed: {e}, retrying (attempt {attempt})")
+            await asyncio.sleep(2 ** (attempt - 1))
+            continue
+
+        if response.status_code == 429:
+            await limiter.pause(parse_retry_after(response.headers.get("retry-after")))
+        if attempt >= max_retries:
+            return response
+        if response.status_code == 429:
+            continue
+        if response.status_code in RETRY_STATUS_CODES:
+            retry_after = parse_retry_after(response.headers.get("retry-after"))
+            logger.warning(f"{limiter.name} returned {response.status_code}, retrying (attempt {attempt})")
+            await asyncio.sleep(min(retry_after if retry_after is not None else 2 ** (attempt - 1), max_delay))
+            continue
+        return response
+
+
+# One bucket per provider, shared by every caller in every process
+rate_limiters: Dict[str, TokenBucket] = {
+    "jina": TokenBucket("jina", settings.JINA_REQUESTS_PER_MINUTE, settings.JINA_REQUEST_BURST),
+    "openrouter": TokenBucket(
+        "openrouter", settings.OPENROUTER_REQUESTS_PER_MINUTE, settings.OPENROUTER_REQUEST_BURST
+    ),
+}
+
+
+def get_rate_limiter(provider: str) -> TokenBucket:
+    return rate_limiters[provider]
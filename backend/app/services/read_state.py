@@ -0,0 +1,159 @@
+"""
+Per-user read-state index.
+
+Each user's read article ids are kept in a Redis set, so "which of these
+articles has the user read?" is one round trip of O(1) membership checks
+instead of a query returning the user's whole reading history. The
+``user_read_articles`` table stays the source of truth: a user's set is built
+from it on first use, kept in sync by mark/unmark, and dropped after
+READ_STATE_TTL without activity. Without Redis, lookups go to the table.
+
+Every mark/unmark bumps the user's version counter, and a build only
+replaces the set if the version is unchanged since it read the table, so a
+read state changed mid-build is never overwritten with the older snapshot.
+"""
+
+import logging
+import uuid
+from typing import Dict, Iterable, List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.cache import cache
+from ..core.config import settings
+from ..models.user_read_articles import UserReadArticle
+
+logger = logging.getLogger(__name__)
+
+READ_STATE_PREFIX = "read:"
+
+# Member added once a set has been built from the table; it also keeps a user
+# with nothing read from looking unbuilt. Article ids are integers, so never one of them.
+LOADED_MARKER = ""
+
+LOAD_BATCH_SIZE = 1000
+
+# KEYS: set, version. ARGV: SADD or SREM, ttl, article ids.
+# Applied to a built set; an unbuilt one is dropped rather than half-filled.
+UPDATE_SCRIPT = """
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+if redis.call('SISMEMBER', KEYS[1], '') == 1 then
+    redis.call(ARGV[1], KEYS[1], unpack(ARGV, 3))
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+else
+    redis.call('DEL', KEYS[1])
+end
+return 1
+"""
+
+# KEYS: set, version, staged build. ARGV: version before the build read the table, ttl.
+# Installs the staged set only if no mark/unmark happened since.
+INSTALL_BUILD_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '') ~= ARGV[1] then
+    redis.call('DEL', KEYS[3])
+    return 0
+end
+redis.call('SADD', KEYS[3], '')
+redis.call('RENAME', KEYS[3], KEYS[1])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+
+class ReadStateIndex:
+    """Redis set of read article ids per user, backed by user_read_articles."""
+
+    def __init__(self, ttl: int = settings.READ_STATE_TTL):
+        self.ttl = ttl
+
+    def _key(self, user_id: int) -> str:
+        return f"{READ_STATE_PREFIX}{user_id}"
+
+    def _version_key(self, user_id: int) -> str:
+        return f"{READ_STATE_PREFIX}{user_id}:version"
+
+    async def mark(self, user_id: int, *article_ids: int):
+        """Record reads already committed to the table."""
+        await self._update(user_id, "SADD", article_ids)
+
+    async def unmark(self, user_id: int, *article_ids: int):
+        """Forget reads already deleted from the table."""
+        await self._update(user_id, "SREM", article_ids)
+
+    async def flags(self, db: AsyncSession, user_id: int, article_ids: Iterable[int]) -> Dict[int, bool]:
+        """Map each of ``article_ids`` to whether the user has read it."""
+        article_ids = list(dict.fromkeys(article_ids))
+        if not article_ids:
+            return {}
+
+        client = cache.client
+        if client is not None:
+            key = self._key(user_id)
+            try:
+                async with client.pipeline(transaction=False) as pipe:
+                    pipe.sismember(key, LOADED_MARKER)
+                    for article_id in article_ids:
+                        pipe.sismember(key, article_id)
+                    loaded, *members = await pipe.execute()
+                if loaded:
+                    return {article_id: bool(member) for article_id, member in zip(article_ids, members)}
+                read = set(await self._build(db, user_id))
+                return {article_id: article_id in read for article_id in article_ids}
+            except Exception as e:
+                logger.error(f"Read-state lookup failed for user {user_id}, using the database: {e}")
+
+        result = await db.execute(
+            select(UserReadArticle.article_id).where(
+                UserReadArticle.user_id == user_id, UserReadArticle.article_id.in_(article_ids)
+            )
+        )
+        read = set(result.scalars().all())
+        return {article_id: article_id in read for article_id in article_ids}
+
+    async def _build(self, db: AsyncSession, user_id: int) -> List[int]:
+        """Fill the user's set from the table and return every read id."""
+        client = cache.client
+        key, version_key = self._key(user_id), self._version_key(user_id)
+        # Read before the table, so any change committed after the SELECT bumps it
+        version = await client.get(version_key)
+        result = await db.execute(select(UserReadArticle.article_id).where(UserReadArticle.user_id == user_id))
+        article_ids = list(result.scalars().all())
+
+        # Staged under its own key so a large set is installed in one step
+        staging_key = f"{key}:build:{uuid.uuid4().hex}"
+        async with client.pipeline(transaction=False) as pipe:
+            for start in range(0, len(article_ids), LOAD_BATCH_SIZE):
+                pipe.sadd(staging_key, *article_ids[start:start + LOAD_BATCH_SIZE])
+            pipe.expire(staging_key, 60)
+            await pipe.execute()
+        installed = await client.eval(
+            INSTALL_BUILD_SCRIPT, 3, key, version_key, staging_key, version or "", self.ttl
+        )
+        if installed:
+            logger.debug(f"Built read-state set for user {user_id} with {len(article_ids)} articles")
+        else:
+            logger.debug(f"Discarded read-state build for user {user_id}, changed while building")
+        return article_ids
+
+    async def _update(self, user_id: int, command: str, article_ids):
+        client = cache.client
+        if client is None or not article_ids:
+            return
+        key = self._key(user_id)
+        article_ids = list(article_ids)
+        try:
+            for start in range(0, len(article_ids), LOAD_BATCH_SIZE):
+                await client.eval(
+                    UPDATE_SCRIPT, 2, key, self._version_key(user_id),
+                    command, self.ttl, *article_ids[start:start + LOAD_BATCH_SIZE],
+                )
+        except Exception as e:
+            # The set would now disagree with the table; drop it so it is rebuilt
+            logger.error(f"Failed to update read-state for user {user_id}: {e}")
+            await cache.delete(key)
+
+
+# Global read-state index
+read_state = ReadStateIndex()
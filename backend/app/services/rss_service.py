@@ -1,108 +1,176 @@
 import asyncio
 import logging
+import random
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import feedparser
-import requests
-from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util.retry import Retry
-from bs4 import BeautifulSoup
+import httpx
+from ..core.config import settings
+from ..core.route_cache import invalidate_tags, article_tag, ARTICLES_TAG, FEEDS_TAG
 from ..db.session import async_session_factory
-from ..db.crud_rss import rss_feed, rss_article, RssArticleCreate
+from ..db.crud_rss import rss_feed, rss_article, article_body, RssArticleCreate
 from ..models.rss import RssFeed
+from .article_extractor import extract_main_text
+from .article_stream import article_stream
+from .feed_fetcher import feed_fetcher
+from .job_queue import job_queue
 from .jina_reader import fetch_jina_reader_content
 from .summarize_service import summarize_content
 import time
 
 logger = logging.getLogger(__name__)
 
+# Background job kinds, run in this order for every new article; the Jina
+# crawl only runs for pages whose text could not be extracted directly
+EXTRACT_JOB = "extract"
+CRAWL_JOB = "crawl"
+SUMMARIZE_JOB = "summarize"
+
+
+def _is_dns_error(error: Exception) -> bool:
+    message = str(error)
+    return (
+        "Failed to resolve" in message
+        or "nodename nor servname" in message
+        or "Name or service not known" in message
+        or "Temporary failure in name resolution" in message
+    )
+
+
+def plan_next_fetch(
+    feed: RssFeed, new_articles: int, now: datetime, failed: bool = False
+) -> Tuple[int, datetime]:
+    """
+    Adapt a feed's polling interval to how often it actually publishes.
+
+    Returns ``(adaptive_interval, next_fetch_at)``. Items published since the
+    last fetch pull the interval towards the observed gap between items;
+    fetches with nothing new back off by 50%. Failures back off
+    exponentially without touching the learned interval. The result is kept
+    within RSS_MIN/MAX_FETCH_INTERVAL and jittered by +/-10% so feeds spread
+    out over time instead of firing on the same tick.
+    """
+    min_interval = settings.RSS_MIN_FETCH_INTERVAL
+    max_interval = settings.RSS_MAX_FETCH_INTERVAL
+    interval = feed.adaptive_interval or feed.fetch_interval or 3600
+
+    if failed:
+        delay = interval * 2 ** min(feed.error_count + 1, 6)
+    else:
+        if new_articles > 0 and feed.last_fetched:
+            last_fetched = feed.last_fetched.replace(tzinfo=None)
+            elapsed = max((now - last_fetched).total_seconds(), 0)
+            observed_gap = elapsed / new_articles
+            interval = int(0.5 * interval + 0.5 * observed_gap)
+        elif new_articles == 0 and feed.last_fetched:
+            interval = int(interval * 1.5)
+        interval = max(min_interval, min(max_interval, interval))
+        delay = interval
+
+    delay = max(min_interval, min(max_interval, delay))
+    jitter = random.uniform(-0.1, 0.1) * delay
+    return interval, now + timedelta(seconds=delay + jitter)
+
 
 class RssService:
     def __init__(self):
-        self.session_timeout = 30  # Increased timeout for DNS resolution
+        self.session_timeout = settings.RSS_FETCH_TIMEOUT
         self.max_articles_per_feed = 100
-        self.session = self._create_session()
-
-    def _create_session(self):
-        """Create a requests session with retry strategy and proper headers."""
-        session = requests.Session()
-
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=3,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"],
-            backoff_factor=1,
-        )
-
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-
-        # Set proper headers to avoid blocking
-        session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Accept": "application/rss+xml, application/xml, text/xml, */*",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept-Encoding": "gzip, deflate",
-                "Connection": "keep-alive",
-                "Cache-Control": "no-cache",
-            }
-        )
-
-        return session
+        self.fetcher = feed_fetcher
+        # Feeds are fetched concurrently, but the store phase needs a pooled DB
+        # connection, so keep it within the pool size instead of queueing on it.
+        self._store_limit = asyncio.Semaphore(settings.DATABASE_POOL_SIZE)
+        self._in_flight = set()
+
+    async def extract_article(self, article_id: int) -> None:
+        """
+        Extract stage: fetch the article page once and store its main text.
+
+        Runs as an ``extract`` job. Extracted text becomes the article body
+        and content and goes on to summarization; pages that fail to load or
+        yield no text (paywalls, script-rendered pages) are handed to the Jina
+        crawl instead, so each page is fetched by one stage only.
+        """
+        async with async_session_factory() as db:
+            article = await rss_article.get(db, article_id)
+        if not article or not article.link:
+            return
+        if article.is_crawled:
+            logger.info(f"Article {article_id} already crawled")
+            return
 
-    async def crawl_article_with_jina(self, article_id: int) -> bool:
-        """Crawl article content using Jina Reader and update the database."""
         try:
-            async with async_session_factory() as db:
-                # Get the article
-                article = await rss_article.get(db, article_id)
-                if not article:
-                    logger.error(f"Article {article_id} not found")
-                    return False
-
-                if article.is_crawled:
-                    logger.info(f"Article {article_id} already crawled")
-                    return True
-
-                logger.info(f"Starting Jina Reader crawling for article {article_id}: {article.title}")
-
-                # Fetch content using Jina Reader
-                crawled_content = await fetch_jina_reader_content(article.link)
-
-                if not crawled_content:
-                    logger.warning(f"Failed to crawl content for article {article_id}")
-                    return False
-
-                # Generate summary if content is available
-                summary = None
-                try:
-                    summary = await summarize_content(crawled_content) if crawled_content else None
-                except Exception as e:
-                    logger.warning(f"Failed to generate summary for article {article_id}: {e}")
-
-                # Update article with crawled content
-                update_data = {
-                    "crawled_content": crawled_content,
-                    "crawled_html": crawled_content,  # For now, store the same content
-                    "is_crawled": True,
-                }
-
-                # If summary is available, use it as the content
-                if summary:
-                    update_data["content"] = summary
-                    logger.info(f"Generated summary for article {article_id}")
-
-                await rss_article.update(db, db_obj=article, obj_in=update_data)
-                logger.info(f"Successfully crawled and updated article {article_id}")
-
-                return True
-
-        except Exception as e:
-            logger.error(f"Error crawling article {article_id} with Jina Reader: {e}")
-            return False
+            response = await self.fetcher.get(article.link)
+            response.raise_for_status()
+            content = await asyncio.to_thread(extract_main_text, response.text)
+        except httpx.HTTPError as e:
+            logger.info(f"Could not fetch article {article_id} directly, using Jina Reader: {e}")
+            content = ""
+        if not content:
+            await job_queue.enqueue(CRAWL_JOB, [article_id])
+            return
+
+        async with async_session_factory() as db:
+            article = await rss_article.get(db, article_id)
+            if not article:
+                return
+            await article_body.store(db, article_id, content, html=response.text)
+            await rss_article.update(db, db_obj=article, obj_in={"content": content})
+        await invalidate_tags(ARTICLES_TAG, article_tag(article_id))
+        logger.info(f"Extracted article body for {article_id}")
+
+        await job_queue.enqueue(SUMMARIZE_JOB, [article_id])
+
+    async def crawl_article(self, article_id: int) -> None:
+        """
+        Crawl stage: fetch the article through Jina Reader and store it.
+
+        Runs as a ``crawl`` job; raising makes the job queue retry it. A
+        successful crawl queues the article for summarization.
+        """
+        async with async_session_factory() as db:
+            article = await rss_article.get(db, article_id)
+        if not article:
+            logger.warning(f"Article {article_id} no longer exists, skipping crawl")
+            return
+        if article.is_crawled:
+            logger.info(f"Article {article_id} already crawled")
+            return
+
+        logger.info(f"Starting Jina Reader crawling for article {article_id}: {article.title}")
+        crawled_content = await fetch_jina_reader_content(article.link)
+        if not crawled_content:
+            raise RuntimeError(f"Jina Reader returned no content for {article.link}")
+
+        async with async_session_factory() as db:
+            if not await rss_article.get(db, article_id):
+                return
+            # Jina Reader returns markdown only, so there is no separate HTML to keep
+            await article_body.store(db, article_id, crawled_content)
+        await invalidate_tags(article_tag(article_id))
+        logger.info(f"Successfully crawled article {article_id}")
+
+        await job_queue.enqueue(SUMMARIZE_JOB, [article_id])
+
+    async def summarize_article(self, article_id: int) -> None:
+        """Summarize stage: replace the article content with a summary of the crawled text."""
+        async with async_session_factory() as db:
+            body = await article_body.get_body(db, article_id)
+        if not body:
+            logger.warning(f"Article {article_id} has no crawled content to summarize")
+            return
+
+        summary = await summarize_content(body[0])
+        if not summary:
+            raise RuntimeError(f"No summary generated for article {article_id}")
+
+        async with async_session_factory() as db:
+            article = await rss_article.get(db, article_id)
+            if not article:
+                return
+            await rss_article.update(db, db_obj=article, obj_in={"content": summary})
+        await invalidate_tags(ARTICLES_TAG, article_tag(article_id))
+        logger.info(f"Generated summary for article {article_id}")
 
     async def validate_rss_url(self, rss_url: str) -> dict:
         """Validate an RSS URL by attempting to fetch and parse it."""
@@ -111,17 +179,17 @@ class RssService:
 
             # First, try a HEAD request to check if the URL is accessible
             try:
-                head_response = self.session.head(rss_url, timeout=10, allow_redirects=True)
+                head_response = await self.fetcher.head(rss_url, timeout=10)
                 logger.info(f"HEAD request status: {head_response.status_code}")
             except Exception as e:
                 logger.warning(f"HEAD request failed, continuing with GET: {e}")
 
             # Fetch the RSS content
-            response = self.session.get(rss_url, timeout=self.session_timeout)
+            response = await self.fetcher.get(rss_url, timeout=self.session_timeout)
             response.raise_for_status()
 
             # Try to parse as RSS
-            feed = feedparser.parse(response.content)
+            feed = await asyncio.to_thread(feedparser.parse, response.content)
 
             if feed.bozo and feed.bozo_exception:
                 return {
@@ -141,17 +209,17 @@ class RssService:
                 "status_code": response.status_code,
             }
 
-        except requests.exceptions.ConnectionError as e:
-            if "Failed to resolve" in str(e) or "nodename nor servname" in str(e):
+        except httpx.ConnectError as e:
+            if _is_dns_error(e):
                 return {
                     "valid": False,
                     "error": f"DNS resolution failed: Cannot resolve domain name. Please check the URL.",
                 }
             else:
                 return {"valid": False, "error": f"Connection failed: {str(e)}"}
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             return {"valid": False, "error": "Request timed out. The server may be slow or unresponsive."}
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             return {
                 "valid": False,
                 "error": f"HTTP error {e.response.status_code}: {e}",
@@ -160,46 +228,72 @@ class RssService:
         except Exception as e:
             return {"valid": False, "error": f"Validation failed: {str(e)}"}
 
-    async def fetch_rss_content(self, rss_url: str) -> List[dict]:
-        """Fetch and parse RSS content from a URL."""
+    def _raise_fetch_error(self, rss_url: str, e: Exception):
+        """Log a feed fetch failure and re-raise it with a user-facing message."""
+        if isinstance(e, httpx.ConnectError):
+            if _is_dns_error(e):
+                logger.error(f"DNS resolution failed for {rss_url}: {e}")
+                raise Exception(
+                    f"DNS resolution failed for {rss_url}. Please check the URL and your network connection."
+                )
+            logger.error(f"Connection error for {rss_url}: {e}")
+            raise Exception(f"Failed to connect to {rss_url}. The server may be down or unreachable.")
+        if isinstance(e, httpx.TimeoutException):
+            logger.error(f"Timeout error for {rss_url}: {e}")
+            raise Exception(f"Request timed out for {rss_url}. The server may be slow or unresponsive.")
+        if isinstance(e, httpx.HTTPStatusError):
+            logger.error(f"HTTP error for {rss_url}: {e}")
+            raise Exception(f"HTTP error {e.response.status_code} for {rss_url}: {e}")
+        if isinstance(e, httpx.RequestError):
+            logger.error(f"Request error for {rss_url}: {e}")
+            raise Exception(f"Request failed for {rss_url}: {e}")
+        logger.error(f"Unexpected error fetching RSS content from {rss_url}: {e}")
+        raise Exception(f"Failed to fetch RSS content from {rss_url}: {e}")
+
+    async def download_feed(
+        self, rss_url: str, etag: Optional[str] = None, last_modified: Optional[str] = None
+    ) -> httpx.Response:
+        """
+        Download a feed document, sending conditional GET validators when known.
+
+        A ``304 Not Modified`` response is returned as-is so callers can skip
+        parsing and deduplication entirely.
+        """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
         try:
             logger.info(f"Fetching RSS content from: {rss_url}")
 
-            # Use session to fetch RSS content with improved error handling
-            response = self.session.get(rss_url, timeout=self.session_timeout)
+            # Use the shared async client so a slow publisher never blocks the event loop
+            response = await self.fetcher.get(rss_url, headers=headers or None, timeout=self.session_timeout)
+            if response.status_code == 304:
+                logger.info(f"RSS feed not modified: {rss_url}")
+                return response
             response.raise_for_status()
 
             logger.info(f"Successfully fetched RSS content: {len(response.content)} bytes")
+            return response
+        except Exception as e:
+            self._raise_fetch_error(rss_url, e)
 
-            # Parse RSS feed
-            feed = feedparser.parse(response.content)
+    async def parse_feed(self, rss_url: str, document: bytes) -> List[dict]:
+        """Parse a downloaded feed document into article dicts."""
+        try:
+            # Parse RSS feed off the event loop
+            feed = await asyncio.to_thread(feedparser.parse, document)
 
             if feed.bozo:
                 logger.warning(f"RSS feed has issues: {rss_url} - {feed.bozo_exception}")
 
             articles = []
             for entry in feed.entries[: self.max_articles_per_feed]:
-                # Extract content
-                content = ""
-                link = entry.get("link", "")
-
-                if link:
-                    try:
-                        # Fetch full article content with session
-                        article_response = self.session.get(link, timeout=self.session_timeout)
-                        article_response.raise_for_status()
-                        soup = BeautifulSoup(article_response.text, "html.parser")
-
-                        # Try to find main content
-                        main_content = (
-                            soup.find("article") or soup.find("main") or soup.find("div", class_="content") or soup.body
-                        )
-
-                        if main_content:
-                            content = main_content.get_text(separator="\n", strip=True)
-                    except Exception as e:
-                        logger.warning(f"Failed to fetch article content from {link}: {e}")
-                        content = entry.get("summary", entry.get("description", ""))
+                # Full pages are fetched later by the extraction stage, for new articles only
+                description = entry.get("summary", entry.get("description", ""))
+                content = entry.content[0].get("value", "") if entry.get("content") else description
 
                 # Parse published date
                 published = None
@@ -212,54 +306,72 @@ class RssService:
                 articles.append(
                     {
                         "title": entry.get("title", ""),
-                        "link": link,
-                        "description": entry.get("summary", entry.get("description", "")),
+                        "link": entry.get("link", ""),
+                        "description": description,
                         "content": content,
                         "published": published,
-                        "guid": entry.get("id", entry.get("guid", "")),
+                        "guid": entry.get("id", entry.get("guid", "")) or None,
                         "author": entry.get("author", ""),
                     }
                 )
 
             return articles
 
-        except requests.exceptions.ConnectionError as e:
-            if "Failed to resolve" in str(e) or "nodename nor servname" in str(e):
-                logger.error(f"DNS resolution failed for {rss_url}: {e}")
-                raise Exception(
-                    f"DNS resolution failed for {rss_url}. Please check the URL and your network connection."
-                )
-            else:
-                logger.error(f"Connection error for {rss_url}: {e}")
-                raise Exception(f"Failed to connect to {rss_url}. The server may be down or unreachable.")
-        except requests.exceptions.Timeout as e:
-            logger.error(f"Timeout error for {rss_url}: {e}")
-            raise Exception(f"Request timed out for {rss_url}. The server may be slow or unresponsive.")
-        except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP error for {rss_url}: {e}")
-            raise Exception(f"HTTP error {e.response.status_code} for {rss_url}: {e}")
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request error for {rss_url}: {e}")
-            raise Exception(f"Request failed for {rss_url}: {e}")
         except Exception as e:
-            logger.error(f"Unexpected error fetching RSS content from {rss_url}: {e}")
-            raise Exception(f"Failed to fetch RSS content from {rss_url}: {e}")
+            self._raise_fetch_error(rss_url, e)
+
+    async def fetch_rss_content(self, rss_url: str) -> List[dict]:
+        """Fetch and parse RSS content from a URL."""
+        response = await self.download_feed(rss_url)
+        return await self.parse_feed(rss_url, response.content)
+
+    def is_fetching(self, feed_id: int) -> bool:
+        """Whether this worker is currently fetching the given feed."""
+        return feed_id in self._in_flight
 
     async def fetch_and_store_feed(self, feed: RssFeed) -> int:
         """Fetch RSS content and store articles in database."""
+        # The cron sweep, the feed scheduler and manual triggers can all pick
+        # the same feed; only one fetch per feed runs at a time in a worker.
+        if feed.id in self._in_flight:
+            logger.info(f"Feed {feed.name} is already being fetched, skipping")
+            return 0
+        self._in_flight.add(feed.id)
+        try:
+            return await self._fetch_and_store_feed(feed)
+        finally:
+            self._in_flight.discard(feed.id)
+
+    async def _fetch_and_store_feed(self, feed: RssFeed) -> int:
         stored_count = 0
         error_message = None
-        new_article_ids = []  # Track new articles for auto-crawling
+        new_article_ids: List[int] = []  # Track new articles for auto-crawling
 
         try:
-            # Fetch RSS content
-            articles = await self.fetch_rss_content(feed.url)
+            # Conditional GET: unchanged feeds cost one request and no parsing
+            response = await self.download_feed(feed.url, etag=feed.etag, last_modified=feed.last_modified)
+            not_modified = response.status_code == 304
+            # A 304 may omit validators, in which case the stored ones stay valid
+            validators = {
+                "etag": response.headers.get("etag") or (feed.etag if not_modified else None),
+                "last_modified": response.headers.get("last-modified") or (feed.last_modified if not_modified else None),
+            }
 
-            async with async_session_factory() as db:
-                for article_data in articles:
-                    try:
-                        # Create article data
-                        article_create = RssArticleCreate(
+            if not_modified:
+                now = datetime.utcnow()
+                async with self._store_limit, async_session_factory() as db:
+                    await rss_feed.update_fetch_status(
+                        db, feed.id, now, validators=validators, schedule=plan_next_fetch(feed, 0, now)
+                    )
+                return 0
+
+            articles = await self.parse_feed(feed.url, response.content)
+
+            article_creates = []
+            for article_data in articles:
+                try:
+                    article_creates.append(
+                        RssArticleCreate(
                             feed_id=feed.id,
                             title=article_data["title"],
                             link=article_data["link"],
@@ -270,61 +382,72 @@ class RssService:
                             author=article_data["author"],
                             category=feed.category,
                         )
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to prepare article {article_data.get('title', 'Unknown')}: {e}")
+
+            async with self._store_limit, async_session_factory() as db:
+                # One INSERT ... ON CONFLICT DO NOTHING for the whole feed
+                new_article_ids = await rss_article.bulk_create_if_not_exists(db, article_creates)
+                stored_count = len(new_article_ids)
+                logger.info(f"Stored {stored_count} new articles from {feed.name}")
+
+                # Update feed status, remember validators for the next conditional GET,
+                # and schedule the next fetch from how much was new
+                now = datetime.utcnow()
+                await rss_feed.update_fetch_status(
+                    db, feed.id, now, error_message, validators, plan_next_fetch(feed, stored_count, now)
+                )
 
-                        # Create article if it doesn't exist
-                        article = await rss_article.create_if_not_exists(db, article_create)
-                        if article:
-                            stored_count += 1
-                            new_article_ids.append(article.id)
-                            logger.info(f"Stored new article {article.id}: {article.title}")
-
-                    except Exception as e:
-                        logger.error(f"Failed to store article {article_data.get('title', 'Unknown')}: {e}")
-                        continue
+            if new_article_ids:
+                await invalidate_tags(ARTICLES_TAG, FEEDS_TAG)
 
-                # Update feed status
-                await rss_feed.update_fetch_status(db, feed.id, datetime.utcnow(), error_message)
+                # Push the new articles to /rss/stream clients on every worker
+                await article_stream.publish_articles(new_article_ids)
 
-            # Auto-crawl new articles in background
-            if new_article_ids:
-                logger.info(f"Starting auto-crawling for {len(new_article_ids)} new articles from {feed.name}")
-                # Schedule crawling tasks without awaiting them (fire and forget)
-                for article_id in new_article_ids:
-                    asyncio.create_task(self.crawl_article_with_jina(article_id))
-                    await asyncio.sleep(5)
+                # Queue body extraction (and, after it, the summary) for each new article
+                queued = await job_queue.enqueue(EXTRACT_JOB, new_article_ids)
+                logger.info(f"Queued {queued} new articles from {feed.name} for extraction")
 
         except Exception as e:
             error_message = str(e)
             logger.error(f"Failed to fetch feed {feed.name}: {e}")
 
-            async with async_session_factory() as db:
-                await rss_feed.update_fetch_status(db, feed.id, datetime.utcnow(), error_message)
+            now = datetime.utcnow()
+            async with self._store_limit, async_session_factory() as db:
+                await rss_feed.update_fetch_status(
+                    db, feed.id, now, error_message, schedule=plan_next_fetch(feed, 0, now, failed=True)
+                )
 
         return stored_count
 
     async def fetch_all_due_feeds(self) -> dict:
-        """Fetch all feeds that are due for update."""
+        """Fetch all feeds that are due for update, concurrently."""
         results = {"total_feeds": 0, "successful_feeds": 0, "failed_feeds": 0, "total_articles": 0, "errors": []}
 
         try:
             async with async_session_factory() as db:
                 # Get feeds that need fetching
                 feeds = await rss_feed.get_feeds_to_fetch(db)
-                results["total_feeds"] = len(feeds)
-
-                for feed in feeds:
-                    try:
-                        logger.info(f"Fetching feed: {feed.name}")
-                        article_count = await self.fetch_and_store_feed(feed)
-                        results["total_articles"] += article_count
-                        results["successful_feeds"] += 1
-                        logger.info(f"Successfully fetched {article_count} articles from {feed.name}")
-
-                    except Exception as e:
-                        results["failed_feeds"] += 1
-                        error_msg = f"Failed to fetch {feed.name}: {str(e)}"
-                        results["errors"].append(error_msg)
-                        logger.error(error_msg)
+            results["total_feeds"] = len(feeds)
+
+            # HTTP concurrency is bounded globally and per host by the fetcher,
+            # so every due feed can be started at once.
+            logger.info(f"Fetching {len(feeds)} due feeds concurrently")
+            outcomes = await asyncio.gather(
+                *(self.fetch_and_store_feed(feed) for feed in feeds), return_exceptions=True
+            )
+
+            for feed, outcome in zip(feeds, outcomes):
+                if isinstance(outcome, Exception):
+                    results["failed_feeds"] += 1
+                    error_msg = f"Failed to fetch {feed.name}: {str(outcome)}"
+                    results["errors"].append(error_msg)
+                    logger.error(error_msg)
+                else:
+                    results["total_articles"] += outcome
+                    results["successful_feeds"] += 1
+                    logger.info(f"Successfully fetched {outcome} articles from {feed.name}")
 
         except Exception as e:
             logger.error(f"Failed to fetch due feeds: {e}")
@@ -351,3 +474,7 @@ class RssService:
 
 # Global RSS service instance
 rss_service = RssService()
+
+job_queue.register(EXTRACT_JOB, rss_service.extract_article, settings.JOB_EXTRACT_CONCURRENCY)
+job_queue.register(CRAWL_JOB, rss_service.crawl_article, settings.JOB_CRAWL_CONCURRENCY)
+job_queue.register(SUMMARIZE_JOB, rss_service.summarize_article, settings.JOB_SUMMARIZE_CONCURRENCY)
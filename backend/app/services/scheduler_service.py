@@ -11,6 +11,9 @@ from ..db.session import async_session_factory
 from ..db.crud_rss import cron_job, CronJobCreate, CronJobUpdate
 from ..models.rss import CronJob
 from .rss_service import rss_service
+from .leader_election import leader_election
+from .feed_scheduler import feed_scheduler
+from ..core.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +48,13 @@ class SchedulerService:
             # Load existing jobs from database
             await self.load_jobs_from_database()
             
+            # Every worker schedules jobs, but only the elected leader runs them
+            await leader_election.start()
+            
+            # Per-feed adaptive scheduling; the cron jobs become a catch-up sweep
+            if settings.RSS_ADAPTIVE_SCHEDULING:
+                feed_scheduler.start()
+            
             # Start scheduler
             self.scheduler.start()
             self.running = True
@@ -54,6 +64,8 @@ class SchedulerService:
         """Stop the scheduler."""
         if self.running:
             self.scheduler.shutdown()
+            await feed_scheduler.stop()
+            await leader_election.stop()
             self.running = False
             logger.info("Scheduler service stopped")
 
@@ -143,7 +155,11 @@ class SchedulerService:
             return False
 
     async def execute_rss_fetch_job(self, job_id: int):
-        """Execute RSS fetch job."""
+        """Execute RSS fetch job (on the leader only)."""
+        if not leader_election.is_leader:
+            logger.debug(f"Skipping RSS fetch job {job_id}: {leader_election.instance_id} is not the leader")
+            return
+        
         start_time = datetime.utcnow()
         error_message = None
         
@@ -261,6 +277,9 @@ class SchedulerService:
             jobs = self.scheduler.get_jobs()
             return {
                 "running": self.running,
+                "is_leader": leader_election.is_leader,
+                "feed_scheduler_running": feed_scheduler.running,
+                "instance_id": leader_election.instance_id,
                 "total_jobs": len(jobs),
                 "jobs": [
                     {
@@ -1,9 +1,17 @@
+import hashlib
 import os
-import httpx
-import asyncio
+import re
+import unicodedata
 from typing import Optional
 import logging
 
+from ..core.cache import cache
+from ..core.config import settings
+from ..db.crud_rss import summary_cache
+from ..db.session import async_session_factory
+from .http_clients import http_clients
+from .rate_limiter import get_rate_limiter, send_rate_limited
+
 logging.basicConfig(level=logging.INFO)
 
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY", "<OPENROUTER_API_KEY>")
@@ -13,14 +21,61 @@ OPENROUTER_MODEL = os.getenv("OPENROUTER_MODEL", "google/gemma-3-27b-it:free")
 if not OPENROUTER_API_KEY:
     raise RuntimeError("OPENROUTER_API_KEY environment variable is not set. Please set it to your OpenRouter API key.")
 
+http_clients.register("openrouter", timeout=60.0)
+
+SUMMARY_CACHE_PREFIX = "summary:"
+
+
+def normalize_content(text: str) -> str:
+    """Normalize text so trivially different copies of a story hash the same."""
+    text = unicodedata.normalize("NFKC", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def summary_cache_key(text: str, prompt_template: str, model: str) -> str:
+    """Hash of the normalized content, the prompt template and the model."""
+    digest = hashlib.sha256()
+    for part in (model, prompt_template, normalize_content(text)):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
 
-async def summarize_content(text: str, max_retries: int = 3, wait_seconds: int = 20) -> Optional[str]:
+async def get_cached_summary(content_hash: str) -> Optional[str]:
+    """Look the summary up in Redis, then in the database (refilling Redis on a hit)."""
+    summary = await cache.get(SUMMARY_CACHE_PREFIX + content_hash)
+    if summary:
+        return summary
+    try:
+        async with async_session_factory() as db:
+            summary = await summary_cache.get_summary(db, content_hash)
+    except Exception as e:
+        logging.warning(f"Summary cache lookup failed: {e}")
+        return None
+    if summary:
+        await cache.set(SUMMARY_CACHE_PREFIX + content_hash, summary, expire=settings.SUMMARY_CACHE_TTL)
+    return summary
+
+
+async def store_cached_summary(content_hash: str, model: str, summary: str):
+    """Write a fresh summary to both cache tiers."""
+    await cache.set(SUMMARY_CACHE_PREFIX + content_hash, summary, expire=settings.SUMMARY_CACHE_TTL)
+    try:
+        async with async_session_factory() as db:
+            await summary_cache.store(db, content_hash, model, summary)
+    except Exception as e:
+        logging.warning(f"Failed to store summary in cache: {e}")
+
+
+async def summarize_content(text: str, max_retries: int = 3) -> Optional[str]:
     """
     Summarize the input text using OpenRouter API with retry mechanism.
+    Content seen before (same normalized text, prompt and model) is served from
+    the summary cache without calling the API.
+    Requests share the "openrouter" rate limiter, which also handles 429s and Retry-After.
     Args:
         text (str): The raw text to summarize.
         max_retries (int): Number of retry attempts.
-        wait_seconds (int): Wait time between retries in seconds.
     Returns:
         Optional[str]: The summarized text, or None if failed.
     """
@@ -35,26 +90,37 @@ async def summarize_content(text: str, max_retries: int = 3, wait_seconds: int =
         raise FileNotFoundError(f"Prompt template file not found: {prompt_path}")
     with open(prompt_path, "r", encoding="utf-8") as f:
         prompt_template = f.read()
+
+    content_hash = summary_cache_key(text, prompt_template, OPENROUTER_MODEL)
+    if settings.SUMMARY_CACHE_ENABLED:
+        cached = await get_cached_summary(content_hash)
+        if cached:
+            logging.info(f"Summary cache hit for {content_hash[:12]}")
+            return cached
+
     # Replace the placeholder with the actual text
     prompt = prompt_template.replace("{{content}}", text)
     payload = {
         "model": OPENROUTER_MODEL,
         "messages": [{"role": "user", "content": [{"type": "text", "text": prompt}]}],
     }
-    for attempt in range(1, max_retries + 1):
-        try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(OPENROUTER_API_URL, headers=headers, json=payload)
-                response.raise_for_status()
-                data = response.json()
-                # Extract summary from response
-                choices = data.get("choices", [])
-                if choices and "message" in choices[0]:
-                    summary = choices[0]["message"].get("content")
-                    logging.info(f"Summary obtained: {summary}")
-                    return summary
-        except Exception as e:
-            if attempt == max_retries:
-                return None
-            await asyncio.sleep(wait_seconds)
+    client = http_clients.get("openrouter")
+    try:
+        response = await send_rate_limited(
+            get_rate_limiter("openrouter"),
+            lambda: client.post(OPENROUTER_API_URL, headers=headers, json=payload),
+            max_retries=max_retries,
+        )
+        response.raise_for_status()
+        data = response.json()
+        # Extract summary from response
+        choices = data.get("choices", [])
+        if choices and "message" in choices[0]:
+            summary = choices[0]["message"].get("content")
+            logging.info(f"Summary obtained: {summary}")
+            if summary and settings.SUMMARY_CACHE_ENABLED:
+                await store_cached_summary(content_hash, OPENROUTER_MODEL, summary)
+            return summary
+    except Exception as e:
+        logging.warning(f"OpenRouter summarization failed: {e}")
     return None
@@ -0,0 +1,102 @@
+"""
+Compare the old and new serialization paths of GET /api/v1/rss/articles.
+
+Before: full ORM rows, validated into RssArticleResponse and encoded by
+jsonable_encoder + JSONResponse. After: the listing columns as plain rows,
+rendered by FastJSONResponse. Runs against a throwaway in-memory SQLite
+database, so it measures the application side only:
+
+    python benchmark_article_listing.py [--articles 2000] [--limit 100] [--rounds 200]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.api.v1.endpoints.rss import RssArticleResponse
+from app.core.responses import FastJSONResponse
+from app.db.crud_rss import RssArticleCreate, RssFeedCreate, rss_article, rss_feed
+from app.db.session import Base
+from app.models import user, rss, vision_board, project, user_read_articles  # noqa: F401
+
+adapter = TypeAdapter(List[RssArticleResponse])
+
+
+async def before(db: AsyncSession, limit: int) -> bytes:
+    articles = await rss_article.get_recent_articles(db, limit=limit)
+    body = jsonable_encoder(adapter.validate_python(articles, from_attributes=True))
+    return JSONResponse(body).body
+
+
+async def after(db: AsyncSession, limit: int) -> bytes:
+    rows = await rss_article.get_listing_rows(db, limit=limit)
+    return FastJSONResponse(rows).body
+
+
+async def measure(session_factory, path, limit: int, rounds: int) -> float:
+    """Median milliseconds per request, each on a fresh session like the endpoint."""
+    timings = []
+    for _ in range(rounds):
+        async with session_factory() as db:
+            start = time.perf_counter()
+            await path(db, limit)
+            timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+async def main(articles: int, limit: int, rounds: int):
+    engine = create_async_engine("sqlite+aiosqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    async with session_factory() as db:
+        feed = await rss_feed.create(db, obj_in=RssFeedCreate(name="Feed", url="https://example.com/rss"))
+        await rss_article.bulk_create_if_not_exists(
+            db,
+            [
+                RssArticleCreate(
+                    feed_id=feed.id,
+                    title=f"Article {n}",
+                    link=f"https://example.com/{n}",
+                    description="Lorem ipsum dolor sit amet. " * 10,
+                    content="Lorem ipsum dolor sit amet. " * 40,
+                    published=base + timedelta(minutes=n),
+                    author="Reporter",
+                    category="News",
+                )
+                for n in range(articles)
+            ],
+        )
+
+    async with session_factory() as db:
+        old, new = await before(db, limit), await after(db, limit)
+    if json.loads(old) != json.loads(new):
+        raise SystemExit("The two paths render different listings")
+
+    old_ms = await measure(session_factory, before, limit, rounds)
+    new_ms = await measure(session_factory, after, limit, rounds)
+    print(f"{articles} articles, limit={limit}, median of {rounds} requests, identical JSON")
+    print(f"  before (ORM + pydantic + jsonable_encoder): {old_ms:.2f} ms")
+    print(f"  after  (columns + orjson):                  {new_ms:.2f} ms  ({old_ms / new_ms:.1f}x)")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--articles", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.articles, args.limit, args.rounds))
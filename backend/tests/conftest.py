@@ -1,9 +1,35 @@
 import pytest_asyncio
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 from app.main import app
+from app.db.session import Base
 
 
 @pytest_asyncio.fixture(scope="function")
 async def async_client():
     async with AsyncClient(app=app, base_url="http://test") as ac:
         yield ac
+
+
+@pytest_asyncio.fixture(scope="function")
+async def sqlite_engine():
+    """Throwaway in-memory SQLite database with every table created."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        from app.models import user, rss, vision_board, project, user_read_articles  # noqa: F401
+
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db_session(sqlite_engine):
+    session_factory = async_sessionmaker(bind=sqlite_engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
@@ -0,0 +1,55 @@
+import csv
+import io
+import json
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api.v1.endpoints import rss as rss_endpoints
+from app.db.crud_rss import RssArticleCreate, RssFeedCreate, rss_article, rss_feed
+from app.main import app
+
+
+@pytest_asyncio.fixture
+async def articles(sqlite_engine, monkeypatch):
+    factory = async_sessionmaker(bind=sqlite_engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(rss_endpoints, "async_session_factory", factory)
+    async with factory() as db:
+        feed = await rss_feed.create(db, obj_in=RssFeedCreate(name="Tech", url="https://tech.example/rss"))
+        return await rss_article.bulk_create_if_not_exists(
+            db,
+            [
+                RssArticleCreate(
+                    feed_id=feed.id, title=f'Say "{n}", twice', link=f"https://tech.example/{n}", published=datetime(2024, 1, n + 1)
+                )
+                for n in range(3)
+            ],
+        )
+
+
+@pytest.mark.asyncio
+async def test_export_streams_ndjson(articles):
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.get("/api/v1/rss/articles/export", params={"published_from": "2024-01-02T00:00:00"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == articles[1:]
+    assert rows[0]["title"] == 'Say "1", twice'
+    assert rows[0]["published"] == "2024-01-02T00:00:00"
+
+
+@pytest.mark.asyncio
+async def test_export_streams_csv(articles):
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.get("/api/v1/rss/articles/export", params={"format": "csv"})
+
+    assert response.headers["content-disposition"] == 'attachment; filename="articles.csv"'
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [int(row["id"]) for row in rows] == articles
+    assert rows[2]["title"] == 'Say "2", twice'
+    assert rows[0]["author"] == ""
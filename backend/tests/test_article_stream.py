@@ -0,0 +1,146 @@
+import json
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.cache import cache
+from app.db.crud_rss import RssArticleCreate, RssFeedCreate, rss_article, rss_feed
+from app.services import article_stream as article_stream_module
+from app.services.article_stream import ArticleStream
+
+
+@pytest_asyncio.fixture
+async def session_factory(sqlite_engine, monkeypatch):
+    factory = async_sessionmaker(bind=sqlite_engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(article_stream_module, "async_session_factory", factory)
+    return factory
+
+
+async def add_articles(factory, *numbers):
+    async with factory() as db:
+        feed = await rss_feed.get_by_url(db, "https://tech.example/rss") or await rss_feed.create(
+            db, obj_in=RssFeedCreate(name="Tech", url="https://tech.example/rss")
+        )
+        return await rss_article.bulk_create_if_not_exists(
+            db,
+            [
+                RssArticleCreate(feed_id=feed.id, title=f"Article {n}", link=f"https://tech.example/{n}", description="x" * 500)
+                for n in numbers
+            ],
+        )
+
+
+def parse(event):
+    fields = dict(line.split(": ", 1) for line in event.strip().split("\n"))
+    return fields.get("id"), fields["event"], json.loads(fields["data"])
+
+
+@pytest.mark.asyncio
+async def test_stream_replays_missed_articles_in_publish_order_then_goes_live(session_factory):
+    first, second, third = await add_articles(session_factory, 1, 2, 3)
+    stream = ArticleStream(heartbeat=0.05)
+    # Ingested concurrently: the higher id commits and is published first
+    await stream.publish_articles([third])
+    await stream.publish_articles([first, second])
+    seen_id = stream._backlog[0][0]
+
+    events = stream.events(last_event_id=seen_id)
+    replayed = [parse(await events.__anext__()) for _ in range(2)]
+    assert [article["id"] for _, _, article in replayed] == [first, second]
+    assert replayed[0][2]["title"] == "Article 1"
+    assert len(replayed[0][2]["description"]) == 300
+
+    (fourth,) = await add_articles(session_factory, 4)
+    await stream.publish_articles([fourth])
+    live_id, _, article = parse(await events.__anext__())
+    assert article["id"] == fourth and live_id == stream._backlog[-1][0]
+    assert await events.__anext__() == ": keepalive\n\n"
+
+    await events.aclose()
+    assert stream.client_count == 0
+
+
+@pytest.mark.asyncio
+async def test_clients_that_missed_too_much_are_told_to_reset():
+    stream = ArticleStream(replay_limit=2, heartbeat=0.05)
+    await stream.publish([{"id": n} for n in range(4)])
+    first_id, latest_id = stream._backlog[0][0], stream._backlog[-1][0]
+
+    # Three missed entries against a limit of two, an id no longer retained, and garbage
+    for last_event_id in (first_id, "1-0", "not-an-id"):
+        events = stream.events(last_event_id=last_event_id)
+        assert parse(await events.__anext__()) == (latest_id, "reset", {})
+        assert await events.__anext__() == ": keepalive\n\n"
+        await events.aclose()
+
+    events = stream.events(last_event_id=stream._backlog[1][0])
+    assert [parse(await events.__anext__())[2] for _ in range(2)] == [{"id": 2}, {"id": 3}]
+    await events.aclose()
+
+
+@pytest.mark.asyncio
+async def test_slow_clients_are_disconnected():
+    stream = ArticleStream(queue_size=2)
+    slow = stream.events()
+    assert await slow.__anext__() == ": connected\n\n"
+
+    await stream.publish([{"id": n, "title": f"Article {n}"} for n in range(1, 4)])
+
+    assert stream.client_count == 0
+    assert [event async for event in slow] == []
+
+
+@pytest.mark.asyncio
+async def test_articles_go_through_the_redis_stream(monkeypatch):
+    class FakePipeline:
+        def __init__(self, redis):
+            self.redis = redis
+            self.commands = []
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        def xadd(self, key, fields, maxlen=None, approximate=True):
+            self.commands.append((key, fields))
+            return self
+
+        async def execute(self):
+            for key, fields in self.commands:
+                self.redis.entries.append((f"1700000000000-{len(self.redis.entries)}", fields))
+
+    class FakeRedis:
+        def __init__(self):
+            self.entries = []
+
+        def pipeline(self, transaction=True):
+            return FakePipeline(self)
+
+        async def xrange(self, key, min="-", max="+", count=None):
+            return [entry for entry in self.entries if entry[0] >= min][:count]
+
+        async def xrevrange(self, key, max="+", min="-", count=None):
+            return self.entries[::-1][:count]
+
+    fake = FakeRedis()
+    monkeypatch.setattr(cache, "_client", fake)
+    monkeypatch.setattr(cache, "_is_initialized", True)
+    stream = ArticleStream()
+    events = stream.events()
+    await events.__anext__()
+
+    await stream.publish([{"id": 7}, {"id": 5}])
+    assert [entry_id for entry_id, _ in fake.entries] == ["1700000000000-0", "1700000000000-1"]
+    assert not stream._backlog
+
+    # What this worker's listener hands over
+    stream._dispatch([(entry_id, json.loads(fields["article"])) for entry_id, fields in fake.entries])
+    assert parse(await events.__anext__()) == ("1700000000000-0", "article", {"id": 7})
+    await events.aclose()
+
+    resumed = stream.events(last_event_id="1700000000000-0")
+    assert parse(await resumed.__anext__()) == ("1700000000000-1", "article", {"id": 5})
+    await resumed.aclose()
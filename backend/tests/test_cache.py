@@ -0,0 +1,292 @@
+import asyncio
+import fnmatch
+import json
+import time
+
+import pytest
+
+from app.core import cache as cache_module
+from app.core.cache import LocalCache, cache
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def get(self, key):
+        self.commands.append(lambda: self.redis.store.get(key))
+        return self
+
+    def mget(self, keys):
+        self.commands.append(lambda: [self.redis.store.get(key) for key in keys])
+        return self
+
+    def set(self, key, value, ex=None):
+        def command():
+            self.redis.store[key] = value
+            self.redis.ttls[key] = ex
+            return True
+
+        self.commands.append(command)
+        return self
+
+    def pttl(self, key):
+        self.commands.append(lambda: 60000 if key in self.redis.store else -2)
+        return self
+
+    def smembers(self, key):
+        self.commands.append(lambda: set(self.redis.store.get(key, ())))
+        return self
+
+    def unlink(self, *keys):
+        self.commands.append(lambda: self.redis.remove(keys))
+        return self
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        return [command() for command in self.commands]
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio.Redis for the two-tier cache."""
+
+    def __init__(self):
+        self.store = {}
+        self.published = []
+        self.round_trips = 0
+        self.scans = 0
+        self.ttls = {}
+        self.unlinked = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [self.store.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None, nx=False, px=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def eval(self, script, numkeys, *args):
+        keys, argv = args[:numkeys], args[numkeys:]
+        if script == cache_module.SET_TAGGED_SCRIPT:
+            self.store[keys[0]] = argv[0]
+            for tag_key in keys[1:]:
+                self.store.setdefault(tag_key, set()).add(keys[0])
+            return 1
+        return self.remove(keys) if self.store.get(keys[0]) == argv[0] else 0
+
+    def remove(self, keys):
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    async def delete(self, *keys):
+        return self.remove(keys)
+
+    async def unlink(self, *keys):
+        self.unlinked.append(len(keys))
+        return self.remove(keys)
+
+    async def scan(self, cursor, match=None, count=None):
+        # One key per step, like a sparse keyspace; keys deleted meanwhile are not skipped
+        if cursor == 0:
+            self.scanning = sorted(self.store)
+        self.scans += 1
+        key = self.scanning[cursor]
+        return (cursor + 1) % len(self.scanning), [key] if fnmatch.fnmatchcase(key, match) else []
+
+    async def publish(self, channel, message):
+        self.published.append(json.loads(message))
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(cache, "_client", fake)
+    monkeypatch.setattr(cache, "_is_initialized", True)
+    monkeypatch.setattr(cache, "_local", LocalCache(max_size=100, ttl=30))
+    monkeypatch.setattr(cache, "_instance_id", "this-worker")
+    return fake
+
+
+def test_local_cache_evicts_least_recently_used_and_expired(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now)
+    local = LocalCache(max_size=2, ttl=30)
+
+    local.set("a", 1)
+    local.set("b", 2)
+    local.get("a")
+    local.set("c", 3)
+    assert local.get("b") is cache_module._MISSING
+    assert local.get("a") == 1
+
+    local.set("short", 4, ttl=5)
+    now += 6
+    assert local.get("short") is cache_module._MISSING
+    assert local.get("a") == 1
+    now += 30
+    assert local.get("a") is cache_module._MISSING
+
+
+@pytest.mark.asyncio
+async def test_hot_keys_are_served_from_the_local_tier(redis):
+    redis.store["news"] = json.dumps({"title": "Hello"})
+
+    assert await cache.get("news") == {"title": "Hello"}
+    assert await cache.get("news") == {"title": "Hello"}
+    assert redis.round_trips == 1
+
+
+@pytest.mark.asyncio
+async def test_writes_are_broadcast_and_remote_invalidations_applied(redis):
+    await cache.set("news:1", {"v": 1})
+    await cache.get("news:1")
+    await cache.get("news:2")
+    await cache.delete("news:1")
+    await cache.clear_pattern("news:*")
+
+    assert redis.published == [
+        {"origin": "this-worker", "keys": ["news:1"], "pattern": None},
+        {"origin": "this-worker", "keys": ["news:1"], "pattern": None},
+        {"origin": "this-worker", "keys": [], "pattern": "news:*"},
+    ]
+
+    # Another worker changed the value: our copy is dropped, our own echoes are ignored
+    redis.store["news:1"] = json.dumps({"v": 1})
+    assert await cache.get("news:1") == {"v": 1}
+    redis.store["news:1"] = json.dumps({"v": 2})
+    cache._handle_invalidation(json.dumps({"origin": "this-worker", "keys": ["news:1"], "pattern": None}))
+    assert await cache.get("news:1") == {"v": 1}
+    cache._handle_invalidation(json.dumps({"origin": "other-worker", "keys": [], "pattern": "news:*"}))
+    assert await cache.get("news:1") == {"v": 2}
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_runs_one_loader_for_concurrent_misses(redis):
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"n": calls}
+
+    results = await asyncio.gather(*(cache.get_or_load("page", loader, 60) for _ in range(10)))
+
+    assert results == [{"n": 1}] * 10
+    assert await cache.get_or_load("page", loader, 60) == {"n": 1}
+    assert calls == 1
+    assert "lock:page" not in redis.store
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_waits_for_the_process_holding_the_lock(redis):
+    redis.store["lock:page"] = "other-process"
+
+    async def other_process():
+        await asyncio.sleep(0.1)
+        redis.store["page"] = json.dumps({"value": "theirs", "delta": 0.1, "expires_at": time.time() + 60})
+
+    async def loader():
+        raise AssertionError("the lock holder computes the value")
+
+    _, value = await asyncio.gather(other_process(), cache.get_or_load("page", loader, 60))
+    assert value == "theirs"
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_refreshes_expensive_keys_early(redis, monkeypatch):
+    redis.store["page"] = json.dumps({"value": "old", "delta": 2.0, "expires_at": time.time() + 10})
+
+    async def loader():
+        return "new"
+
+    # -log(0.5) * 2s delta is well short of the 10s left
+    monkeypatch.setattr(cache_module.random, "random", lambda: 0.5)
+    assert await cache.get_or_load("page", loader, 60) == "old"
+
+    # An unlucky draw refreshes; while another process holds the lock the stale value is served
+    monkeypatch.setattr(cache_module.random, "random", lambda: 0.99999)
+    redis.store["lock:page"] = "other-process"
+    assert await cache.get_or_load("page", loader, 60) == "old"
+    del redis.store["lock:page"]
+    assert await cache.get_or_load("page", loader, 60) == "new"
+
+
+@pytest.mark.asyncio
+async def test_clear_pattern_scans_and_unlinks_incrementally(redis):
+    for n in range(5):
+        redis.store[f"news:{n}"] = "x"
+    redis.store["weather"] = "y"
+
+    assert await cache.clear_pattern("news:*") == 5
+    assert list(redis.store) == ["weather"]
+    assert redis.scans == 6
+    assert redis.unlinked == [1] * 5
+
+
+@pytest.mark.asyncio
+async def test_invalidate_tags_drops_only_the_tagged_keys(redis, monkeypatch):
+    monkeypatch.setattr(cache_module.settings, "CACHE_SCAN_COUNT", 2)
+    for n in range(3):
+        await cache.set(f"article:{n}", str(n), tags=["articles", f"feed:{n % 2}"])
+    await cache.set("weather", "sunny", tags=["weather"])
+    await cache.get("article:0")
+    redis.published.clear()
+
+    assert await cache.invalidate_tags("feed:0", "feed:9") == 2
+    assert sorted(key for key in redis.store if not key.startswith("tag:")) == ["article:1", "weather"]
+    assert "tag:feed:0" not in redis.store
+    assert redis.published == [{"origin": "this-worker", "keys": ["article:0", "article:2"], "pattern": None}]
+    assert cache._local.get("article:0") is cache_module._MISSING
+
+    assert await cache.invalidate_tags("articles") == 1
+    assert redis.unlinked == [2, 2, 1]
+    assert [key for key in redis.store if not key.startswith("tag:")] == ["weather"]
+
+
+@pytest.mark.asyncio
+async def test_get_many_reports_partial_hits_in_one_round_trip(redis, monkeypatch):
+    redis.store["article:1"] = json.dumps({"id": 1})
+    redis.store["article:2"] = json.dumps({"id": 2})
+    await cache.get("article:1")
+    redis.round_trips = 0
+
+    hits, misses = await cache.get_many(["article:1", "article:2", "article:3", "article:2"])
+    assert hits == {"article:1": {"id": 1}, "article:2": {"id": 2}}
+    assert misses == ["article:3"]
+    assert redis.round_trips == 1
+
+    # Now both hits come from the local tier
+    assert await cache.get_many(["article:1", "article:2"]) == (hits, [])
+    assert redis.round_trips == 1
+
+    monkeypatch.setattr(cache, "_local", None)
+    assert await cache.get_many(["article:3", "article:1"]) == ({"article:1": {"id": 1}}, ["article:3"])
+    assert redis.round_trips == 2
+
+
+@pytest.mark.asyncio
+async def test_set_many_pipelines_writes_with_per_key_ttls(redis):
+    await cache.set_many({"a": {"n": 1}, "b": "two", "c": 3}, expire={"a": 10, "b": 20})
+
+    assert redis.store == {"a": json.dumps({"n": 1}), "b": "two", "c": 3}
+    assert redis.ttls == {"a": 10, "b": 20, "c": cache_module.settings.REDIS_CACHE_TTL}
+    assert redis.published == [{"origin": "this-worker", "keys": ["a", "b", "c"], "pattern": None}]
+
+    assert await cache.set_many({"a": 1, "b": 2}, expire=60) == 2
+    assert redis.ttls["a"] == redis.ttls["b"] == 60
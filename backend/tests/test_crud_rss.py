@@ -0,0 +1,239 @@
+import pytest
+
+from app.db.crud_rss import RssArticleCreate, RssFeedCreate, article_body, rss_article, rss_feed, user_read_article
+
+
+def make_article(feed_id: int, n: int, guid: str = None) -> RssArticleCreate:
+    return RssArticleCreate(
+        feed_id=feed_id,
+        title=f"Article {n}",
+        link=f"https://example.com/{n}",
+        guid=guid if guid is not None else f"guid-{n}",
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_returns_only_new_ids(db_session):
+    feed = await rss_feed.create(db_session, obj_in=RssFeedCreate(name="Feed", url="https://example.com/rss"))
+
+    first = await rss_article.bulk_create_if_not_exists(db_session, [make_article(feed.id, n) for n in range(3)])
+    second = await rss_article.bulk_create_if_not_exists(db_session, [make_article(feed.id, n) for n in range(4)])
+
+    assert len(first) == 3
+    assert len(second) == 1
+    new_article = await rss_article.get(db_session, second[0])
+    assert new_article.title == "Article 3"
+    assert new_article.is_crawled is False
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_dedupes_by_link_and_empty_guid(db_session):
+    feed = await rss_feed.create(db_session, obj_in=RssFeedCreate(name="Feed", url="https://example.com/rss"))
+
+    ids = await rss_article.bulk_create_if_not_exists(
+        db_session,
+        [
+            make_article(feed.id, 1, guid=""),
+            make_article(feed.id, 2, guid=""),
+            make_article(feed.id, 1, guid="other"),  # same link as the first entry
+        ],
+    )
+
+    assert len(ids) == 2
+
+
+@pytest.mark.asyncio
+async def test_query_articles_filters_before_paging(db_session):
+    from app.models.user_read_articles import UserReadArticle
+
+    tech = await rss_feed.create(db_session, obj_in=RssFeedCreate(name="Tech", url="https://tech.example/rss", category="Tech"))
+    news = await rss_feed.create(db_session, obj_in=RssFeedCreate(name="News", url="https://news.example/rss", category="News"))
+    articles = [
+        RssArticleCreate(feed_id=tech.id, title=f"Python {n}", link=f"https://tech.example/{n}", category="Tech")
+        for n in range(5)
+    ] + [
+        RssArticleCreate(feed_id=news.id, title=f"Election {n}", link=f"https://news.example/{n}", category="News")
+        for n in range(5)
+    ]
+    ids = await rss_article.bulk_create_if_not_exists(db_session, articles)
+    db_session.add_all(
+        UserReadArticle(user_id=1, article_id=article_id)
+        for article_id in ids[:2]
+    )
+    await db_session.commit()
+
+    page, total = await rss_article.query_articles(db_session, skip=0, limit=2, category="tech")
+    assert total == 5
+    assert len(page) == 2
+    assert all(article.feed_id == tech.id for article in page)
+
+    page, total = await rss_article.query_articles(db_session, skip=2, limit=10, category="Tech", exclude_read_by=1)
+    assert total == 3
+    assert len(page) == 1
+
+    page, total = await rss_article.query_articles(db_session, search="ELECTION 3")
+    assert [article.title for article in page] == ["Election 3"]
+    assert total == 1
+
+    page, total = await rss_article.query_articles(db_session, skip=50, limit=10)
+    assert page == []
+    assert total == 10
+
+
+@pytest.mark.asyncio
+async def test_keyset_pages_cover_every_article_once(db_session):
+    from datetime import datetime, timedelta
+
+    from app.db.crud_rss import decode_cursor, encode_cursor
+
+    feed = await rss_feed.create(db_session, obj_in=RssFeedCreate(name="Feed", url="https://example.com/rss"))
+    base = datetime(2026, 1, 1)
+    articles = [make_article(feed.id, n) for n in range(7)]
+    for n, article in enumerate(articles):
+        # Pairs of articles share a timestamp, so ties are broken by id
+        article.published = base + timedelta(hours=n // 2)
+    await rss_article.bulk_create_if_not_exists(db_session, articles)
+
+    seen, after = [], None
+    while True:
+        page = await rss_article.get_by_feed(db_session, feed.id, limit=3, after=after)
+        seen.extend(article.title for article in page)
+        if len(page) < 3:
+            break
+        after = decode_cursor(encode_cursor(page[-1].published, page[-1].id))
+
+    assert seen == [f"Article {n}" for n in (6, 5, 4, 3, 2, 1, 0)]
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_listing_rows_render_like_the_response_model(db_session):
+    from datetime import datetime, timezone
+    from typing import List
+
+    import orjson
+    from pydantic import TypeAdapter
+
+    from app.api.v1.endpoints.rss import RssArticleResponse
+    from app.core.responses import FastJSONResponse
+
+    feed = await rss_feed.create(db_session, obj_in=RssFeedCreate(name="Feed", url="https://example.com/rss"))
+    articles = [make_article(feed.id, n) for n in range(4)]
+    articles[0].published = datetime(2026, 1, 1, 8, 30, 15, 250, tzinfo=timezone.utc)
+    articles[1].description = "Caf\u00e9 \"quoted\""
+    await rss_article.bulk_create_if_not_exists(db_session, articles)
+
+    rows = await rss_article.get_listing_rows(db_session, feed_id=feed.id, limit=3)
+    adapter = TypeAdapter(List[RssArticleResponse])
+    expected = adapter.dump_json(
+        adapter.validate_python(await rss_article.get_by_feed(db_session, feed.id, limit=3), from_attributes=True)
+    )
+
+    assert orjson.loads(FastJSONResponse(rows).body) == orjson.loads(expected)
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_and_tracks_updates(db_session):
+    from app.db.crud_rss import SEARCH_HIGHLIGHT_START, SEARCH_HIGHLIGHT_STOP
+
+    feed = await rss_feed.create(db_session, obj_in=RssFeedCreate(name="Feed", url="https://example.com/rss"))
+    ids = await rss_article.bulk_create_if_not_exists(
+        db_session,
+        [
+            RssArticleCreate(feed_id=feed.id, title="Python releases", link="https://example.com/1", description="Faster runtime"),
+            RssArticleCreate(feed_id=feed.id, title="Cooking tips", link="https://example.com/2", description="Python in passing"),
+            RssArticleCreate(feed_id=feed.id, title="Weather", link="https://example.com/3", description="Rain"),
+        ],
+    )
+
+    rows = await rss_article.search(db_session, "python")
+    assert [row[0].id for row in rows] == ids[:2]  # title matches outrank description matches
+    assert rows[0].title_highlight == f"{SEARCH_HIGHLIGHT_START}Python{SEARCH_HIGHLIGHT_STOP} releases"
+
+    await article_body.store(db_session, ids[2], "Pythons shelter from the rain")
+    assert ids[2] in [row[0].id for row in await rss_article.search(db_session, "python")]
+
+    await rss_article.remove(db_session, id=ids[0])
+    assert ids[0] not in [row[0].id for row in await rss_article.search(db_session, "python")]
+    assert await rss_article.search(db_session, '" "') == []
+
+
+@pytest.mark.asyncio
+async def test_article_body_is_stored_compressed_outside_the_article_row(db_session):
+    from app.models.rss import ArticleBody
+
+    feed = await rss_feed.create(db_session, obj_in=RssFeedCreate(name="Feed", url="https://example.com/rss"))
+    [article_id] = await rss_article.bulk_create_if_not_exists(db_session, [make_article(feed.id, 1)])
+    markdown = "# Heading\n\n" + "Some crawled paragraph. " * 200
+
+    await article_body.store(db_session, article_id, markdown, html=markdown, title="Crawled title")
+
+    article = await rss_article.get(db_session, article_id)
+    assert article.is_crawled is True
+    assert article.crawled_title == "Crawled title"
+    assert await article_body.get_body(db_session, article_id) == (markdown, None)  # identical HTML is not kept
+    stored = await db_session.get(ArticleBody, article_id)
+    assert len(stored.content) < len(markdown) // 10
+
+    await article_body.store(db_session, article_id, "Updated", html="<p>Updated</p>")
+    assert await article_body.get_body(db_session, article_id) == ("Updated", "<p>Updated</p>")
+    assert await article_body.get_body(db_session, article_id + 1) is None
+
+
+@pytest.mark.asyncio
+async def test_mark_read_inserts_a_batch_and_skips_known_reads(db_session):
+    tech = await rss_feed.create(db_session, obj_in=RssFeedCreate(name="Tech", url="https://tech.example/rss", category="Tech"))
+    news = await rss_feed.create(db_session, obj_in=RssFeedCreate(name="News", url="https://news.example/rss"))
+    tech_ids = await rss_article.bulk_create_if_not_exists(db_session, [make_article(tech.id, n) for n in range(3)])
+    news_ids = await rss_article.bulk_create_if_not_exists(
+        db_session, [make_article(news.id, n, guid=f"news-{n}") for n in range(3, 6)]
+    )
+
+    assert await user_read_article.mark_read(db_session, 1, article_ids=[tech_ids[0], 999]) == [tech_ids[0]]
+    assert sorted(await user_read_article.mark_read(db_session, 1, category="tech")) == tech_ids[1:]
+    assert sorted(await user_read_article.mark_read(db_session, 1, feed_id=news.id)) == news_ids
+    assert await user_read_article.mark_read(db_session, 1, feed_id=news.id) == []
+    assert sorted(await user_read_article.mark_read(db_session, 2, article_ids=tech_ids)) == tech_ids
+
+    page, total = await rss_article.query_articles(db_session, exclude_read_by=1)
+    assert page == [] and total == 0
+
+
+def test_mark_read_batch_request_rejects_categories_meaning_all():
+    from pydantic import ValidationError
+
+    from app.schemas.user_read_articles import MarkReadBatchRequest
+
+    assert MarkReadBatchRequest(category="Tech").category == "Tech"
+    for category in ("all", "ALL", " All ", ""):
+        with pytest.raises(ValidationError):
+            MarkReadBatchRequest(category=category)
+
+
+@pytest.mark.asyncio
+async def test_stream_export_yields_filtered_batches(db_session):
+    from datetime import datetime
+
+    tech = await rss_feed.create(db_session, obj_in=RssFeedCreate(name="Tech", url="https://tech.example/rss", category="Tech"))
+    await rss_article.bulk_create_if_not_exists(
+        db_session,
+        [
+            RssArticleCreate(feed_id=tech.id, title=f"Article {n}", link=f"https://tech.example/{n}", published=datetime(2024, 1, n + 1))
+            for n in range(5)
+        ],
+    )
+
+    batches = [batch async for batch in rss_article.stream_export(db_session, category="tech", batch_size=2)]
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [row.title for batch in batches for row in batch] == [f"Article {n}" for n in range(5)]
+
+    rows = [
+        row
+        async for batch in rss_article.stream_export(
+            db_session, feed_id=tech.id, published_from=datetime(2024, 1, 2), published_to=datetime(2024, 1, 4)
+        )
+        for row in batch
+    ]
+    assert [row.title for row in rows] == ["Article 1", "Article 2"]
+    assert [batch async for batch in rss_article.stream_export(db_session, category="news")] == []
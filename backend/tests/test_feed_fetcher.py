@@ -0,0 +1,45 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.feed_fetcher import FeedFetcher
+
+
+@pytest.mark.asyncio
+async def test_per_host_concurrency_is_bounded():
+    in_flight = {"a.example": 0, "b.example": 0}
+    peak = {"a.example": 0, "b.example": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        in_flight[host] += 1
+        peak[host] = max(peak[host], in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return httpx.Response(200, text="ok")
+
+    fetcher = FeedFetcher(max_concurrency=10, per_host_concurrency=2, transport=httpx.MockTransport(handler))
+    urls = [f"https://a.example/feed/{i}" for i in range(8)] + [f"https://b.example/feed/{i}" for i in range(8)]
+    responses = await asyncio.gather(*(fetcher.get(url) for url in urls))
+    await fetcher.close()
+
+    assert all(response.status_code == 200 for response in responses)
+    assert peak == {"a.example": 2, "b.example": 2}
+
+
+@pytest.mark.asyncio
+async def test_retries_retryable_status_codes():
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(503 if calls < 3 else 200, text="ok")
+
+    fetcher = FeedFetcher(max_retries=3, backoff_factor=0, transport=httpx.MockTransport(handler))
+    response = await fetcher.get("https://a.example/feed")
+    await fetcher.close()
+
+    assert response.status_code == 200
+    assert calls == 3
@@ -0,0 +1,111 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.config import settings
+from app.db.crud_rss import RssFeedCreate, rss_feed
+from app.models.rss import RssFeed
+from app.services.rss_service import plan_next_fetch
+
+NOW = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def make_feed(**kwargs) -> RssFeed:
+    defaults = dict(fetch_interval=3600, adaptive_interval=None, last_fetched=NOW - timedelta(hours=1), error_count=0)
+    defaults.update(kwargs)
+    return RssFeed(**defaults)
+
+
+def test_busy_feed_is_polled_more_often():
+    interval, next_fetch_at = plan_next_fetch(make_feed(), new_articles=12, now=NOW)
+    # Observed gap is 5 minutes; halfway between 60 and 5 minutes
+    assert interval == int(0.5 * 3600 + 0.5 * 300)
+    assert abs((next_fetch_at - NOW).total_seconds() - interval) <= 0.1 * interval
+
+
+def test_quiet_feed_backs_off_up_to_max():
+    interval, _ = plan_next_fetch(make_feed(adaptive_interval=settings.RSS_MAX_FETCH_INTERVAL), 0, NOW)
+    assert interval == settings.RSS_MAX_FETCH_INTERVAL
+
+
+def test_interval_never_drops_below_min():
+    interval, _ = plan_next_fetch(make_feed(adaptive_interval=settings.RSS_MIN_FETCH_INTERVAL), 1000, NOW)
+    assert interval == settings.RSS_MIN_FETCH_INTERVAL
+
+
+def test_failures_back_off_without_changing_learned_interval():
+    interval, next_fetch_at = plan_next_fetch(make_feed(adaptive_interval=600, error_count=2), 0, NOW, failed=True)
+    assert interval == 600
+    assert (next_fetch_at - NOW).total_seconds() >= 0.9 * 600 * 8
+
+
+@pytest.mark.asyncio
+async def test_get_feeds_to_fetch_uses_next_fetch_at(db_session):
+    due = await rss_feed.create(db_session, obj_in=RssFeedCreate(name="Due", url="https://a.example/rss"))
+    later = await rss_feed.create(db_session, obj_in=RssFeedCreate(name="Later", url="https://b.example/rss"))
+    await rss_feed.update_fetch_status(db_session, later.id, NOW, schedule=(3600, datetime.utcnow() + timedelta(hours=1)))
+
+    feeds = await rss_feed.get_feeds_to_fetch(db_session)
+
+    assert [feed.id for feed in feeds] == [due.id]
+
+
+@pytest.mark.asyncio
+async def test_reload_during_a_fetch_does_not_schedule_the_feed_twice(sqlite_engine, monkeypatch):
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from app.services import feed_scheduler as feed_scheduler_module
+    from app.services.feed_scheduler import FeedScheduler
+
+    factory = async_sessionmaker(bind=sqlite_engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(feed_scheduler_module, "async_session_factory", factory)
+    async with factory() as db:
+        feed = await rss_feed.create(db, obj_in=RssFeedCreate(name="Feed", url="https://a.example/rss"))
+    scheduler = FeedScheduler()
+    fetches = []
+
+    async def fetch_and_store_feed(fetched):
+        fetches.append(fetched.id)
+        async with factory() as db:
+            await rss_feed.update_fetch_status(db, fetched.id, NOW, schedule=(3600, NOW + timedelta(hours=1)))
+        # A reload lands while the fetch is in flight
+        await scheduler.reload()
+
+    monkeypatch.setattr(feed_scheduler_module.rss_service, "fetch_and_store_feed", fetch_and_store_feed)
+
+    await scheduler.reload()
+    assert scheduler._pop_due(datetime.utcnow()) == [feed.id]
+    scheduler._dispatch(feed.id)
+    await scheduler.reload()
+    await asyncio.gather(*scheduler._dispatched)
+
+    assert scheduler._pop_due(NOW + timedelta(days=1)) == [feed.id]
+    assert scheduler._pop_due(NOW + timedelta(days=1)) == []
+    assert fetches == [feed.id]
+
+
+@pytest.mark.asyncio
+async def test_wake_is_published_to_the_leader(monkeypatch):
+    from app.core.cache import cache
+    from app.services.feed_scheduler import FeedScheduler
+
+    class FakeRedis:
+        def __init__(self):
+            self.published = []
+
+        async def publish(self, channel, message):
+            self.published.append(channel)
+
+    scheduler = FeedScheduler()
+    await scheduler.wake()
+    assert scheduler._reload_requested
+
+    fake = FakeRedis()
+    monkeypatch.setattr(cache, "_client", fake)
+    monkeypatch.setattr(cache, "_is_initialized", True)
+    scheduler = FeedScheduler()
+    await scheduler.wake()
+    assert fake.published == [settings.RSS_SCHEDULER_WAKE_CHANNEL]
+    # This worker hears its own wake through the subscription, like every other worker
+    assert not scheduler._reload_requested
@@ -0,0 +1,36 @@
+import asyncio
+import time
+
+import pytest
+
+from app.services.http_clients import HttpClientRegistry
+
+
+@pytest.mark.asyncio
+async def test_clients_are_shared_until_closed():
+    registry = HttpClientRegistry()
+    registry.register("api", timeout=5.0)
+    registry.start()
+
+    client = registry.get("api")
+    assert registry.get("api") is client
+
+    await registry.close()
+    assert client.is_closed
+    assert registry.get("api") is not client
+    await registry.close()
+
+
+@pytest.mark.asyncio
+async def test_close_waits_for_in_flight_requests():
+    registry = HttpClientRegistry(drain_timeout=5.0)
+    registry.register("api")
+    client = registry.get("api")
+
+    registry._request_started()
+    asyncio.get_running_loop().call_later(0.05, registry._request_finished)
+    started = time.monotonic()
+    await registry.close()
+
+    assert time.monotonic() - started >= 0.05
+    assert client.is_closed
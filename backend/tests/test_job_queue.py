@@ -0,0 +1,181 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.db.session import Base
+from app.db.crud_rss import RssArticleCreate, RssFeedCreate, article_job, rss_article, rss_feed
+from app.models.rss import ArticleJob
+from app.services import job_queue as job_queue_module
+from app.services.job_queue import JobQueue
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path, monkeypatch):
+    """File-backed SQLite so concurrent workers get their own connections."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}", poolclass=NullPool)
+    async with engine.begin() as conn:
+        from app.models import user, rss, vision_board, project, user_read_articles  # noqa: F401
+
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(job_queue_module, "async_session_factory", factory)
+    yield factory
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def db(session_factory):
+    async with session_factory() as session:
+        yield session
+
+
+async def make_articles(db, count: int):
+    feed = await rss_feed.create(db, obj_in=RssFeedCreate(name="Feed", url="https://example.com/rss"))
+    articles = [
+        RssArticleCreate(feed_id=feed.id, title=f"Article {n}", link=f"https://example.com/{n}") for n in range(count)
+    ]
+    return await rss_article.bulk_create_if_not_exists(db, articles)
+
+
+async def wait_for(predicate, timeout: float = 5.0):
+    async def poll():
+        while not await predicate():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+@pytest.mark.asyncio
+async def test_enqueue_is_idempotent_per_article(db, session_factory):
+    article_ids = await make_articles(db, 3)
+    queue = JobQueue()
+
+    assert await queue.enqueue("crawl", article_ids) == 3
+    assert await queue.enqueue("crawl", article_ids) == 0
+    # Each stage has its own job for the same article
+    assert await queue.enqueue("summarize", article_ids[:1]) == 1
+
+    stats = await article_job.get_stats(db)
+    assert stats["crawl"]["pending"] == 3
+    assert stats["summarize"]["pending"] == 1
+
+
+@pytest.mark.asyncio
+async def test_workers_complete_retry_and_dead_letter(db, session_factory):
+    ok_id, flaky_id, broken_id = await make_articles(db, 3)
+    calls = {ok_id: 0, flaky_id: 0, broken_id: 0}
+
+    async def handler(article_id: int):
+        calls[article_id] += 1
+        if article_id == broken_id or (article_id == flaky_id and calls[article_id] == 1):
+            raise RuntimeError("upstream unavailable")
+
+    queue = JobQueue(max_attempts=3, retry_base_delay=0, poll_interval=0.01)
+    queue.register("crawl", handler, concurrency=2)
+    queue.start()
+    try:
+        await queue.enqueue("crawl", [ok_id, flaky_id, broken_id])
+
+        async def settled():
+            async with session_factory() as session:
+                stats = (await article_job.get_stats(session))["crawl"]
+            return stats["done"] == 2 and stats["dead"] == 1
+
+        await wait_for(settled)
+    finally:
+        await queue.stop()
+
+    assert calls == {ok_id: 1, flaky_id: 2, broken_id: 3}
+    async with session_factory() as session:
+        dead = await article_job.get_dead(session)
+        assert [job.article_id for job in dead] == [broken_id]
+        assert "upstream unavailable" in dead[0].last_error
+
+        assert await article_job.requeue_dead(session, kind="crawl") == 1
+        assert (await article_job.get_stats(session))["crawl"]["pending"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_running_jobs_are_returned_to_the_queue(db, session_factory):
+    article_ids = await make_articles(db, 1)
+    await article_job.enqueue(db, "crawl", article_ids)
+
+    claimed = await article_job.claim(db, "crawl", "dead-worker")
+    assert [job.status for job in claimed] == ["running"]
+    assert await article_job.claim(db, "crawl", "other-worker") == []
+
+    assert await article_job.release_stale(db, lock_timeout=-1, max_attempts=2) == (1, 0)
+    reclaimed = await article_job.claim(db, "crawl", "other-worker")
+    assert reclaimed[0].attempts == 2
+
+    # Out of attempts: a job that keeps killing its worker is dead-lettered, not requeued
+    assert await article_job.release_stale(db, lock_timeout=-1, max_attempts=2) == (0, 1)
+    dead = await article_job.get_dead(db)
+    assert [job.status for job in dead] == ["dead"]
+    assert "stopped responding" in dead[0].last_error
+
+
+@pytest.mark.asyncio
+async def test_running_jobs_keep_their_lock_past_the_timeout(db, session_factory):
+    (article_id,) = await make_articles(db, 1)
+    calls = []
+
+    async def handler(article_id: int):
+        calls.append(article_id)
+        # Longer than the lock timeout and the reaper's first pass after claiming
+        await asyncio.sleep(1.5)
+
+    queue = JobQueue(poll_interval=0.01, lock_timeout=0.3)
+    queue.register("crawl", handler, concurrency=2)
+    queue.start()
+    await queue.enqueue("crawl", [article_id])
+
+    async def done():
+        async with session_factory() as session:
+            return (await session.execute(select(ArticleJob.status))).scalar_one() == "done"
+
+    await wait_for(done, timeout=5)
+    await queue.stop()
+    assert calls == [article_id]
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_running_jobs_before_clients_close(db, session_factory):
+    from app.services.http_clients import HttpClientRegistry
+
+    slow_id, stuck_id, queued_id = await make_articles(db, 3)
+    registry = HttpClientRegistry(drain_timeout=5.0)
+    registry.register("api")
+    started = {slow_id: asyncio.Event(), stuck_id: asyncio.Event()}
+    finished = []
+
+    async def handler(article_id: int):
+        # Stands in for a request on a shared client, counted until its body is closed
+        registry._request_started()
+        try:
+            started[article_id].set()
+            await asyncio.sleep(0.2 if article_id == slow_id else 60)
+            finished.append(article_id)
+        finally:
+            registry._request_finished()
+
+    queue = JobQueue(poll_interval=0.01)
+    queue.register("crawl", handler, concurrency=2)
+    queue.start()
+    await queue.enqueue("crawl", [slow_id, stuck_id])
+    await asyncio.gather(*(event.wait() for event in started.values()))
+    await queue.enqueue("crawl", [queued_id])
+
+    await queue.stop(drain_timeout=0.5)
+    assert registry._in_flight == 0
+    await registry.close()
+
+    # The slow request finished, the stuck one was cut off after the grace period
+    assert finished == [slow_id]
+    async with session_factory() as session:
+        jobs = {job.article_id: job.status for job in (await session.execute(select(ArticleJob))).scalars()}
+    assert jobs == {slow_id: "done", stuck_id: "pending", queued_id: "pending"}
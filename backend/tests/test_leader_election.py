@@ -0,0 +1,55 @@
+import pytest
+
+from app.services import leader_election as leader_module
+from app.services.leader_election import LeaderElection
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio.Redis for the lease scripts."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def set(self, key, value, nx=False, px=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def eval(self, script, numkeys, key, owner, *args):
+        if self.store.get(key) != owner:
+            return 0
+        if "pexpire" in script:
+            return 1
+        del self.store[key]
+        return 1
+
+
+class FakeCache:
+    def __init__(self, client):
+        self.client = client
+
+
+@pytest.mark.asyncio
+async def test_only_one_instance_leads_and_failover(monkeypatch):
+    monkeypatch.setattr(leader_module, "cache", FakeCache(FakeRedis()))
+    first = LeaderElection(backend="redis", heartbeat_interval=3600)
+    second = LeaderElection(backend="redis", heartbeat_interval=3600)
+
+    await first.start()
+    await second.start()
+    assert first.is_leader
+    assert not second.is_leader
+
+    # Renewal keeps the lease with the current leader
+    await first._heartbeat()
+    await second._heartbeat()
+    assert first.is_leader
+    assert not second.is_leader
+
+    # When the leader goes away the follower takes over on its next heartbeat
+    await first.stop()
+    await second._heartbeat()
+    assert not first.is_leader
+    assert second.is_leader
+    await second.stop()
@@ -0,0 +1,68 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from app.db.crud_rss import rss_article
+
+
+@pytest.fixture
+def captured_sql(sqlite_engine):
+    """Collect every statement the CRUD layer sends to the database."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(sqlite_engine.sync_engine, "before_cursor_execute", capture)
+    yield statements
+    event.remove(sqlite_engine.sync_engine, "before_cursor_execute", capture)
+
+
+async def query_plan(engine, statement, parameters):
+    async with engine.connect() as conn:
+        result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return [row[-1] for row in result]
+
+
+# (query, filtered, sorts): filtered lookups must SEARCH an index rather than
+# SCAN one, and listings must come out of the index in order without a sort
+# step. The only sort is the category listing's: it matches the article's own
+# category or its feed's, two index ranges merged by a MULTI-INDEX OR.
+QUERIES = {
+    "by_guid": (lambda db: rss_article.get_by_guid(db, "guid-1", 1), True, False),
+    "by_link": (lambda db: rss_article.get_by_link(db, "https://example.com/1", 1), True, False),
+    "by_feed": (lambda db: rss_article.get_by_feed(db, 1, limit=20), True, False),
+    "by_feed_keyset": (
+        lambda db: rss_article.get_by_feed(db, 1, limit=20, after=(datetime(2026, 1, 1), 100)), True, False
+    ),
+    "recent": (lambda db: rss_article.get_recent_articles(db, limit=20), False, False),
+    "recent_keyset": (
+        lambda db: rss_article.get_recent_articles(db, limit=20, after=(datetime(2026, 1, 1), 100)), True, False
+    ),
+    "listing_by_feed": (lambda db: rss_article.get_listing_rows(db, feed_id=1, limit=20), True, False),
+    "listing_keyset": (
+        lambda db: rss_article.get_listing_rows(db, limit=20, after=(datetime(2026, 1, 1), 100)), True, False
+    ),
+    "uncrawled": (lambda db: rss_article.get_uncrawled_articles(db, limit=20), False, False),
+    "category": (lambda db: rss_article.query_articles(db, category="Tech", limit=20), True, True),
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", list(QUERIES))
+async def test_article_queries_use_an_index(db_session, sqlite_engine, captured_sql, name):
+    query, filtered, sorts = QUERIES[name]
+    await query(db_session)
+
+    article_statements = [(sql, params) for sql, params in captured_sql if "FROM rss_articles" in sql]
+    assert article_statements
+    for sql, params in article_statements:
+        plan = await query_plan(sqlite_engine, sql, params)
+        table_steps = [step for step in plan if step.startswith(("SEARCH rss_articles", "SCAN rss_articles"))]
+        assert table_steps, plan
+        for step in table_steps:
+            assert "USING" in step and "INDEX" in step, f"{step} in plan for: {sql}"
+            if filtered:
+                assert step.startswith("SEARCH"), f"{step} in plan for: {sql}"
+        assert any("TEMP B-TREE" in step for step in plan) == sorts, f"{plan} for: {sql}"
@@ -0,0 +1,157 @@
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from app.core.cache import cache
+from app.services.rate_limiter import PAUSE_SCRIPT, TAKE_SCRIPT, TokenBucket, parse_retry_after, send_rate_limited
+
+
+class FakeRedis:
+    """Runs the bucket scripts against hashes, on the monotonic clock."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.calls = 0
+
+    async def eval(self, script, numkeys, *args):
+        self.calls += 1
+        key, argv = args[0], [float(arg) for arg in args[numkeys:]]
+        now = int(time.monotonic() * 1000)
+        state = self.hashes.setdefault(key, {})
+        if script == PAUSE_SCRIPT:
+            paused_until = max(state.get("paused_until", 0), now + argv[0])
+            state.update(tokens=0, updated_at=paused_until, paused_until=paused_until)
+            return int(paused_until - now)
+        assert script == TAKE_SCRIPT
+        rate, capacity = argv
+        if now < state.get("paused_until", 0):
+            return int(state["paused_until"] - now)
+        tokens = min(capacity, state.get("tokens", capacity) + max(now - state.get("updated_at", now), 0) * rate)
+        wait = 0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = -(-(1 - tokens) // rate)
+        state.update(tokens=tokens, updated_at=now)
+        return int(wait)
+
+
+class BrokenRedis:
+    async def eval(self, *args):
+        raise ConnectionError("Redis is down")
+
+
+@pytest.fixture
+def use_redis(monkeypatch):
+    def install(client):
+        monkeypatch.setattr(cache, "_client", client)
+        monkeypatch.setattr(cache, "_is_initialized", True)
+        return client
+
+    return install
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    http_date = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 <= parse_retry_after(http_date) <= 30
+
+
+@pytest.mark.asyncio
+async def test_bucket_allows_burst_then_refills_at_rate():
+    bucket = TokenBucket("test", requests_per_minute=600, burst=3)  # one token per 0.1s
+
+    started = time.monotonic()
+    for _ in range(3):
+        await bucket.acquire()
+    assert time.monotonic() - started < 0.05
+
+    for _ in range(2):
+        await bucket.acquire()
+    assert time.monotonic() - started >= 0.18
+
+
+@pytest.mark.asyncio
+async def test_429_pauses_bucket_for_retry_after():
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0.2"})
+        return httpx.Response(200, text="ok")
+
+    bucket = TokenBucket("test", requests_per_minute=6000, burst=5)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        response = await send_rate_limited(bucket, lambda: client.get("https://api.example/"))
+
+    assert response.status_code == 200
+    assert len(calls) == 2
+    assert calls[1] - calls[0] >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_final_429_still_pauses_the_bucket():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, headers={"Retry-After": "120"})
+
+    bucket = TokenBucket("test", requests_per_minute=6000, burst=5)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        response = await send_rate_limited(bucket, lambda: client.get("https://api.example/"), max_retries=1)
+
+    assert response.status_code == 429
+    assert bucket._paused_until - time.monotonic() > 100
+
+
+@pytest.mark.asyncio
+async def test_5xx_retry_after_is_capped():
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            return httpx.Response(503, headers={"Retry-After": "3600"})
+        return httpx.Response(200, text="ok")
+
+    bucket = TokenBucket("test", requests_per_minute=6000, burst=5)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        response = await send_rate_limited(bucket, lambda: client.get("https://api.example/"), max_delay=0.1)
+
+    assert response.status_code == 200
+    assert 0.1 <= calls[1] - calls[0] < 1
+
+
+@pytest.mark.asyncio
+async def test_processes_share_one_bucket_through_redis(use_redis):
+    redis = use_redis(FakeRedis())
+    # The same provider's bucket in two worker processes
+    first, second = (TokenBucket("test", requests_per_minute=600, burst=3) for _ in range(2))
+
+    started = time.monotonic()
+    for bucket in (first, second, first):
+        await bucket.acquire()
+    assert time.monotonic() - started < 0.05
+
+    # The burst is spent for both, and a 429 seen by one pauses the other
+    await second.acquire()
+    assert time.monotonic() - started >= 0.08
+    await first.pause(0.2)
+    await second.acquire()
+    assert time.monotonic() - started >= 0.28
+    assert redis.calls >= 5
+
+
+@pytest.mark.asyncio
+async def test_bucket_falls_back_to_the_process_when_redis_fails(use_redis):
+    use_redis(BrokenRedis())
+    bucket = TokenBucket("test", requests_per_minute=600, burst=2)
+
+    started = time.monotonic()
+    for _ in range(3):
+        await bucket.acquire()
+    assert 0.08 <= time.monotonic() - started < 0.5
@@ -0,0 +1,151 @@
+import pytest
+
+from app.core.cache import cache
+from app.models.user_read_articles import UserReadArticle
+from app.services.read_state import INSTALL_BUILD_SCRIPT, UPDATE_SCRIPT, read_state
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def sadd(self, key, *members):
+        self.commands.append(lambda: self.redis.sets.setdefault(key, set()).update(members))
+        return self
+
+    def srem(self, key, *members):
+        self.commands.append(lambda: self.redis.sets.get(key, set()).difference_update(members))
+        return self
+
+    def sismember(self, key, member):
+        self.commands.append(lambda: int(member in self.redis.sets.get(key, ())))
+        return self
+
+    def expire(self, key, seconds):
+        self.commands.append(lambda: True)
+        return self
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        return [command() for command in self.commands]
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio.Redis for the read-state sets."""
+
+    def __init__(self):
+        self.sets = {}
+        self.strings = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def get(self, key):
+        return self.strings.get(key)
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.sets.pop(key, None)
+
+    async def eval(self, script, numkeys, *args):
+        keys, argv = args[:numkeys], [str(arg) for arg in args[numkeys:]]
+        if script == UPDATE_SCRIPT:
+            self.strings[keys[1]] = str(int(self.strings.get(keys[1], 0)) + 1)
+            members = self.sets.get(keys[0], set())
+            if "" not in members:
+                self.sets.pop(keys[0], None)
+            elif argv[0] == "SADD":
+                members.update(int(member) for member in argv[2:])
+            else:
+                members.difference_update(int(member) for member in argv[2:])
+            return 1
+        assert script == INSTALL_BUILD_SCRIPT
+        staged = self.sets.pop(keys[2], set())
+        if self.strings.get(keys[1], "") != argv[0]:
+            return 0
+        self.sets[keys[0]] = staged | {""}
+        return 1
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(cache, "_client", fake)
+    monkeypatch.setattr(cache, "_is_initialized", True)
+    return fake
+
+
+async def read(db_session, user_id, *article_ids):
+    db_session.add_all(
+        UserReadArticle(user_id=user_id, article_id=article_id)
+        for article_id in article_ids
+    )
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_flags_build_the_set_once_then_stay_in_redis(redis, db_session):
+    await read(db_session, 1, 1, 2)
+    await read(db_session, 2, 3)
+
+    assert await read_state.flags(db_session, 1, [1, 3, 2]) == {1: True, 3: False, 2: True}
+    assert redis.sets["read:1"] == {"", 1, 2}
+
+    # Later reads reach Redis through mark, not the table
+    await read(db_session, 1, 4)
+    await read_state.mark(1, 4)
+    await read_state.unmark(1, 1)
+    redis.round_trips = 0
+    assert await read_state.flags(db_session, 1, [1, 4]) == {1: False, 4: True}
+    assert redis.round_trips == 1
+
+
+@pytest.mark.asyncio
+async def test_marks_never_fill_an_unbuilt_set(redis, db_session):
+    redis.sets["read:1"] = {7}
+    await read_state.mark(1, 2)
+
+    assert "read:1" not in redis.sets
+    await read(db_session, 1, 1)
+    assert await read_state.flags(db_session, 1, [1, 2]) == {1: True, 2: False}
+    assert redis.sets["read:1"] == {"", 1}
+
+
+@pytest.mark.asyncio
+async def test_build_is_discarded_when_read_state_changes_meanwhile(redis, db_session, monkeypatch):
+    from sqlalchemy import delete
+
+    await read(db_session, 1, 1, 2)
+    execute = db_session.execute
+
+    async def unmark_after_the_select(statement, *args, **kwargs):
+        result = await execute(statement, *args, **kwargs)
+        monkeypatch.setattr(db_session, "execute", execute)
+        # Another request unmarks article 2 before the build is installed
+        await execute(delete(UserReadArticle).where(UserReadArticle.article_id == 2))
+        await db_session.commit()
+        await read_state.unmark(1, 2)
+        return result
+
+    monkeypatch.setattr(db_session, "execute", unmark_after_the_select)
+    # This response reflects the table when it was read, but the set is not built from it
+    assert await read_state.flags(db_session, 1, [1, 2]) == {1: True, 2: True}
+    assert "read:1" not in redis.sets
+
+    assert await read_state.flags(db_session, 1, [1, 2]) == {1: True, 2: False}
+    assert redis.sets["read:1"] == {"", 1}
+
+
+@pytest.mark.asyncio
+async def test_without_redis_flags_come_from_the_table(db_session):
+    await read(db_session, 1, 1)
+
+    assert await read_state.flags(db_session, 1, [1, 2]) == {1: True, 2: False}
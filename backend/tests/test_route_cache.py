@@ -0,0 +1,175 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+
+import pytest
+from fastapi import FastAPI, Response
+from httpx import AsyncClient
+
+from app.core.cache import SET_TAGGED_SCRIPT, cache
+from app.core.responses import FastJSONResponse
+from app.core.route_cache import cached, invalidate_tags, route_cache_key
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def smembers(self, key):
+        self.commands.append(lambda: set(self.redis.store.get(key, ())))
+        return self
+
+    def unlink(self, *keys):
+        self.commands.append(lambda: self.redis.remove(keys))
+        return self
+
+    async def execute(self):
+        return [command() for command in self.commands]
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio.Redis for Cache get/get_or_load/invalidate_tags."""
+
+    def __init__(self):
+        self.store = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def remove(self, keys):
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None, nx=False, px=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def eval(self, script, numkeys, *args):
+        keys, argv = args[:numkeys], args[numkeys:]
+        if script == SET_TAGGED_SCRIPT:
+            self.store[keys[0]] = argv[0]
+            for tag_key in keys[1:]:
+                self.store.setdefault(tag_key, set()).add(keys[0])
+            return 1
+        return self.remove(keys) if self.store.get(keys[0]) == argv[0] else 0
+
+    async def delete(self, *keys):
+        return self.remove(keys)
+
+    async def unlink(self, *keys):
+        return self.remove(keys)
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(cache, "_client", fake)
+    monkeypatch.setattr(cache, "_is_initialized", True)
+    return fake
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def app(calls):
+    app = FastAPI()
+
+    @app.get("/items")
+    @cached("test:items", "items", condition=lambda params: not params["private"])
+    async def items(response: Response, page: int = 0, category: Optional[str] = None, private: bool = False):
+        calls.append((page, category))
+        response.headers["X-Total-Count"] = "42"
+        return [{"page": page, "category": category}]
+
+    @app.get("/items/{item_id}")
+    @cached("test:item", ("items", "item:{item_id}"))
+    async def item(item_id: int):
+        calls.append(item_id)
+        return {"id": item_id}
+
+    @app.get("/rows")
+    @cached("test:rows", "items", response_class=FastJSONResponse)
+    async def rows(response: Response, day: int = 1):
+        calls.append(day)
+        response.headers["X-Total-Count"] = "1"
+        return [{"published": datetime(2026, 1, day, tzinfo=timezone.utc)}]
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_responses_are_cached_by_normalized_params(redis, app, calls):
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        first = await client.get("/items", params={"page": 1, "category": "tech"})
+        second = await client.get("/items?category=tech&page=1")
+        await client.get("/items", params={"page": 2, "category": "tech"})
+        await client.get("/items", params={"page": 1, "category": "tech", "private": True})
+
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert second.headers["x-total-count"] == "42"
+    assert second.json() == first.json() == [{"page": 1, "category": "tech"}]
+    assert calls == [(1, "tech"), (2, "tech"), (1, "tech")]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_tags_only_drops_tagged_entries(redis, app, calls):
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        await client.get("/items")
+        await client.get("/items/1")
+        await client.get("/items/10")
+
+        assert await invalidate_tags("item:1") == 1
+        await client.get("/items")
+        await client.get("/items/1")
+        await client.get("/items/10")
+
+    assert calls == [(0, None), 1, 10, 1]
+    assert redis.store["tag:item:1"] == {route_cache_key("test:item", {"item_id": 1})}
+
+    assert await invalidate_tags("items") == 3
+    assert not [key for key in redis.store if key.startswith("route:")]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_run_the_endpoint_once(redis, app, calls):
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        responses = await asyncio.gather(*(client.get("/items", params={"page": 3}) for _ in range(5)))
+
+    assert calls == [(3, None)]
+    assert sorted(response.headers["x-cache"] for response in responses) == ["HIT"] * 4 + ["MISS"]
+
+
+@pytest.mark.asyncio
+async def test_without_redis_every_call_reaches_the_endpoint(app, calls):
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        await client.get("/items")
+        await client.get("/items")
+
+    assert calls == [(0, None), (0, None)]
+
+
+@pytest.mark.asyncio
+async def test_response_class_renders_rows_and_keeps_headers(redis, app, calls):
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        first = await client.get("/rows")
+        second = await client.get("/rows")
+
+    assert calls == [1]
+    assert [first.headers["x-cache"], second.headers["x-cache"]] == ["MISS", "HIT"]
+    assert second.headers["x-total-count"] == "1"
+    assert second.json() == first.json() == [{"published": "2026-01-01T00:00:00Z"}]
@@ -30,3 +30,104 @@ async def test_get_rss_articles(async_client: AsyncClient):
     response = await async_client.get("/api/v1/rss/articles")
     assert response.status_code == 200
     assert isinstance(response.json(), list)
+
+
+@pytest.mark.asyncio
+async def test_download_feed_sends_conditional_headers():
+    import httpx
+    from app.services.feed_fetcher import FeedFetcher
+    from app.services.rss_service import RssService
+
+    seen = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.update(request.headers)
+        return httpx.Response(304, headers={"ETag": '"v2"'})
+
+    service = RssService()
+    service.fetcher = FeedFetcher(transport=httpx.MockTransport(handler))
+    response = await service.download_feed(
+        "https://example.com/rss", etag='"v1"', last_modified="Wed, 21 Oct 2015 07:28:00 GMT"
+    )
+    await service.fetcher.close()
+
+    assert response.status_code == 304
+    assert seen["if-none-match"] == '"v1"'
+    assert seen["if-modified-since"] == "Wed, 21 Oct 2015 07:28:00 GMT"
+
+
+@pytest.mark.asyncio
+async def test_parse_feed_does_not_fetch_article_pages():
+    from app.services.rss_service import RssService
+
+    class NoNetworkFetcher:
+        async def get(self, *args, **kwargs):
+            raise AssertionError("parse_feed must not make HTTP requests")
+
+    document = b"""<?xml version="1.0"?>
+    <rss version="2.0"><channel><title>T</title>
+      <item><title>One</title><link>https://example.com/1</link><guid>1</guid><description>First</description></item>
+      <item><title>Two</title><link>https://example.com/2</link><guid>2</guid><description>Second</description></item>
+    </channel></rss>"""
+
+    service = RssService()
+    service.fetcher = NoNetworkFetcher()
+    articles = await service.parse_feed("https://example.com/rss", document)
+
+    assert [a["title"] for a in articles] == ["One", "Two"]
+    assert articles[0]["content"] == "First"
+
+
+@pytest.mark.asyncio
+async def test_extract_article_stores_the_page_or_falls_back_to_jina(sqlite_engine, monkeypatch):
+    import httpx
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+    from app.db.crud_rss import RssArticleCreate, RssFeedCreate, article_body, rss_article, rss_feed
+    from app.services import rss_service as rss_service_module
+    from app.services.feed_fetcher import FeedFetcher
+    from app.services.rss_service import CRAWL_JOB, SUMMARIZE_JOB, RssService
+
+    factory = async_sessionmaker(bind=sqlite_engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(rss_service_module, "async_session_factory", factory)
+    queued = []
+
+    async def enqueue(kind, article_ids, requeue_dead=False):
+        queued.append((kind, list(article_ids)))
+        return len(article_ids)
+
+    monkeypatch.setattr(rss_service_module.job_queue, "enqueue", enqueue)
+
+    async with factory() as db:
+        feed = await rss_feed.create(db, obj_in=RssFeedCreate(name="Feed", url="https://example.com/rss"))
+        plain, scripted, gone = await rss_article.bulk_create_if_not_exists(
+            db,
+            [
+                RssArticleCreate(feed_id=feed.id, title=name, link=f"https://example.com/{name}")
+                for name in ("plain", "scripted", "gone")
+            ],
+        )
+
+    fetched = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        fetched.append(request.url.path)
+        pages = {
+            "/plain": "<html><body><article>Full story</article></body></html>",
+            "/scripted": "<html><body><script>render()</script></body></html>",
+        }
+        if request.url.path not in pages:
+            return httpx.Response(404)
+        return httpx.Response(200, text=pages[request.url.path])
+
+    service = RssService()
+    service.fetcher = FeedFetcher(transport=httpx.MockTransport(handler))
+    for article_id in (plain, scripted, gone):
+        await service.extract_article(article_id)
+    await service.fetcher.close()
+
+    assert fetched == ["/plain", "/scripted", "/gone"]
+    assert queued == [(SUMMARIZE_JOB, [plain]), (CRAWL_JOB, [scripted]), (CRAWL_JOB, [gone])]
+    async with factory() as db:
+        assert (await article_body.get_body(db, plain))[0] == "Full story"
+        assert (await rss_article.get(db, plain)).content == "Full story"
+        assert await article_body.get_body(db, scripted) is None
@@ -0,0 +1,40 @@
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.services import summarize_service
+from app.services.summarize_service import summarize_content, summary_cache_key
+
+
+@pytest.fixture
+def summary_db(sqlite_engine, monkeypatch):
+    factory = async_sessionmaker(bind=sqlite_engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(summarize_service, "async_session_factory", factory)
+
+
+def test_key_ignores_whitespace_but_not_prompt_or_model():
+    key = summary_cache_key("Breaking  news\n\nfrom the wire ", "Summarize: {{content}}", "model-a")
+
+    assert key == summary_cache_key("Breaking news from the wire", "Summarize: {{content}}", "model-a")
+    assert key != summary_cache_key("Breaking news from the wire", "TL;DR: {{content}}", "model-a")
+    assert key != summary_cache_key("Breaking news from the wire", "Summarize: {{content}}", "model-b")
+
+
+@pytest.mark.asyncio
+async def test_repeated_content_is_summarized_once(summary_db, monkeypatch):
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, json={"choices": [{"message": {"content": "A short summary."}}]})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(summarize_service.http_clients, "get", lambda name: client)
+
+    first = await summarize_content("The same wire story, syndicated everywhere.")
+    second = await summarize_content("The same  wire story,\nsyndicated everywhere.")
+    await client.aclose()
+
+    assert first == second == "A short summary."
+    assert calls == 1
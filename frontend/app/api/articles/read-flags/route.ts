@@ -0,0 +1,39 @@
+import { NextResponse } from "next/server"
+
+const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000'
+
+export async function POST(request: Request) {
+  try {
+    const authHeader = request.headers.get('authorization')
+    if (!authHeader) {
+      return NextResponse.json({ error: 'Authorization header required' }, { status: 401 })
+    }
+
+    const body = await request.json()
+    
+    // Forward request to FastAPI backend
+    const response = await fetch(`${API_BASE_URL}/api/v1/articles/read-flags`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        'Authorization': authHeader
+      },
+      body: JSON.stringify(body)
+    })
+
+    if (!response.ok) {
+      const error = await response.text()
+      return NextResponse.json({ error }, { status: response.status })
+    }
+
+    const data = await response.json()
+    return NextResponse.json(data)
+
+  } catch (error) {
+    console.error('Error fetching read flags:', error)
+    return NextResponse.json(
+      { error: 'Failed to fetch read flags' }, 
+      { status: 500 }
+    )
+  }
+}
\ No newline at end of file
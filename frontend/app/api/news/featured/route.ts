@@ -17,46 +17,32 @@ function extractImageFromDescription(description: string): string {
 
 export async function GET(request: Request) {
   try {
-    // Get authentication header to fetch read articles
+    // Forward authentication so the backend can leave out articles the user has read
     const authHeader = request.headers.get('authorization')
-    let readArticleIds: string[] = []
-    
-    // Fetch read articles if authenticated
-    if (authHeader) {
-      try {
-        const readResponse = await fetch(`${API_BASE_URL}/api/v1/articles/read-articles`, {
-          headers: { 'Authorization': authHeader }
-        })
-        if (readResponse.ok) {
-          readArticleIds = await readResponse.json()
-        }
-      } catch (error) {
-        console.log('Could not fetch read articles for featured:', error)
-      }
-    }
 
-    // Fetch latest articles from backend RSS feeds
-    const response = await fetch(`${API_BASE_URL}/api/v1/rss/items?limit=10`); // Fetch more to account for read articles
+    // Fetch the latest unread article from backend RSS feeds
+    let response = await fetch(`${API_BASE_URL}/api/v1/rss/items?limit=1${authHeader ? '&exclude_read=true' : ''}`, {
+      headers: authHeader ? { 'Authorization': authHeader } : {}
+    });
     
     if (!response.ok) {
       throw new Error('Failed to fetch RSS items');
     }
     
-    const rssItems = await response.json();
+    let rssItems = await response.json();
+
+    if (authHeader && rssItems.length === 0) {
+      // No unread articles, fall back to most recent
+      response = await fetch(`${API_BASE_URL}/api/v1/rss/items?limit=1`);
+      if (!response.ok) {
+        throw new Error('Failed to fetch RSS items');
+      }
+      rssItems = await response.json();
+    }
     
-    // Filter out read articles and select the most recent unread article as featured
+    // Select the most recent unread article as featured
     if (rssItems && rssItems.length > 0) {
-      let unreadItems = rssItems
-      if (authHeader && readArticleIds.length > 0) {
-        unreadItems = rssItems.filter((item: any) => !readArticleIds.includes(String(item.id)))
-      }
-      
-      if (unreadItems.length === 0) {
-        // No unread articles, fall back to most recent
-        unreadItems = rssItems
-      }
-      
-      const latestItem = unreadItems[0]; // Get the most recent unread article
+      const latestItem = rssItems[0]; // Get the most recent unread article
       
       const featuredArticle = {
         id: latestItem.id || "featured-1",
@@ -33,32 +33,20 @@ export async function GET(request: Request) {
   const search = searchParams.get("search")
   const page = Number.parseInt(searchParams.get("page") || "1")
   const limit = Number.parseInt(searchParams.get("limit") || "10")
+  const cursor = searchParams.get("cursor")
 
   try {
-    // Get authentication header to fetch read articles
+    // Forward authentication so the backend can leave out articles the user has read
     const authHeader = request.headers.get('authorization')
-    let readArticleIds: string[] = []
-    
-    // Fetch read articles if authenticated
-    if (authHeader) {
-      try {
-        const readResponse = await fetch(`${API_BASE_URL}/api/v1/articles/read-articles`, {
-          headers: { 'Authorization': authHeader }
-        })
-        if (readResponse.ok) {
-          readArticleIds = await readResponse.json()
-        }
-      } catch (error) {
-        console.log('Could not fetch read articles:', error)
-      }
-    }
 
-    // Build query parameters for backend - fetch more to account for filtering
-    const fetchLimit = limit + readArticleIds.length + 20 // Fetch extra to account for read articles
-    const backendParams = new URLSearchParams({
-      skip: ((page - 1) * limit).toString(),
-      limit: fetchLimit.toString(),
-    });
+    // Filtering happens in the backend before paging, so every page is exact.
+    // Follow-up pages use the backend's keyset cursor, which stays fast at any depth.
+    const backendParams = new URLSearchParams({ limit: limit.toString() });
+    if (cursor) {
+      backendParams.append("cursor", cursor);
+    } else {
+      backendParams.append("skip", ((page - 1) * limit).toString());
+    }
 
     if (category && category !== "all") {
       backendParams.append("category", category);
@@ -68,13 +56,22 @@ export async function GET(request: Request) {
       backendParams.append("search", search);
     }
 
+    if (authHeader) {
+      backendParams.append("exclude_read", "true");
+    }
+
     // Fetch news from backend RSS feeds with pagination
-    const response = await fetch(`${API_BASE_URL}/api/v1/rss/items?${backendParams}`);
+    const response = await fetch(`${API_BASE_URL}/api/v1/rss/items?${backendParams}`, {
+      headers: authHeader ? { 'Authorization': authHeader } : {}
+    });
     if (!response.ok) {
       throw new Error('Failed to fetch RSS items');
     }
     
     const rssItems = await response.json();
+    const totalHeader = response.headers.get('x-total-count')
+    const totalCount = totalHeader ? Number.parseInt(totalHeader) : null
+    const nextCursor = response.headers.get('x-next-cursor')
     
     // Transform RSS items to match frontend news format
     const transformedNews = rssItems.map((item: any) => ({
@@ -92,19 +89,11 @@ export async function GET(request: Request) {
       link: item.link
     }));
 
-    // Filter out read articles if user is authenticated
-    let finalNews = transformedNews
-    if (authHeader && readArticleIds.length > 0) {
-      finalNews = transformedNews.filter(article => !readArticleIds.includes(String(article.id)))
-    }
-    
-    // Take only the requested limit after filtering
-    finalNews = finalNews.slice(0, limit);
-
     return NextResponse.json({
-      articles: finalNews,
-      totalCount: finalNews.length,
-      hasMore: finalNews.length === limit, // If we got full page, assume there might be more
+      articles: transformedNews,
+      totalCount,
+      hasMore: Boolean(nextCursor),
+      nextCursor,
       currentPage: page,
     });
 
@@ -132,6 +121,7 @@ export async function GET(request: Request) {
       articles: mockNews,
       totalCount: mockNews.length,
       hasMore: false,
+      nextCursor: null,
       currentPage: 1,
     });
   }
@@ -18,43 +18,35 @@ interface FeaturedArticle {
   readTime: string
 }
 
+async function fetchReadFlags(articleIds: string[], token: string): Promise<Record<string, boolean>> {
+  const response = await fetch('/api/articles/read-flags', {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+      'Authorization': `Bearer ${token}`
+    },
+    body: JSON.stringify({ article_ids: articleIds })
+  })
+  if (response.ok) {
+    return response.json()
+  }
+  if (response.status === 401) {
+    // Token expired, clear auth data
+    localStorage.removeItem('token')
+    localStorage.removeItem('user')
+  }
+  return {}
+}
+
 export default function HeroSection() {
   const [featuredArticle, setFeaturedArticle] = useState<FeaturedArticle | null>(null)
   const [loading, setLoading] = useState(true)
-  const [readArticles, setReadArticles] = useState<Set<string>>(new Set())
-
-  // Fetch read articles
-  useEffect(() => {
-    const fetchReadArticles = async () => {
-      try {
-        const token = localStorage.getItem('token')
-        const user = localStorage.getItem('user')
-        if (token && user) {
-          const response = await fetch('/api/articles/read-articles', {
-            headers: {
-              'Authorization': `Bearer ${token}`
-            }
-          })
-          if (response.ok) {
-            const readIds = await response.json()
-            setReadArticles(new Set(readIds))
-          } else if (response.status === 401) {
-            // Token expired, clear auth data
-            localStorage.removeItem('token')
-            localStorage.removeItem('user')
-          }
-        }
-      } catch (error) {
-        console.error('Failed to fetch read articles:', error)
-      }
-    }
-    fetchReadArticles()
-  }, [])
 
   const fetchFeaturedArticle = useCallback(async () => {
     try {
       // Add authentication header if available
       const token = localStorage.getItem('token')
+      const user = localStorage.getItem('user')
       const headers: Record<string, string> = {}
       if (token) {
         headers['Authorization'] = `Bearer ${token}`
@@ -62,39 +54,35 @@ export default function HeroSection() {
 
       const response = await fetch("/api/news/featured", { headers })
       const article = await response.json()
-      
-      // If the current featured article is read, fetch a new one
-      if (article && readArticles.has(article.id)) {
-        // Try to get another featured article
-        const newsResponse = await fetch("/api/news?limit=5")
-        const newsData = await newsResponse.json()
-        
-        // Find the first unread article
-        const unreadArticle = newsData.articles.find((a: any) => !readArticles.has(a.id))
-        
-        if (unreadArticle) {
-          setFeaturedArticle({
-            ...unreadArticle,
-            featured: true
-          })
-        } else {
-          setFeaturedArticle(article) // Keep original if no unread articles
-        }
-      } else {
+      if (!article || !token || !user) {
+        setFeaturedArticle(article)
+        return
+      }
+
+      // Only the articles on screen are checked against the user's read state
+      const readFlags = await fetchReadFlags([String(article.id)], token)
+      if (!readFlags[String(article.id)]) {
         setFeaturedArticle(article)
+        return
       }
+
+      // The featured article is read, feature the first unread recent one instead
+      const newsResponse = await fetch("/api/news?limit=5")
+      const newsData = await newsResponse.json()
+      const candidateFlags = await fetchReadFlags(newsData.articles.map((a: any) => String(a.id)), token)
+      const unreadArticle = newsData.articles.find((a: any) => !candidateFlags[String(a.id)])
+
+      setFeaturedArticle(unreadArticle ? { ...unreadArticle, featured: true } : null)
     } catch (error) {
       console.error("Error fetching featured article:", error)
     } finally {
       setLoading(false)
     }
-  }, [readArticles])
+  }, [])
 
   useEffect(() => {
-    if (readArticles.size >= 0) { // Only fetch when readArticles is loaded
-      fetchFeaturedArticle()
-    }
-  }, [fetchFeaturedArticle, readArticles])
+    fetchFeaturedArticle()
+  }, [fetchFeaturedArticle])
 
   if (loading) {
     return (
@@ -106,8 +94,8 @@ export default function HeroSection() {
     )
   }
 
-  // Don't show featured article if it's been read
-  if (!featuredArticle || readArticles.has(featuredArticle.id)) {
+  // Nothing unread to feature
+  if (!featuredArticle) {
     return null
   }
 
@@ -19,8 +19,9 @@ interface Article {
 
 interface NewsResponse {
   articles: Article[]
-  totalCount: number
+  totalCount: number | null
   hasMore: boolean
+  nextCursor: string | null
   currentPage: number
 }
 
@@ -31,49 +32,10 @@ export default function NewsGrid() {
   const [loadingMore, setLoadingMore] = useState(false)
   const [hasMore, setHasMore] = useState(true)
   const [currentPage, setCurrentPage] = useState(1)
-  const [readArticles, setReadArticles] = useState<Set<string>>(new Set())
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
   const observer = useRef<IntersectionObserver>()
 
-  // Fetch read articles on component mount
-  useEffect(() => {
-    const fetchReadArticles = async () => {
-      try {
-        const token = localStorage.getItem('token')
-        const user = localStorage.getItem('user')
-        console.log('Token for read articles:', token ? 'exists' : 'missing')
-        console.log('User for read articles:', user ? 'exists' : 'missing')
-        
-        if (token && user) {
-          const response = await fetch('/api/articles/read-articles', {
-            headers: {
-              'Authorization': `Bearer ${token}`
-            }
-          })
-          console.log('Read articles response status:', response.status)
-          if (response.ok) {
-            const readIds = await response.json()
-            console.log('Read articles:', readIds)
-            setReadArticles(new Set(readIds))
-          } else if (response.status === 401) {
-            // Token expired or invalid, clear auth data
-            console.warn('Authentication failed, clearing tokens')
-            localStorage.removeItem('token')
-            localStorage.removeItem('user')
-            // Don't redirect here as user might not be on a protected page
-          } else {
-            console.error('Failed to fetch read articles:', response.status, await response.text())
-          }
-        } else {
-          console.log('No authentication credentials found, skipping read articles fetch')
-        }
-      } catch (error) {
-        console.error('Failed to fetch read articles:', error)
-      }
-    }
-    fetchReadArticles()
-  }, [])
-
-  const fetchNews = useCallback(async (page = 1, reset = false) => {
+  const fetchNews = useCallback(async (page = 1, reset = false, cursor: string | null = null) => {
     try {
       if (page === 1) setLoading(true)
       else setLoadingMore(true)
@@ -83,6 +45,10 @@ export default function NewsGrid() {
         limit: "6",
       })
 
+      if (cursor) {
+        params.append("cursor", cursor)
+      }
+
       if (selectedCategory && selectedCategory !== "all") {
         params.append("category", selectedCategory)
       }
@@ -108,6 +74,7 @@ export default function NewsGrid() {
       }
 
       setHasMore(data.hasMore)
+      setNextCursor(data.nextCursor)
       setCurrentPage(data.currentPage)
     } catch (error) {
       console.error("Error fetching news:", error)
@@ -122,14 +89,13 @@ export default function NewsGrid() {
     if (observer.current) observer.current.disconnect()
     observer.current = new IntersectionObserver(entries => {
       if (entries[0].isIntersecting && hasMore) {
-        fetchNews(currentPage + 1)
+        fetchNews(currentPage + 1, false, nextCursor)
       }
     })
     if (node) observer.current.observe(node)
-  }, [loadingMore, hasMore, currentPage, fetchNews])
+  }, [loadingMore, hasMore, currentPage, nextCursor, fetchNews])
 
   const handleRemoveArticle = useCallback((articleId: string) => {
-    setReadArticles(prev => new Set([...prev, articleId]))
     setArticles(prev => prev.filter(article => article.id !== articleId))
   }, [])
 